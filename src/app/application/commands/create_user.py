@@ -3,11 +3,6 @@ from dataclasses import dataclass
 from typing import TypedDict
 from uuid import UUID
 
-from app.application.common.ports.flusher import Flusher
-from app.application.common.ports.transaction_manager import (
-    TransactionManager,
-)
-from app.application.common.ports.user_command_gateway import UserCommandGateway
 from app.application.common.services.authorization.authorize import (
     authorize,
 )
@@ -16,9 +11,10 @@ from app.application.common.services.authorization.permissions import (
     RoleManagementContext,
 )
 from app.application.common.services.current_user import CurrentUserService
+from app.application.common.services.user_registration import (
+    UserRegistrationService,
+)
 from app.domain.enums.user_role import UserRole
-from app.domain.exceptions.user import UsernameAlreadyExistsError
-from app.domain.services.user import UserService
 from app.domain.value_objects.raw_password import RawPassword
 from app.domain.value_objects.username import Username
 
@@ -46,16 +42,10 @@ class CreateUserInteractor:
     def __init__(
         self,
         current_user_service: CurrentUserService,
-        user_service: UserService,
-        user_command_gateway: UserCommandGateway,
-        flusher: Flusher,
-        transaction_manager: TransactionManager,
+        user_registration_service: UserRegistrationService,
     ) -> None:
         self._current_user_service = current_user_service
-        self._user_service = user_service
-        self._user_command_gateway = user_command_gateway
-        self._flusher = flusher
-        self._transaction_manager = transaction_manager
+        self._user_registration_service = user_registration_service
 
     async def execute(self, request_data: CreateUserRequest) -> CreateUserResponse:
         """
@@ -66,10 +56,11 @@ class CreateUserInteractor:
         :raises PasswordHasherBusyError:
         :raises RoleAssignmentNotPermittedError:
         :raises UsernameAlreadyExistsError:
+        :raises ConcurrentModificationError:
         """
         log.info("Create user: started. Target username: '%s'.", request_data.username)
 
-        current_user = await self._current_user_service.get_current_user()
+        current_user = await self._current_user_service.get_current_principal()
 
         authorize(
             CanManageRole(),
@@ -81,18 +72,9 @@ class CreateUserInteractor:
 
         username = Username(request_data.username)
         password = RawPassword(request_data.password)
-        user = await self._user_service.create_user(
+        user = await self._user_registration_service.register(
             username, password, request_data.role
         )
 
-        self._user_command_gateway.add(user)
-
-        try:
-            await self._flusher.flush()
-        except UsernameAlreadyExistsError:
-            raise
-
-        await self._transaction_manager.commit()
-
         log.info("Create user: done. Target username: '%s'.", user.username.value)
         return CreateUserResponse(id=user.id_.value)
@@ -0,0 +1,185 @@
+import asyncio
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import ClassVar, Final, TypedDict
+from uuid import UUID
+
+from app.application.commands.create_user import CreateUserRequest
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_counter import UserCounter
+from app.application.common.ports.users_version import UsersVersion
+from app.application.common.services.authorization.authorize import (
+    authorize,
+)
+from app.application.common.services.authorization.permissions import (
+    CanManageRole,
+    RoleManagementContext,
+)
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.entities.user import User
+from app.domain.exceptions.base import DomainTypeError
+from app.domain.services.user import UserService
+from app.domain.value_objects.raw_password import RawPassword
+from app.domain.value_objects.username import Username
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CreateUsersRequest:
+    users: Sequence[CreateUserRequest]
+
+
+class CreateUsersItemStatus(StrEnum):
+    CREATED = "created"
+    INVALID = "invalid"
+    USERNAME_TAKEN = "username_taken"
+
+
+class CreateUsersItemResult(TypedDict):
+    username: str
+    status: CreateUsersItemStatus
+    id: UUID | None
+    error: str | None
+
+
+class CreateUsersResponse(TypedDict):
+    results: list[CreateUsersItemResult]
+
+
+class CreateUsersInteractor:
+    """
+    - Open to admins.
+    - Creates many users, including admins, in one go.
+    - Only super admins can create new admins.
+    - Invalid items and taken usernames are reported per item
+      without failing the others; results follow the request order.
+    """
+
+    # A batch never occupies more hasher threads than this,
+    # so interactive log-ins and sign-ups keep the rest
+    HASH_CONCURRENCY: ClassVar[Final[int]] = 4
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        user_command_gateway: UserCommandGateway,
+        user_service: UserService,
+        transaction_manager: TransactionManager,
+        user_counter: UserCounter,
+        users_version: UsersVersion,
+    ) -> None:
+        self._current_user_service = current_user_service
+        self._user_command_gateway = user_command_gateway
+        self._user_service = user_service
+        self._transaction_manager = transaction_manager
+        self._user_counter = user_counter
+        self._users_version = users_version
+
+    async def execute(self, request_data: CreateUsersRequest) -> CreateUsersResponse:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        :raises PasswordHasherBusyError:
+        :raises RoleAssignmentNotPermittedError:
+        """
+        log.info("Create users: started. Batch size: %d.", len(request_data.users))
+
+        current_user = await self._current_user_service.get_current_principal()
+
+        for role in {item.role for item in request_data.users}:
+            authorize(
+                CanManageRole(),
+                context=RoleManagementContext(
+                    subject=current_user,
+                    target_role=role,
+                ),
+            )
+
+        results: list[CreateUsersItemResult] = [
+            CreateUsersItemResult(
+                username=item.username,
+                status=CreateUsersItemStatus.INVALID,
+                id=None,
+                error=None,
+            )
+            for item in request_data.users
+        ]
+        valid: dict[int, tuple[Username, RawPassword]] = {}
+        for index, item in enumerate(request_data.users):
+            try:
+                valid[index] = Username(item.username), RawPassword(item.password)
+            except DomainTypeError as err:
+                results[index]["error"] = str(err)
+
+        taken = await self._user_command_gateway.read_taken_usernames([
+            username for username, _ in valid.values()
+        ])
+        seen: set[Username] = set()
+        for index, (username, _) in list(valid.items()):
+            if username in taken or username in seen:
+                results[index]["status"] = CreateUsersItemStatus.USERNAME_TAKEN
+                del valid[index]
+            seen.add(username)
+
+        # Hashing takes long; no connection is held meanwhile
+        await self._transaction_manager.release_connection()
+        users = await self._create_users(request_data.users, valid)
+
+        created_ids = await self._user_command_gateway.add_many(list(users.values()))
+        await self._transaction_manager.commit()
+        if created_ids:
+            await self._users_version.bump()
+
+        for index, user in users.items():
+            if user.id_ in created_ids:
+                results[index]["status"] = CreateUsersItemStatus.CREATED
+                results[index]["id"] = user.id_.value
+                self._user_counter.record_user_created(
+                    role=user.role,
+                    is_active=user.is_active,
+                )
+            else:
+                # Taken by someone else since it was checked
+                results[index]["status"] = CreateUsersItemStatus.USERNAME_TAKEN
+
+        log.info(
+            "Create users: done. Created: %d of %d.",
+            len(created_ids),
+            len(request_data.users),
+        )
+        return CreateUsersResponse(results=results)
+
+    async def _create_users(
+        self,
+        items: Sequence[CreateUserRequest],
+        valid: dict[int, tuple[Username, RawPassword]],
+    ) -> dict[int, User]:
+        """
+        :raises PasswordHasherBusyError:
+        :raises RoleAssignmentNotPermittedError:
+        """
+        permits = asyncio.Semaphore(self.HASH_CONCURRENCY)
+
+        async def create_user(index: int) -> User:
+            username, password = valid[index]
+            async with permits:
+                return await self._user_service.create_user(
+                    username,
+                    password,
+                    items[index].role,
+                )
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = {
+                    index: task_group.create_task(create_user(index)) for index in valid
+                }
+        except ExceptionGroup as group:
+            # The others are cancelled; the batch fails as a single create would
+            raise group.exceptions[0] from None
+        return {index: task.result() for index, task in tasks.items()}
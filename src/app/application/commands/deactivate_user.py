@@ -1,12 +1,16 @@
 import logging
 from dataclasses import dataclass
+from functools import partial
 from uuid import UUID
 
 from app.application.common.ports.access_revoker import AccessRevoker
+from app.application.common.ports.principal_cache import PrincipalCache
 from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_counter import UserCounter
+from app.application.common.ports.users_version import UsersVersion
 from app.application.common.services.authorization.authorize import (
     authorize,
 )
@@ -16,8 +20,8 @@ from app.application.common.services.authorization.permissions import (
     RoleManagementContext,
     UserManagementContext,
 )
+from app.application.common.services.conflict_retry import ConflictRetryService
 from app.application.common.services.current_user import CurrentUserService
-from app.domain.entities.user import User
 from app.domain.enums.user_role import UserRole
 from app.domain.exceptions.user import (
     UserNotFoundByIdError,
@@ -40,20 +44,30 @@ class DeactivateUserInteractor:
     - Also deletes the user's sessions.
     - Only super admins can deactivate other admins.
     - Super admins cannot be soft-deleted.
+    - The user is changed only if not modified since read;
+      conflicting attempts are retried a few times.
     """
 
     def __init__(
         self,
         current_user_service: CurrentUserService,
+        conflict_retry_service: ConflictRetryService,
         user_command_gateway: UserCommandGateway,
         user_service: UserService,
         transaction_manager: TransactionManager,
+        user_counter: UserCounter,
+        users_version: UsersVersion,
+        principal_cache: PrincipalCache,
         access_revoker: AccessRevoker,
     ) -> None:
         self._current_user_service = current_user_service
+        self._conflict_retry_service = conflict_retry_service
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
         self._transaction_manager = transaction_manager
+        self._user_counter = user_counter
+        self._users_version = users_version
+        self._principal_cache = principal_cache
         self._access_revoker = access_revoker
 
     async def execute(self, request_data: DeactivateUserRequest) -> None:
@@ -63,13 +77,30 @@ class DeactivateUserInteractor:
         :raises AuthorizationError:
         :raises UserNotFoundByIdError:
         :raises ActivationChangeNotPermittedError:
+        :raises ConcurrentModificationError:
         """
         log.info(
             "Deactivate user: started. Target user ID: '%s'.",
             request_data.user_id,
         )
 
-        current_user = await self._current_user_service.get_current_user()
+        user_id = UserId(request_data.user_id)
+        await self._conflict_retry_service.run(partial(self._deactivate, user_id))
+
+        log.info("Deactivate user: done. Target user ID: '%s'.", user_id.value)
+
+    async def _deactivate(self, user_id: UserId) -> None:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        :raises UserNotFoundByIdError:
+        :raises ActivationChangeNotPermittedError:
+        :raises ConcurrentModificationError:
+        """
+        current_user, user = await self._current_user_service.read_with_principal(
+            partial(self._user_command_gateway.read_by_id, user_id),
+        )
 
         authorize(
             CanManageRole(),
@@ -79,11 +110,6 @@ class DeactivateUserInteractor:
             ),
         )
 
-        user_id = UserId(request_data.user_id)
-        user: User | None = await self._user_command_gateway.read_by_id(
-            user_id,
-            for_update=True,
-        )
         if user is None:
             raise UserNotFoundByIdError(user_id)
 
@@ -97,7 +123,11 @@ class DeactivateUserInteractor:
 
         if self._user_service.toggle_user_activation(user, is_active=False):
             await self._transaction_manager.commit()
+            self._principal_cache.invalidate([user.id_])
+            await self._users_version.bump()
+            self._user_counter.record_activation_changed(
+                role=user.role,
+                is_active=False,
+            )
 
         await self._access_revoker.remove_all_user_access(user.id_)
-
-        log.info("Deactivate user: done. Target user ID: '%s'.", user.id_.value)
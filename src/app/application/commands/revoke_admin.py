@@ -1,18 +1,22 @@
 import logging
 from dataclasses import dataclass
+from functools import partial
 from uuid import UUID
 
+from app.application.common.ports.principal_cache import PrincipalCache
 from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_counter import UserCounter
+from app.application.common.ports.users_version import UsersVersion
 from app.application.common.services.authorization.authorize import authorize
 from app.application.common.services.authorization.permissions import (
     CanManageRole,
     RoleManagementContext,
 )
+from app.application.common.services.conflict_retry import ConflictRetryService
 from app.application.common.services.current_user import CurrentUserService
-from app.domain.entities.user import User
 from app.domain.enums.user_role import UserRole
 from app.domain.exceptions.user import (
     UserNotFoundByIdError,
@@ -33,19 +37,29 @@ class RevokeAdminInteractor:
     - Open to super admins.
     - Revokes admin rights from a specified user.
     - Super admin rights cannot be changed
+    - The user is changed only if not modified since read;
+      conflicting attempts are retried a few times.
     """
 
     def __init__(
         self,
         current_user_service: CurrentUserService,
+        conflict_retry_service: ConflictRetryService,
         user_command_gateway: UserCommandGateway,
         user_service: UserService,
         transaction_manager: TransactionManager,
+        user_counter: UserCounter,
+        users_version: UsersVersion,
+        principal_cache: PrincipalCache,
     ) -> None:
         self._current_user_service = current_user_service
+        self._conflict_retry_service = conflict_retry_service
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
         self._transaction_manager = transaction_manager
+        self._user_counter = user_counter
+        self._users_version = users_version
+        self._principal_cache = principal_cache
 
     async def execute(self, request_data: RevokeAdminRequest) -> None:
         """
@@ -54,10 +68,27 @@ class RevokeAdminInteractor:
         :raises AuthorizationError:
         :raises UserNotFoundByIdError:
         :raises RoleChangeNotPermittedError:
+        :raises ConcurrentModificationError:
         """
         log.info("Revoke admin: started. Target user ID: '%s'.", request_data.user_id)
 
-        current_user = await self._current_user_service.get_current_user()
+        user_id = UserId(request_data.user_id)
+        await self._conflict_retry_service.run(partial(self._revoke_admin, user_id))
+
+        log.info("Revoke admin: done. Target user ID: '%s'.", user_id.value)
+
+    async def _revoke_admin(self, user_id: UserId) -> None:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        :raises UserNotFoundByIdError:
+        :raises RoleChangeNotPermittedError:
+        :raises ConcurrentModificationError:
+        """
+        current_user, user = await self._current_user_service.read_with_principal(
+            partial(self._user_command_gateway.read_by_id, user_id),
+        )
 
         authorize(
             CanManageRole(),
@@ -67,15 +98,15 @@ class RevokeAdminInteractor:
             ),
         )
 
-        user_id = UserId(request_data.user_id)
-        user: User | None = await self._user_command_gateway.read_by_id(
-            user_id,
-            for_update=True,
-        )
         if user is None:
             raise UserNotFoundByIdError(user_id)
 
         if self._user_service.toggle_user_admin_role(user, is_admin=False):
             await self._transaction_manager.commit()
-
-        log.info("Revoke admin: done. Target user ID: '%s'.", user.id_.value)
+            self._principal_cache.invalidate([user.id_])
+            await self._users_version.bump()
+            self._user_counter.record_role_changed(
+                old_role=UserRole.ADMIN,
+                new_role=UserRole.USER,
+                is_active=user.is_active,
+            )
@@ -1,5 +1,6 @@
 import logging
 from dataclasses import dataclass
+from functools import partial
 from uuid import UUID
 
 from app.application.common.ports.transaction_manager import (
@@ -15,6 +16,7 @@ from app.application.common.services.authorization.permissions import (
     RoleManagementContext,
     UserManagementContext,
 )
+from app.application.common.services.conflict_retry import ConflictRetryService
 from app.application.common.services.current_user import CurrentUserService
 from app.domain.entities.user import User
 from app.domain.enums.user_role import UserRole
@@ -24,6 +26,7 @@ from app.domain.exceptions.user import (
 from app.domain.services.user import UserService
 from app.domain.value_objects.raw_password import RawPassword
 from app.domain.value_objects.user_id import UserId
+from app.domain.value_objects.user_password_hash import UserPasswordHash
 
 log = logging.getLogger(__name__)
 
@@ -38,16 +41,21 @@ class SetUserPasswordInteractor:
     """
     - Open to admins.
     - Admins can set passwords of subordinate users.
+    - The password is hashed outside any transaction, and applied only
+      if the user was not modified since read; conflicting attempts
+      are checked and retried a few times without hashing again.
     """
 
     def __init__(
         self,
         current_user_service: CurrentUserService,
+        conflict_retry_service: ConflictRetryService,
         user_command_gateway: UserCommandGateway,
         user_service: UserService,
         transaction_manager: TransactionManager,
     ) -> None:
         self._current_user_service = current_user_service
+        self._conflict_retry_service = conflict_retry_service
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
         self._transaction_manager = transaction_manager
@@ -57,16 +65,39 @@ class SetUserPasswordInteractor:
         :raises AuthenticationError:
         :raises DataMapperError:
         :raises AuthorizationError:
-        :raises DomainTypeError:
         :raises UserNotFoundByIdError:
+        :raises DomainTypeError:
         :raises PasswordHasherBusyError:
+        :raises ConcurrentModificationError:
         """
         log.info(
             "Set user password: started. Target user ID: '%s'.",
             request_data.user_id,
         )
 
-        current_user = await self._current_user_service.get_current_user()
+        user_id = UserId(request_data.user_id)
+        # Referenced till done: the first attempt finds it loaded
+        user = await self._read_target(user_id)
+        password = RawPassword(request_data.password)
+
+        await self._transaction_manager.release_connection()
+        password_hash = await self._user_service.hash_password(password)
+        await self._conflict_retry_service.run(
+            partial(self._set_password_hash, user_id, password_hash),
+        )
+
+        log.info("Set user password: done. Target user ID: '%s'.", user.id_.value)
+
+    async def _read_target(self, user_id: UserId) -> User:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        :raises UserNotFoundByIdError:
+        """
+        current_user, user = await self._current_user_service.read_with_principal(
+            partial(self._user_command_gateway.read_by_id, user_id),
+        )
 
         authorize(
             CanManageRole(),
@@ -76,12 +107,6 @@ class SetUserPasswordInteractor:
             ),
         )
 
-        user_id = UserId(request_data.user_id)
-        password = RawPassword(request_data.password)
-        user: User | None = await self._user_command_gateway.read_by_id(
-            user_id,
-            for_update=True,
-        )
         if user is None:
             raise UserNotFoundByIdError(user_id)
 
@@ -92,8 +117,21 @@ class SetUserPasswordInteractor:
                 target=user,
             ),
         )
+        return user
 
-        await self._user_service.change_password(user, password)
+    async def _set_password_hash(
+        self,
+        user_id: UserId,
+        password_hash: UserPasswordHash,
+    ) -> None:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        :raises UserNotFoundByIdError:
+        :raises ConcurrentModificationError:
+        """
+        # Unless retried, both are still loaded: no queries
+        user = await self._read_target(user_id)
+        self._user_service.set_password_hash(user, password_hash)
         await self._transaction_manager.commit()
-
-        log.info("Set user password: done. Target user ID: '%s'.", user.id_.value)
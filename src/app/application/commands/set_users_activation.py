@@ -0,0 +1,145 @@
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import partial
+from uuid import UUID
+
+from app.application.common.ports.access_revoker import AccessRevoker
+from app.application.common.ports.principal_cache import PrincipalCache
+from app.application.common.ports.transaction_manager import (
+    TransactionManager,
+)
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_counter import UserCounter
+from app.application.common.ports.users_version import UsersVersion
+from app.application.common.services.authorization.authorize import (
+    authorize,
+)
+from app.application.common.services.authorization.permissions import (
+    CanManageRole,
+    RoleManagementContext,
+)
+from app.application.common.services.current_user import CurrentUserService
+from app.application.common.services.user_batch import (
+    UserBatchItemStatus,
+    UserBatchResponse,
+    UserBatchService,
+)
+from app.domain.enums.user_role import UserRole
+from app.domain.services.user import UserService
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class SetUsersActivationRequest:
+    user_ids: Sequence[UUID]
+    is_active: bool
+
+
+class SetUsersActivationInteractor:
+    """
+    - Open to admins.
+    - Activates or deactivates many existing users in one go.
+    - Deactivation also deletes the users' sessions.
+    - Only super admins can change the activation of other admins.
+    - Super admins cannot be deactivated.
+    - Missing and forbidden users are reported per ID
+      without failing the others; results follow the request order.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        user_batch_service: UserBatchService,
+        user_command_gateway: UserCommandGateway,
+        user_service: UserService,
+        transaction_manager: TransactionManager,
+        user_counter: UserCounter,
+        users_version: UsersVersion,
+        principal_cache: PrincipalCache,
+        access_revoker: AccessRevoker,
+    ) -> None:
+        self._current_user_service = current_user_service
+        self._user_batch_service = user_batch_service
+        self._user_command_gateway = user_command_gateway
+        self._user_service = user_service
+        self._transaction_manager = transaction_manager
+        self._user_counter = user_counter
+        self._users_version = users_version
+        self._principal_cache = principal_cache
+        self._access_revoker = access_revoker
+
+    async def execute(
+        self,
+        request_data: SetUsersActivationRequest,
+    ) -> UserBatchResponse:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        """
+        log.info(
+            "Set users activation: started. Batch size: %d, active: %s.",
+            len(request_data.user_ids),
+            request_data.is_active,
+        )
+
+        current_user = await self._current_user_service.get_current_principal()
+
+        authorize(
+            CanManageRole(),
+            context=RoleManagementContext(
+                subject=current_user,
+                target_role=UserRole.USER,
+            ),
+        )
+
+        results, users = await self._user_batch_service.prepare(
+            current_user,
+            request_data.user_ids,
+            partial(
+                self._user_service.is_activation_change_needed,
+                is_active=request_data.is_active,
+            ),
+        )
+        to_change = [
+            user_id
+            for user_id, result in results.items()
+            if result["status"] == UserBatchItemStatus.CHANGED
+        ]
+
+        changed = await self._user_command_gateway.set_activation_many(
+            to_change,
+            is_active=request_data.is_active,
+        )
+        await self._transaction_manager.commit()
+        if changed:
+            self._principal_cache.invalidate(changed)
+            await self._users_version.bump()
+
+        for user_id in to_change:
+            if user_id in changed:
+                self._user_counter.record_activation_changed(
+                    role=users[user_id].role,
+                    is_active=request_data.is_active,
+                )
+            else:
+                results[user_id]["status"] = UserBatchItemStatus.UNCHANGED
+
+        # As for a single user, sessions of users already inactive go too
+        managed = [
+            user_id
+            for user_id, result in results.items()
+            if result["status"]
+            in {UserBatchItemStatus.CHANGED, UserBatchItemStatus.UNCHANGED}
+        ]
+        if not request_data.is_active and managed:
+            await self._access_revoker.remove_all_users_access(managed)
+
+        log.info(
+            "Set users activation: done. Changed: %d of %d.",
+            len(changed),
+            len(results),
+        )
+        return UserBatchResponse(results=list(results.values()))
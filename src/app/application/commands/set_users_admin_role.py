@@ -0,0 +1,129 @@
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import partial
+from uuid import UUID
+
+from app.application.common.ports.principal_cache import PrincipalCache
+from app.application.common.ports.transaction_manager import (
+    TransactionManager,
+)
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_counter import UserCounter
+from app.application.common.ports.users_version import UsersVersion
+from app.application.common.services.authorization.authorize import (
+    authorize,
+)
+from app.application.common.services.authorization.permissions import (
+    CanManageRole,
+    RoleManagementContext,
+)
+from app.application.common.services.current_user import CurrentUserService
+from app.application.common.services.user_batch import (
+    UserBatchItemStatus,
+    UserBatchResponse,
+    UserBatchService,
+)
+from app.domain.enums.user_role import UserRole
+from app.domain.services.user import UserService
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class SetUsersAdminRoleRequest:
+    user_ids: Sequence[UUID]
+    is_admin: bool
+
+
+class SetUsersAdminRoleInteractor:
+    """
+    - Open to super admins.
+    - Grants or revokes admin rights of many existing users in one go.
+    - Super admin rights cannot be changed.
+    - Missing and forbidden users are reported per ID
+      without failing the others; results follow the request order.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        user_batch_service: UserBatchService,
+        user_command_gateway: UserCommandGateway,
+        user_service: UserService,
+        transaction_manager: TransactionManager,
+        user_counter: UserCounter,
+        users_version: UsersVersion,
+        principal_cache: PrincipalCache,
+    ) -> None:
+        self._current_user_service = current_user_service
+        self._user_batch_service = user_batch_service
+        self._user_command_gateway = user_command_gateway
+        self._user_service = user_service
+        self._transaction_manager = transaction_manager
+        self._user_counter = user_counter
+        self._users_version = users_version
+        self._principal_cache = principal_cache
+
+    async def execute(
+        self,
+        request_data: SetUsersAdminRoleRequest,
+    ) -> UserBatchResponse:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        """
+        log.info(
+            "Set users admin role: started. Batch size: %d, admin: %s.",
+            len(request_data.user_ids),
+            request_data.is_admin,
+        )
+
+        current_user = await self._current_user_service.get_current_principal()
+
+        authorize(
+            CanManageRole(),
+            context=RoleManagementContext(
+                subject=current_user,
+                target_role=UserRole.ADMIN,
+            ),
+        )
+
+        results, users = await self._user_batch_service.prepare(
+            current_user,
+            request_data.user_ids,
+            partial(
+                self._user_service.is_admin_role_change_needed,
+                is_admin=request_data.is_admin,
+            ),
+        )
+        to_change = [
+            user_id
+            for user_id, result in results.items()
+            if result["status"] == UserBatchItemStatus.CHANGED
+        ]
+
+        role = UserRole.ADMIN if request_data.is_admin else UserRole.USER
+        changed = await self._user_command_gateway.set_role_many(to_change, role=role)
+        await self._transaction_manager.commit()
+        if changed:
+            self._principal_cache.invalidate(changed)
+            await self._users_version.bump()
+
+        for user_id in to_change:
+            if user_id in changed:
+                self._user_counter.record_role_changed(
+                    old_role=users[user_id].role,
+                    new_role=role,
+                    is_active=users[user_id].is_active,
+                )
+            else:
+                results[user_id]["status"] = UserBatchItemStatus.UNCHANGED
+
+        log.info(
+            "Set users admin role: done. Changed: %d of %d.",
+            len(changed),
+            len(results),
+        )
+        return UserBatchResponse(results=list(results.values()))
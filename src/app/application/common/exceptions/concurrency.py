@@ -0,0 +1,11 @@
+from app.application.common.exceptions.base import ApplicationError
+from app.domain.value_objects.user_id import UserId
+
+
+class ConcurrentModificationError(ApplicationError):
+    def __init__(self, user_id: UserId | None = None) -> None:
+        if user_id is None:
+            message = "Users were modified concurrently. Retry."
+        else:
+            message = f"User with {user_id.value!r} was modified concurrently. Retry."
+        super().__init__(message)
@@ -7,3 +7,11 @@ class PaginationError(ApplicationError):
 
 class SortingError(ApplicationError):
     pass
+
+
+class FilteringError(ApplicationError):
+    pass
+
+
+class FieldSelectionError(ApplicationError):
+    pass
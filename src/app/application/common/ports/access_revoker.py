@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import Protocol
 
 from app.domain.value_objects.user_id import UserId
@@ -8,3 +9,7 @@ class AccessRevoker(Protocol):
     @abstractmethod
     async def remove_all_user_access(self, user_id: UserId) -> None:
         """:raises DataMapperError:"""
+
+    @abstractmethod
+    async def remove_all_users_access(self, user_ids: Sequence[UserId]) -> None:
+        """:raises DataMapperError:"""
@@ -0,0 +1,14 @@
+from abc import abstractmethod
+from collections.abc import Mapping
+from typing import Protocol
+
+
+class MetricsReader(Protocol):
+    """In-process counters of the worker that reads them."""
+
+    @abstractmethod
+    def read(self) -> Mapping[str, object]:
+        """
+        Counters by component, current when read.
+        Counters only: no usernames, addresses or other identifiers.
+        """
@@ -0,0 +1,49 @@
+from abc import abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Protocol, Self
+
+from app.domain.entities.user import User
+from app.domain.enums.user_role import UserRole
+from app.domain.value_objects.user_id import UserId
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Principal:
+    """What authorization needs to know of the current user."""
+
+    id_: UserId
+    role: UserRole
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> Self:
+        return cls(id_=user.id_, role=user.role, is_active=user.is_active)
+
+
+class PrincipalCache(Protocol):
+    """
+    Keeps principals across requests, each for a bounded time.
+    Changes to the role or activation of users invalidate theirs,
+    after the change is committed.
+    """
+
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """Moves forward on each invalidation."""
+
+    @abstractmethod
+    def get(self, user_id: UserId) -> Principal | None:
+        """`None` if missing or too old to be trusted."""
+
+    @abstractmethod
+    def store(self, principal: Principal, *, version: int) -> None:
+        """
+        `version` is that of the cache before `principal` was read.
+        Ignored if anything was invalidated since:
+        the user might have been read before the change.
+        """
+
+    @abstractmethod
+    def invalidate(self, user_ids: Iterable[UserId]) -> None: ...
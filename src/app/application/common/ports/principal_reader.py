@@ -0,0 +1,16 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from app.application.common.ports.principal_cache import Principal
+from app.domain.value_objects.user_id import UserId
+
+
+class PrincipalReader(Protocol):
+    """
+    Reads principals outside the request's unit of work, on a connection
+    of its own, so that it can run alongside the request's other reads.
+    """
+
+    @abstractmethod
+    async def read_by_id(self, user_id: UserId) -> Principal | None:
+        """:raises DataMapperError:"""
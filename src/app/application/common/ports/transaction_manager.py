@@ -5,7 +5,6 @@ from typing import Protocol
 class TransactionManager(Protocol):
     """
     UoW-compatible interface for committing a business transaction.
-    May be extended with rollback support.
     The implementation may be an ORM session, such as SQLAlchemy's.
     """
 
@@ -13,6 +12,28 @@ class TransactionManager(Protocol):
     async def commit(self) -> None:
         """
         :raises DataMapperError:
+        :raises ConcurrentModificationError:
 
         Commit the successful outcome of a business transaction.
+        Changes to loaded users are written only if their rows are
+        unchanged since read; otherwise nothing is committed.
+        """
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """
+        :raises DataMapperError:
+
+        Discard the current transaction, including pending changes
+        to loaded objects, which are read anew when next accessed.
+        """
+
+    @abstractmethod
+    async def release_connection(self) -> None:
+        """
+        :raises DataMapperError:
+
+        End the current read-only transaction and return its connection
+        to the pool before slow work that does not need the database.
+        Loaded objects stay usable; the next query starts a new transaction.
         """
@@ -1,7 +1,10 @@
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import Protocol
 
+from app.application.common.ports.principal_cache import Principal
 from app.domain.entities.user import User
+from app.domain.enums.user_role import UserRole
 from app.domain.value_objects.user_id import UserId
 from app.domain.value_objects.username import Username
 
@@ -11,18 +14,126 @@ class UserCommandGateway(Protocol):
     def add(self, user: User) -> None:
         """:raises DataMapperError:"""
 
+    @abstractmethod
+    async def reserve(self, user: User) -> bool:
+        """
+        :raises DataMapperError:
+
+        Atomically inserts `user` unless its username is taken,
+        in which case nothing is written and `False` is returned.
+        A reservation neither completed nor cancelled expires.
+        Until completed, the user only holds its username: no read
+        returns it and no other update changes it.
+        """
+
+    @abstractmethod
+    async def add_many(self, users: Sequence[User]) -> set[UserId]:
+        """
+        :raises DataMapperError:
+
+        Inserts `users` in one statement, skipping those whose username
+        is taken. Returns the IDs of the inserted ones.
+        """
+
+    @abstractmethod
+    async def complete_reservation(self, user: User) -> bool:
+        """
+        :raises DataMapperError:
+
+        Stores the password hash and activation state of a user reserved
+        through this gateway. Returns `False` if the reservation no longer
+        exists or changed since.
+        """
+
+    @abstractmethod
+    async def cancel_reservation(self, user: User) -> None:
+        """
+        :raises DataMapperError:
+
+        Deletes a `user` reserved through this gateway, freeing its
+        username, unless the reservation was completed.
+        """
+
     @abstractmethod
     async def read_by_id(
         self,
         user_id: UserId,
         for_update: bool = False,
+        with_password_hash: bool = False,
     ) -> User | None:
-        """:raises DataMapperError:"""
+        """
+        :raises DataMapperError:
+
+        The password hash is loaded only `with_password_hash`;
+        reading it from a user loaded without it is an error.
+        """
+
+    @abstractmethod
+    async def read_principal_by_id(self, user_id: UserId) -> Principal | None:
+        """
+        :raises DataMapperError:
+
+        Reads only what authorization needs, without loading the user.
+        """
+
+    @abstractmethod
+    async def read_many_by_ids(
+        self,
+        user_ids: Sequence[UserId],
+        for_update: bool = False,
+    ) -> list[User]:
+        """
+        :raises DataMapperError:
+
+        Reads the existing users among `user_ids` in one query,
+        without their password hashes.
+        Rows are locked in ID order, so concurrent batches don't deadlock.
+        """
 
     @abstractmethod
     async def read_by_username(
         self,
         username: Username,
         for_update: bool = False,
+        with_password_hash: bool = False,
     ) -> User | None:
+        """
+        :raises DataMapperError:
+
+        The password hash is loaded only `with_password_hash`.
+        """
+
+    @abstractmethod
+    async def read_taken_usernames(
+        self,
+        usernames: Sequence[Username],
+    ) -> set[Username]:
         """:raises DataMapperError:"""
+
+    @abstractmethod
+    async def set_activation_many(
+        self,
+        user_ids: Sequence[UserId],
+        *,
+        is_active: bool,
+    ) -> set[UserId]:
+        """
+        :raises DataMapperError:
+
+        Sets the activation state of `user_ids` in one statement.
+        Returns the IDs of the users actually changed.
+        """
+
+    @abstractmethod
+    async def set_role_many(
+        self,
+        user_ids: Sequence[UserId],
+        *,
+        role: UserRole,
+    ) -> set[UserId]:
+        """
+        :raises DataMapperError:
+
+        Sets the role of `user_ids` in one statement.
+        Returns the IDs of the users actually changed.
+        """
@@ -0,0 +1,27 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from app.domain.enums.user_role import UserRole
+
+
+class UserCounter(Protocol):
+    """
+    Keeps cached user counts current between recounts.
+    Called after the change is committed.
+    """
+
+    @abstractmethod
+    def record_user_created(self, *, role: UserRole, is_active: bool) -> None: ...
+
+    @abstractmethod
+    def record_activation_changed(self, *, role: UserRole, is_active: bool) -> None:
+        """`is_active` is the new state."""
+
+    @abstractmethod
+    def record_role_changed(
+        self,
+        *,
+        old_role: UserRole,
+        new_role: UserRole,
+        is_active: bool,
+    ) -> None: ...
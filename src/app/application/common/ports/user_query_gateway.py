@@ -1,8 +1,19 @@
 from abc import abstractmethod
-from typing import Protocol, TypedDict
+from collections.abc import AsyncIterator
+from typing import NotRequired, Protocol, TypedDict
 from uuid import UUID
 
-from app.application.common.query_params.offset_pagination import OffsetPaginationParams
+from app.application.common.query_params.cursor_pagination import (
+    CursorPaginationParams,
+)
+from app.application.common.query_params.field_selection import (
+    FieldSelectionParams,
+)
+from app.application.common.query_params.filtering import UserFilteringParams
+from app.application.common.query_params.offset_pagination import (
+    OffsetPaginationParams,
+    TotalMode,
+)
 from app.application.common.query_params.sorting import SortingParams
 from app.domain.enums.user_role import UserRole
 
@@ -14,9 +25,26 @@ class UserQueryModel(TypedDict):
     is_active: bool
 
 
+class SparseUserQueryModel(TypedDict, total=False):
+    """`UserQueryModel` narrowed to the selected fields, if any."""
+
+    id_: UUID
+    username: str
+    role: UserRole
+    is_active: bool
+
+
 class ListUsersQM(TypedDict):
-    users: list[UserQueryModel]
+    users: list[SparseUserQueryModel]
     total: int
+    total_mode: TotalMode
+    # Only if older than the users version read for the request
+    as_of_users_version: NotRequired[int]
+
+
+class ListUsersCursorQM(TypedDict):
+    users: list[SparseUserQueryModel]
+    next_cursor: str | None
 
 
 class UserQueryGateway(Protocol):
@@ -25,8 +53,49 @@ class UserQueryGateway(Protocol):
         self,
         pagination: OffsetPaginationParams,
         sorting: SortingParams,
+        total_mode: TotalMode = TotalMode.EXACT,
+        filtering: UserFilteringParams | None = None,
+        field_selection: FieldSelectionParams | None = None,
     ) -> ListUsersQM:
         """
         :raises SortingError:
+        :raises FieldSelectionError:
+        :raises ReaderError:
+
+        The returned `total_mode` tells how the total was obtained. It is
+        `EXACT` where a cached or estimated total was not available, and
+        for a cached total when filtering by username, as cached counts
+        are by role and activation only. Totals count the matching users.
+        """
+
+    @abstractmethod
+    async def read_all_by_cursor(
+        self,
+        pagination: CursorPaginationParams,
+        sorting: SortingParams,
+        filtering: UserFilteringParams | None = None,
+        field_selection: FieldSelectionParams | None = None,
+    ) -> ListUsersCursorQM:
+        """
+        :raises PaginationError:
+        :raises SortingError:
+        :raises FieldSelectionError:
         :raises ReaderError:
+
+        Keyset pagination: pages are ordered by one of the supported field
+        tuples (`SORTABLE_FIELDS` of the SQL reader) that the sorting fields
+        start, each ending with a unique field so that the order is total.
+        A page starts right after the position encoded in the cursor,
+        so any page costs the same.
+        """
+
+    @abstractmethod
+    async def stream_all(self, sorting: SortingParams) -> AsyncIterator[UserQueryModel]:
+        """
+        :raises SortingError:
+        :raises ReaderError:
+
+        The query is started before returning; iterating may raise
+        `ReaderError` too. Users are fetched in batches as they are
+        consumed, so memory stays bounded whatever the number of users.
         """
@@ -0,0 +1,23 @@
+from abc import abstractmethod
+from typing import Protocol
+
+
+class UsersVersion(Protocol):
+    """
+    Change token of the users: moved forward after each committed change
+    to listed user data, so an unchanged token means unchanged users.
+    Shared by all processes.
+    """
+
+    @abstractmethod
+    async def read(self) -> int:
+        """:raises DataMapperError:"""
+
+    @abstractmethod
+    async def bump(self) -> None:
+        """
+        :raises DataMapperError:
+
+        Called after the change is committed, so the new token is never
+        seen together with the old data.
+        """
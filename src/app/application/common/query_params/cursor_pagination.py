@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from enum import StrEnum
+
+from app.application.common.exceptions.query import PaginationError
+
+
+class PaginationMode(StrEnum):
+    OFFSET = "offset"
+    CURSOR = "cursor"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CursorPaginationParams:
+    """
+    raises PaginationError
+
+    `cursor` is opaque: `None` for the first page, then the `next_cursor`
+    of the previous page.
+    """
+
+    limit: int
+    cursor: str | None = None
+
+    def __post_init__(self) -> None:
+        """:raises PaginationError:"""
+        if self.limit <= 0:
+            raise PaginationError(f"Limit must be greater than 0, got {self.limit}")
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+from app.application.common.exceptions.query import FieldSelectionError
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FieldSelectionParams:
+    """
+    raises FieldSelectionError
+
+    Only the selected fields are read and returned, in their own order.
+    """
+
+    fields: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        """:raises FieldSelectionError:"""
+        if not self.fields:
+            raise FieldSelectionError("At least one field is required")
+        if len(set(self.fields)) != len(self.fields):
+            raise FieldSelectionError(f"Duplicate fields: {self.fields}")
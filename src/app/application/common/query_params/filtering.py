@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import ClassVar, Final
+
+from app.application.common.exceptions.query import FilteringError
+from app.domain.enums.user_role import UserRole
+
+
+class UsernameMatch(StrEnum):
+    PREFIX = "prefix"
+    SUBSTRING = "substring"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserFilteringParams:
+    """
+    raises FilteringError
+
+    Matching is case-sensitive, as usernames are.
+    """
+
+    # Shorter substrings contain no trigram to look up
+    SUBSTRING_MIN_LEN: ClassVar[Final[int]] = 3
+
+    username: str | None = None
+    username_match: UsernameMatch = UsernameMatch.PREFIX
+    role: UserRole | None = None
+    is_active: bool | None = None
+
+    def __post_init__(self) -> None:
+        """:raises FilteringError:"""
+        if self.username is None:
+            return
+        if not self.username:
+            raise FilteringError("Username filter must not be empty")
+        if (
+            self.username_match == UsernameMatch.SUBSTRING
+            and len(self.username) < self.SUBSTRING_MIN_LEN
+        ):
+            raise FilteringError(
+                f"Username substring must be at least "
+                f"{self.SUBSTRING_MIN_LEN} characters, got {self.username!r}"
+            )
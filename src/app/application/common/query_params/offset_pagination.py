@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import StrEnum
 
 from app.application.common.exceptions.query import PaginationError
 
@@ -18,3 +19,15 @@ class OffsetPaginationParams:
             raise PaginationError(f"Limit must be greater than 0, got {self.limit}")
         if self.offset < 0:
             raise PaginationError(f"Offset must be non-negative, got {self.offset}")
+
+
+class TotalMode(StrEnum):
+    """
+    - `EXACT` counts all users along with every page.
+    - `CACHED` is maintained incrementally and recounted once expired.
+    - `ESTIMATED` comes from planner statistics.
+    """
+
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATED = "estimated"
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from enum import StrEnum
 
+from app.application.common.exceptions.query import SortingError
+
 
 class SortingOrder(StrEnum):
     ASC = "ASC"
@@ -9,5 +11,18 @@ class SortingOrder(StrEnum):
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class SortingParams:
-    field: str
+    """
+    raises SortingError
+
+    Ties on a field are ordered by the next one; all fields share `order`.
+    """
+
+    fields: tuple[str, ...]
     order: SortingOrder
+
+    def __post_init__(self) -> None:
+        """:raises SortingError:"""
+        if not self.fields:
+            raise SortingError("At least one sorting field is required")
+        if len(set(self.fields)) != len(self.fields):
+            raise SortingError(f"Duplicate sorting fields: {self.fields}")
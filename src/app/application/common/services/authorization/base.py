@@ -1,5 +1,19 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Protocol
+
+from app.domain.enums.user_role import UserRole
+from app.domain.value_objects.user_id import UserId
+
+
+class Subject(Protocol):
+    """Who asks: a `User`, or the `Principal` of the current one."""
+
+    @property
+    def id_(self) -> UserId: ...
+
+    @property
+    def role(self) -> UserRole: ...
 
 
 @dataclass(frozen=True)
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from app.application.common.services.authorization.base import (
     Permission,
     PermissionContext,
+    Subject,
 )
 from app.application.common.services.authorization.role_hierarchy import (
     SUBORDINATE_ROLES,
@@ -14,13 +15,13 @@ from app.domain.enums.user_role import UserRole
 
 @dataclass(frozen=True, kw_only=True)
 class UserManagementContext(PermissionContext):
-    subject: User
+    subject: Subject
     target: User
 
 
 class CanManageSelf(Permission[UserManagementContext]):
     def is_satisfied_by(self, context: UserManagementContext) -> bool:
-        return context.subject == context.target
+        return context.subject.id_ == context.target.id_
 
 
 class CanManageSubordinate(Permission[UserManagementContext]):
@@ -37,7 +38,7 @@ class CanManageSubordinate(Permission[UserManagementContext]):
 
 @dataclass(frozen=True, kw_only=True)
 class RoleManagementContext(PermissionContext):
-    subject: User
+    subject: Subject
     target_role: UserRole
 
 
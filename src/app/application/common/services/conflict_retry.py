@@ -0,0 +1,54 @@
+import asyncio
+import logging
+import random
+from collections.abc import Callable, Coroutine
+from typing import Any, ClassVar, Final
+
+from app.application.common.exceptions.concurrency import (
+    ConcurrentModificationError,
+)
+from app.application.common.ports.transaction_manager import TransactionManager
+
+log = logging.getLogger(__name__)
+
+
+class ConflictRetryService:
+    """
+    Runs optimistic read-modify-write attempts until one commits
+    without conflict, at most `MAX_ATTEMPTS` times.
+    Retries start from a fresh transaction after a random backoff
+    that doubles with each one, so that contenders spread out.
+    """
+
+    MAX_ATTEMPTS: ClassVar[Final[int]] = 3
+    BACKOFF_BASE_S: ClassVar[Final[float]] = 0.005
+
+    def __init__(self, transaction_manager: TransactionManager) -> None:
+        self._transaction_manager = transaction_manager
+
+    async def run[T](self, attempt: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """
+        :raises DataMapperError:
+        :raises ConcurrentModificationError:
+
+        `attempt` must read what it changes, and check what depends on it,
+        each time: loaded objects are read anew after a conflict.
+        Its other errors are raised at once.
+        """
+        retries = 0
+        while True:
+            try:
+                return await attempt()
+            except ConcurrentModificationError:
+                if retries == self.MAX_ATTEMPTS - 1:
+                    raise
+            await self._transaction_manager.rollback()
+            retries += 1
+            backoff_s = random.random() * self.BACKOFF_BASE_S * 2**retries  # noqa: S311
+            log.debug(
+                "Concurrent modification: retry %d of %d in %.1f ms.",
+                retries,
+                self.MAX_ATTEMPTS - 1,
+                backoff_s * 1000,
+            )
+            await asyncio.sleep(backoff_s)
@@ -1,14 +1,20 @@
+import asyncio
 import logging
+from collections.abc import Callable, Coroutine
+from typing import Any, NoReturn
 
 from app.application.common.exceptions.authorization import AuthorizationError
 from app.application.common.ports.access_revoker import AccessRevoker
 from app.application.common.ports.identity_provider import IdentityProvider
+from app.application.common.ports.principal_cache import Principal, PrincipalCache
+from app.application.common.ports.principal_reader import PrincipalReader
 from app.application.common.ports.user_command_gateway import UserCommandGateway
 from app.application.common.services.constants import (
     AUTHZ_NO_CURRENT_USER,
     AUTHZ_NOT_AUTHORIZED,
 )
 from app.domain.entities.user import User
+from app.domain.value_objects.user_id import UserId
 
 log = logging.getLogger(__name__)
 
@@ -19,25 +25,100 @@ class CurrentUserService:
         identity_provider: IdentityProvider,
         user_command_gateway: UserCommandGateway,
         access_revoker: AccessRevoker,
+        principal_cache: PrincipalCache,
+        principal_reader: PrincipalReader,
     ) -> None:
         self._identity_provider = identity_provider
         self._user_command_gateway = user_command_gateway
         self._access_revoker = access_revoker
+        self._principal_cache = principal_cache
+        self._principal_reader = principal_reader
 
     async def get_current_user(self, for_update: bool = False) -> User:
         """
         :raises AuthenticationError:
         :raises DataMapperError:
         :raises AuthorizationError:
+
+        Always read, with the password hash: for the current user's
+        own credentials.
         """
         current_user_id = await self._identity_provider.get_current_user_id()
         user: User | None = await self._user_command_gateway.read_by_id(
             current_user_id,
             for_update=for_update,
+            with_password_hash=True,
         )
         if user is None or not user.is_active:
-            log.warning("%s ID: %s.", AUTHZ_NO_CURRENT_USER, current_user_id)
-            await self._access_revoker.remove_all_user_access(current_user_id)
-            raise AuthorizationError(AUTHZ_NOT_AUTHORIZED)
-
+            await self._reject(current_user_id)
         return user
+
+    async def get_current_principal(self) -> Principal:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+
+        Served by `PrincipalCache` when it can: enough for authorization.
+        """
+        current_user_id = await self._identity_provider.get_current_user_id()
+        principal = self._principal_cache.get(current_user_id)
+        if principal is not None:
+            return principal
+
+        version = self._principal_cache.version
+        principal = await self._user_command_gateway.read_principal_by_id(
+            current_user_id,
+        )
+        return await self._admit(current_user_id, principal, version)
+
+    async def read_with_principal[T](
+        self,
+        read: Callable[[], Coroutine[Any, Any, T]],
+    ) -> tuple[Principal, T]:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+
+        As `get_current_principal`, with the result of `read`. Unless cached,
+        the principal is read by `PrincipalReader` while `read` runs.
+        `read` starts only once the caller is authenticated, but its
+        result, including locks it takes, predates authorization:
+        nothing may be done with it before authorizing.
+        """
+        current_user_id = await self._identity_provider.get_current_user_id()
+        principal = self._principal_cache.get(current_user_id)
+        if principal is not None:
+            return principal, await read()
+
+        version = self._principal_cache.version
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                principal_task = task_group.create_task(
+                    self._principal_reader.read_by_id(current_user_id)
+                )
+                read_task = task_group.create_task(read())
+        except ExceptionGroup as group:
+            # The other is cancelled; fails as the sequential reads would
+            raise group.exceptions[0] from None
+        principal = await self._admit(current_user_id, principal_task.result(), version)
+        return principal, read_task.result()
+
+    async def _admit(
+        self,
+        current_user_id: UserId,
+        principal: Principal | None,
+        version: int,
+    ) -> Principal:
+        """:raises AuthorizationError:"""
+        if principal is None or not principal.is_active:
+            await self._reject(current_user_id)
+        self._principal_cache.store(principal, version=version)
+        return principal
+
+    async def _reject(self, current_user_id: UserId) -> NoReturn:
+        """:raises AuthorizationError:"""
+        log.warning("%s ID: %s.", AUTHZ_NO_CURRENT_USER, current_user_id)
+        await self._access_revoker.remove_all_user_access(current_user_id)
+        raise AuthorizationError(AUTHZ_NOT_AUTHORIZED)
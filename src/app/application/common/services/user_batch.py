@@ -0,0 +1,106 @@
+import logging
+from collections.abc import Callable, Sequence
+from enum import StrEnum
+from typing import TypedDict
+from uuid import UUID
+
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.services.authorization.authorize import (
+    authorize,
+)
+from app.application.common.services.authorization.base import Subject
+from app.application.common.services.authorization.permissions import (
+    CanManageSubordinate,
+    UserManagementContext,
+)
+from app.domain.entities.user import User
+from app.domain.exceptions.base import DomainError
+from app.domain.exceptions.user import UserNotFoundByIdError
+from app.domain.value_objects.user_id import UserId
+
+log = logging.getLogger(__name__)
+
+
+class UserBatchItemStatus(StrEnum):
+    CHANGED = "changed"
+    UNCHANGED = "unchanged"
+    NOT_FOUND = "not_found"
+    FORBIDDEN = "forbidden"
+
+
+class UserBatchItemResult(TypedDict):
+    id: UUID
+    status: UserBatchItemStatus
+    error: str | None
+
+
+class UserBatchResponse(TypedDict):
+    results: list[UserBatchItemResult]
+
+
+class UserBatchService:
+    """
+    Prepares changes of many existing users, to be written in one statement:
+    1. the targets are read and locked in one query,
+    2. each is checked against `CanManageSubordinate` and the domain rules,
+    3. the caller writes the change for the remaining ones at once.
+    Each requested ID gets its own result, so a missing or forbidden
+    target doesn't fail the others.
+    """
+
+    def __init__(self, user_command_gateway: UserCommandGateway) -> None:
+        self._user_command_gateway = user_command_gateway
+
+    async def prepare(
+        self,
+        subject: Subject,
+        user_ids: Sequence[UUID],
+        is_change_needed: Callable[[User], bool],
+    ) -> tuple[dict[UserId, UserBatchItemResult], dict[UserId, User]]:
+        """
+        :raises DataMapperError:
+
+        Returns the results, in request order without duplicates,
+        and the users found. Targets that need the change are marked
+        `CHANGED` and stay locked until commit.
+        `is_change_needed` may raise `DomainError` to forbid a target.
+        """
+        results = {
+            user_id: UserBatchItemResult(
+                id=user_id.value,
+                status=UserBatchItemStatus.NOT_FOUND,
+                error=str(UserNotFoundByIdError(user_id)),
+            )
+            for user_id in map(UserId, user_ids)
+        }
+        users = await self._user_command_gateway.read_many_by_ids(
+            list(results),
+            for_update=True,
+        )
+
+        for user in users:
+            result = results[user.id_]
+            result["error"] = None
+            try:
+                authorize(
+                    CanManageSubordinate(),
+                    context=UserManagementContext(subject=subject, target=user),
+                )
+                is_needed = is_change_needed(user)
+            except (AuthorizationError, DomainError) as err:
+                result["status"] = UserBatchItemStatus.FORBIDDEN
+                result["error"] = str(err)
+                continue
+            result["status"] = (
+                UserBatchItemStatus.CHANGED
+                if is_needed
+                else UserBatchItemStatus.UNCHANGED
+            )
+
+        log.debug(
+            "Prepare user batch: done. Requested: %d, found: %d.",
+            len(results),
+            len(users),
+        )
+        return results, {user.id_: user for user in users}
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+
+from app.application.common.exceptions.concurrency import (
+    ConcurrentModificationError,
+)
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_counter import UserCounter
+from app.application.common.ports.users_version import UsersVersion
+from app.domain.entities.user import User
+from app.domain.enums.user_role import UserRole
+from app.domain.exceptions.user import UsernameAlreadyExistsError
+from app.domain.services.user import UserService
+from app.domain.value_objects.raw_password import RawPassword
+from app.domain.value_objects.username import Username
+
+log = logging.getLogger(__name__)
+
+
+class UserRegistrationService:
+    """
+    Registers users so that a taken username never costs a password hash:
+    1. the username is reserved with a placeholder user and committed,
+    2. the password is hashed with no transaction or connection held,
+    3. the hash is stored and the user activated.
+    If any of it fails or is cancelled after the reservation, the reservation
+    is deleted; reservations left behind otherwise, as by a crash, expire.
+    """
+
+    def __init__(
+        self,
+        user_service: UserService,
+        user_command_gateway: UserCommandGateway,
+        transaction_manager: TransactionManager,
+        user_counter: UserCounter,
+        users_version: UsersVersion,
+    ) -> None:
+        self._user_service = user_service
+        self._user_command_gateway = user_command_gateway
+        self._transaction_manager = transaction_manager
+        self._user_counter = user_counter
+        self._users_version = users_version
+
+    async def register(
+        self,
+        username: Username,
+        raw_password: RawPassword,
+        role: UserRole = UserRole.USER,
+    ) -> User:
+        """
+        :raises RoleAssignmentNotPermittedError:
+        :raises DataMapperError:
+        :raises UsernameAlreadyExistsError:
+        :raises PasswordHasherBusyError:
+        :raises ConcurrentModificationError:
+        """
+        user = self._user_service.create_placeholder_user(username, role)
+        if not await self._user_command_gateway.reserve(user):
+            raise UsernameAlreadyExistsError(username.value)
+        # The placeholder is never read, so the users version is bumped
+        # only once registration ends, keeping the connection released
+        # while hashing
+        await self._transaction_manager.commit()
+
+        try:
+            await self._user_service.complete_user(user, raw_password)
+            if not await self._user_command_gateway.complete_reservation(user):
+                raise ConcurrentModificationError(user.id_)
+            await self._transaction_manager.commit()
+        except BaseException:
+            log.debug("Registration failed, releasing username '%s'.", username.value)
+            try:
+                # Runs to the end even if this task is cancelled
+                await asyncio.shield(self._cancel_reservation(user))
+            except Exception:
+                log.exception(
+                    "Releasing username '%s' failed; it is freed on expiry.",
+                    username.value,
+                )
+            raise
+        await self._users_version.bump()
+        self._user_counter.record_user_created(
+            role=user.role,
+            is_active=user.is_active,
+        )
+        return user
+
+    async def _cancel_reservation(self, user: User) -> None:
+        """:raises DataMapperError:"""
+        await self._transaction_manager.rollback()
+        await self._user_command_gateway.cancel_reservation(user)
+        await self._transaction_manager.commit()
+        await self._users_version.bump()
@@ -0,0 +1,75 @@
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from app.application.common.ports.user_query_gateway import (
+    UserQueryGateway,
+    UserQueryModel,
+)
+from app.application.common.query_params.sorting import SortingOrder, SortingParams
+from app.application.common.services.authorization.authorize import (
+    authorize,
+)
+from app.application.common.services.authorization.permissions import (
+    CanManageRole,
+    RoleManagementContext,
+)
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.enums.user_role import UserRole
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ExportUsersRequest:
+    sorting_fields: tuple[str, ...]
+    sorting_order: SortingOrder
+
+
+class ExportUsersQueryService:
+    """
+    - Open to admins.
+    - Streams all existing users, with the same information and sortings
+      as the list of users, in memory bounded whatever their number.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        user_query_gateway: UserQueryGateway,
+    ) -> None:
+        self._current_user_service = current_user_service
+        self._user_query_gateway = user_query_gateway
+
+    async def execute(
+        self,
+        request_data: ExportUsersRequest,
+    ) -> AsyncIterator[UserQueryModel]:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        :raises SortingError:
+        :raises ReaderError:
+
+        Iterating may raise `ReaderError` too.
+        """
+        log.info("Export users: started.")
+
+        current_user = await self._current_user_service.get_current_principal()
+
+        authorize(
+            CanManageRole(),
+            context=RoleManagementContext(
+                subject=current_user,
+                target_role=UserRole.USER,
+            ),
+        )
+
+        log.debug("Streaming users.")
+        return await self._user_query_gateway.stream_all(
+            SortingParams(
+                fields=request_data.sorting_fields,
+                order=request_data.sorting_order,
+            ),
+        )
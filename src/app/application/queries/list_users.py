@@ -1,11 +1,29 @@
 import logging
 from dataclasses import dataclass
+from typing import TypedDict
 
+from app.application.common.exceptions.query import PaginationError
 from app.application.common.ports.user_query_gateway import (
+    ListUsersCursorQM,
     ListUsersQM,
     UserQueryGateway,
 )
-from app.application.common.query_params.offset_pagination import OffsetPaginationParams
+from app.application.common.ports.users_version import UsersVersion
+from app.application.common.query_params.cursor_pagination import (
+    CursorPaginationParams,
+    PaginationMode,
+)
+from app.application.common.query_params.field_selection import (
+    FieldSelectionParams,
+)
+from app.application.common.query_params.filtering import (
+    UserFilteringParams,
+    UsernameMatch,
+)
+from app.application.common.query_params.offset_pagination import (
+    OffsetPaginationParams,
+    TotalMode,
+)
 from app.application.common.query_params.sorting import SortingOrder, SortingParams
 from app.application.common.services.authorization.authorize import (
     authorize,
@@ -24,36 +42,71 @@ log = logging.getLogger(__name__)
 class ListUsersRequest:
     limit: int
     offset: int
-    sorting_field: str
+    sorting_fields: tuple[str, ...]
     sorting_order: SortingOrder
+    pagination_mode: PaginationMode = PaginationMode.OFFSET
+    cursor: str | None = None
+    total_mode: TotalMode | None = None
+    username: str | None = None
+    username_match: UsernameMatch = UsernameMatch.PREFIX
+    role: UserRole | None = None
+    is_active: bool | None = None
+    fields: tuple[str, ...] | None = None
+    known_users_version: int | None = None
+
+
+class ListUsersResponse(TypedDict):
+    users_version: int
+    page: ListUsersQM | ListUsersCursorQM | None
 
 
 class ListUsersQueryService:
     """
     - Open to admins.
     - Retrieves a paginated list of existing users with relevant information.
+    - Offset pagination returns the total; cursor pagination returns
+      the cursor of the next page and costs the same at any depth.
+    - The total is exact by default; cached or estimated totals spare
+      every page a full count, and the response says which one it got.
+    - Sorts by `id`, `username`, `role,username` or `is_active,username`
+      (or a prefix of them), each backed by an index.
+    - Searches usernames by prefix or by substring of at least 3 characters,
+      both backed by an index; the total then counts the matching users.
+    - Filters by role and by activation; the total, even cached
+      or estimated, then counts the matching users.
+    - Returns only the requested fields of `id`, `username`, `role`
+      and `is_active`, or all of them.
+    - Returns the users version, which changes with any user data listed;
+      given the current one, reads no users and returns no page.
     """
 
     def __init__(
         self,
         current_user_service: CurrentUserService,
         user_query_gateway: UserQueryGateway,
+        users_version: UsersVersion,
     ) -> None:
         self._current_user_service = current_user_service
         self._user_query_gateway = user_query_gateway
+        self._users_version = users_version
 
-    async def execute(self, request_data: ListUsersRequest) -> ListUsersQM:
+    async def execute(
+        self,
+        request_data: ListUsersRequest,
+    ) -> ListUsersResponse:
         """
         :raises AuthenticationError:
         :raises DataMapperError:
         :raises AuthorizationError:
         :raises PaginationError:
         :raises SortingError:
+        :raises FilteringError:
+        :raises FieldSelectionError:
         :raises ReaderError:
         """
         log.info("List users: started.")
 
-        current_user = await self._current_user_service.get_current_user()
+        current_user = await self._current_user_service.get_current_principal()
 
         authorize(
             CanManageRole(),
@@ -63,19 +116,57 @@ class ListUsersQueryService:
             ),
         )
 
+        users_version = await self._users_version.read()
+        if request_data.known_users_version == users_version:
+            log.info("List users: done. Unchanged since version %d.", users_version)
+            return ListUsersResponse(users_version=users_version, page=None)
+
         log.debug("Retrieving list of users.")
-        pagination = OffsetPaginationParams(
-            limit=request_data.limit,
-            offset=request_data.offset,
-        )
         sorting = SortingParams(
-            field=request_data.sorting_field,
+            fields=request_data.sorting_fields,
             order=request_data.sorting_order,
         )
-        response = await self._user_query_gateway.read_all(
-            pagination=pagination,
-            sorting=sorting,
+        filtering = UserFilteringParams(
+            username=request_data.username,
+            username_match=request_data.username_match,
+            role=request_data.role,
+            is_active=request_data.is_active,
+        )
+        field_selection = (
+            FieldSelectionParams(fields=request_data.fields)
+            if request_data.fields is not None
+            else None
         )
+        page: ListUsersQM | ListUsersCursorQM
+        if request_data.pagination_mode == PaginationMode.CURSOR:
+            if request_data.offset:
+                raise PaginationError("Offset can't be used with cursor pagination")
+            if request_data.total_mode is not None:
+                raise PaginationError("Cursor pagination doesn't return a total")
+            page = await self._user_query_gateway.read_all_by_cursor(
+                pagination=CursorPaginationParams(
+                    limit=request_data.limit,
+                    cursor=request_data.cursor,
+                ),
+                sorting=sorting,
+                filtering=filtering,
+                field_selection=field_selection,
+            )
+        else:
+            if request_data.cursor is not None:
+                raise PaginationError("Cursor can't be used with offset pagination")
+            page = await self._user_query_gateway.read_all(
+                pagination=OffsetPaginationParams(
+                    limit=request_data.limit,
+                    offset=request_data.offset,
+                ),
+                sorting=sorting,
+                total_mode=request_data.total_mode or TotalMode.EXACT,
+                filtering=filtering,
+                field_selection=field_selection,
+            )
+            # Not the current one, so clients don't keep the page as current
+            users_version = page.pop("as_of_users_version", users_version)
 
         log.info("List users: done.")
-        return response
+        return ListUsersResponse(users_version=users_version, page=page)
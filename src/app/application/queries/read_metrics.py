@@ -0,0 +1,52 @@
+import logging
+from collections.abc import Mapping
+
+from app.application.common.ports.metrics_reader import MetricsReader
+from app.application.common.services.authorization.authorize import (
+    authorize,
+)
+from app.application.common.services.authorization.permissions import (
+    CanManageRole,
+    RoleManagementContext,
+)
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.enums.user_role import UserRole
+
+log = logging.getLogger(__name__)
+
+
+class ReadMetricsQueryService:
+    """
+    - Open to admins: the counters reveal throttling and cache internals.
+    - Returns in-process counters of the worker that serves the request.
+    - Counters only: no usernames, addresses or other identifiers.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        metrics_reader: MetricsReader,
+    ) -> None:
+        self._current_user_service = current_user_service
+        self._metrics_reader = metrics_reader
+
+    async def execute(self) -> Mapping[str, object]:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        """
+        log.info("Read metrics: started.")
+
+        current_user = await self._current_user_service.get_current_principal()
+
+        authorize(
+            CanManageRole(),
+            context=RoleManagementContext(
+                subject=current_user,
+                target_role=UserRole.USER,
+            ),
+        )
+
+        log.info("Read metrics: done.")
+        return self._metrics_reader.read()
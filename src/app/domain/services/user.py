@@ -8,6 +8,7 @@ from app.domain.exceptions.user import (
 from app.domain.ports.password_hasher import PasswordHasher
 from app.domain.ports.user_id_generator import UserIdGenerator
 from app.domain.value_objects.raw_password import RawPassword
+from app.domain.value_objects.user_password_hash import UserPasswordHash
 from app.domain.value_objects.username import Username
 
 
@@ -44,6 +45,39 @@ class UserService:
             is_active=is_active,
         )
 
+    def create_placeholder_user(
+        self,
+        username: Username,
+        role: UserRole = UserRole.USER,
+    ) -> User:
+        """
+        :raises RoleAssignmentNotPermittedError:
+
+        A user without a password, used to claim the username before
+        the password is hashed. It is inactive and its empty hash
+        matches no password until `complete_user` fills them in.
+        """
+        if not role.is_assignable:
+            raise RoleAssignmentNotPermittedError(role)
+
+        return User(
+            id_=self._user_id_generator.generate(),
+            username=username,
+            password_hash=UserPasswordHash(b""),
+            role=role,
+            is_active=False,
+        )
+
+    async def complete_user(
+        self,
+        user: User,
+        raw_password: RawPassword,
+        is_active: bool = True,
+    ) -> None:
+        """:raises PasswordHasherBusyError:"""
+        user.password_hash = await self._password_hasher.hash(raw_password)
+        user.is_active = is_active
+
     async def is_password_valid(self, user: User, raw_password: RawPassword) -> bool:
         """:raises PasswordHasherBusyError:"""
         return await self._password_hasher.verify(
@@ -51,25 +85,47 @@ class UserService:
             hashed_password=user.password_hash,
         )
 
-    async def change_password(self, user: User, raw_password: RawPassword) -> None:
+    async def hash_password(self, raw_password: RawPassword) -> UserPasswordHash:
         """:raises PasswordHasherBusyError:"""
-        user.password_hash = await self._password_hasher.hash(raw_password)
+        return await self._password_hasher.hash(raw_password)
+
+    def set_password_hash(self, user: User, password_hash: UserPasswordHash) -> None:
+        """Applies a hash from `hash_password`, computed beforehand."""
+        user.password_hash = password_hash
 
     def toggle_user_activation(self, user: User, *, is_active: bool) -> bool:
         """:raises ActivationChangeNotPermittedError:"""
-        if not user.role.is_changeable:
-            raise ActivationChangeNotPermittedError(user.username, user.role)
-        if user.is_active == is_active:
+        if not self.is_activation_change_needed(user, is_active=is_active):
             return False
         user.is_active = is_active
         return True
 
+    def is_activation_change_needed(self, user: User, *, is_active: bool) -> bool:
+        """
+        :raises ActivationChangeNotPermittedError:
+
+        Checks `toggle_user_activation` without applying it,
+        for changes written in bulk.
+        """
+        if not user.role.is_changeable:
+            raise ActivationChangeNotPermittedError(user.username, user.role)
+        return user.is_active != is_active
+
     def toggle_user_admin_role(self, user: User, *, is_admin: bool) -> bool:
         """:raises RoleChangeNotPermittedError:"""
+        if not self.is_admin_role_change_needed(user, is_admin=is_admin):
+            return False
+        user.role = UserRole.ADMIN if is_admin else UserRole.USER
+        return True
+
+    def is_admin_role_change_needed(self, user: User, *, is_admin: bool) -> bool:
+        """
+        :raises RoleChangeNotPermittedError:
+
+        Checks `toggle_user_admin_role` without applying it,
+        for changes written in bulk.
+        """
         if not user.role.is_changeable:
             raise RoleChangeNotPermittedError(user.username, user.role)
         target_role = UserRole.ADMIN if is_admin else UserRole.USER
-        if user.role == target_role:
-            return False
-        user.role = target_role
-        return True
+        return user.role != target_role
@@ -1,8 +1,13 @@
 from typing import Final
 
+DB_CONNECTION_RELEASED: Final[str] = "Connection was released."
+DB_CONNECTION_NOT_RELEASED: Final[str] = (
+    "Connection was not released: session has pending changes."
+)
 DB_CONSTRAINT_VIOLATION: Final[str] = "Database constraint violation."
 DB_COMMIT_DONE: Final[str] = "Commit was done."
 DB_COMMIT_FAILED: Final[str] = "Commit failed."
 DB_FLUSH_DONE: Final[str] = "Flush was done."
 DB_FLUSH_FAILED: Final[str] = "Flush failed."
 DB_QUERY_FAILED: Final[str] = "Database query failed."
+DB_ROLLBACK_DONE: Final[str] = "Rollback was done."
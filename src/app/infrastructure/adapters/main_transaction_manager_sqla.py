@@ -1,14 +1,21 @@
 import logging
 
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.exc import StaleDataError
 
+from app.application.common.exceptions.concurrency import (
+    ConcurrentModificationError,
+)
 from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
 from app.infrastructure.adapters.constants import (
     DB_COMMIT_DONE,
     DB_COMMIT_FAILED,
+    DB_CONNECTION_NOT_RELEASED,
+    DB_CONNECTION_RELEASED,
     DB_QUERY_FAILED,
+    DB_ROLLBACK_DONE,
 )
 from app.infrastructure.adapters.types import MainAsyncSession
 from app.infrastructure.exceptions.gateway import DataMapperError
@@ -21,10 +28,41 @@ class SqlaMainTransactionManager(TransactionManager):
         self._session = session
 
     async def commit(self) -> None:
-        """:raises DataMapperError:"""
+        """
+        :raises DataMapperError:
+        :raises ConcurrentModificationError:
+        """
         try:
             await self._session.commit()
             log.debug("%s Main session.", DB_COMMIT_DONE)
 
+        except StaleDataError as err:
+            # A versioned update matched no row; the error doesn't tell whose
+            raise ConcurrentModificationError from err
+
         except SQLAlchemyError as err:
             raise DataMapperError(f"{DB_QUERY_FAILED} {DB_COMMIT_FAILED}") from err
+
+    async def rollback(self) -> None:
+        """:raises DataMapperError:"""
+        try:
+            await self._session.rollback()
+            log.debug("%s Main session.", DB_ROLLBACK_DONE)
+
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+
+    async def release_connection(self) -> None:
+        """:raises DataMapperError:"""
+        if not self._session.in_transaction():
+            return
+        if self._session.new or self._session.dirty or self._session.deleted:
+            log.warning("%s Main session.", DB_CONNECTION_NOT_RELEASED)
+            return
+        try:
+            # Nothing to flush: ends the transaction, keeps objects loaded
+            await self._session.commit()
+            log.debug("%s Main session.", DB_CONNECTION_RELEASED)
+
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
@@ -0,0 +1,48 @@
+from typing import TypedDict
+
+from app.application.common.ports.metrics_reader import MetricsReader
+from app.infrastructure.adapters.user_directory_snapshot import (
+    UserDirectoryMetrics,
+    UserDirectorySnapshot,
+)
+from app.infrastructure.adapters.user_reader_cache import (
+    UserQueryCache,
+    UserQueryCacheMetrics,
+)
+from app.infrastructure.adapters.username_bloom_filter import (
+    UsernameBloomFilter,
+    UsernameFilterMetrics,
+)
+from app.infrastructure.auth.throttling.log_in_throttle import (
+    LogInThrottle,
+    LogInThrottleMetrics,
+)
+
+
+class InProcessMetrics(TypedDict):
+    log_in_throttle: LogInThrottleMetrics
+    username_filter: UsernameFilterMetrics
+    user_query_cache: UserQueryCacheMetrics
+    user_directory: UserDirectoryMetrics
+
+
+class InProcessMetricsReader(MetricsReader):
+    def __init__(
+        self,
+        log_in_throttle: LogInThrottle,
+        username_filter: UsernameBloomFilter,
+        user_query_cache: UserQueryCache,
+        user_directory: UserDirectorySnapshot,
+    ) -> None:
+        self._log_in_throttle = log_in_throttle
+        self._username_filter = username_filter
+        self._user_query_cache = user_query_cache
+        self._user_directory = user_directory
+
+    def read(self) -> InProcessMetrics:
+        return InProcessMetrics(
+            log_in_throttle=self._log_in_throttle.metrics,
+            username_filter=self._username_filter.metrics,
+            user_query_cache=self._user_query_cache.metrics,
+            user_directory=self._user_directory.metrics,
+        )
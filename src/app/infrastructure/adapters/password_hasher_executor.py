@@ -0,0 +1,77 @@
+import asyncio
+from abc import abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from app.domain.ports.password_hasher import PasswordHasher
+from app.domain.value_objects.raw_password import RawPassword
+from app.domain.value_objects.user_password_hash import UserPasswordHash
+from app.infrastructure.adapters.types import HasherSemaphore, HasherThreadPoolExecutor
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
+
+
+class ExecutorPasswordHasher(PasswordHasher):
+    """
+    Runs the blocking hashing of subclasses in a thread pool,
+    at most as many at once as the shared semaphore allows.
+    """
+
+    def __init__(
+        self,
+        executor: HasherThreadPoolExecutor,
+        semaphore: HasherSemaphore,
+        semaphore_wait_timeout_s: float,
+    ) -> None:
+        self._executor = executor
+        self._semaphore = semaphore
+        self._semaphore_wait_timeout_s = semaphore_wait_timeout_s
+
+    async def hash(self, raw_password: RawPassword) -> UserPasswordHash:
+        """:raises PasswordHasherBusyError:"""
+        async with self._permit():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                self.hash_sync,
+                raw_password,
+            )
+
+    async def verify(
+        self,
+        raw_password: RawPassword,
+        hashed_password: UserPasswordHash,
+    ) -> bool:
+        """:raises PasswordHasherBusyError:"""
+        async with self._permit():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                self.verify_sync,
+                raw_password,
+                hashed_password,
+            )
+
+    @abstractmethod
+    def hash_sync(self, raw_password: RawPassword) -> UserPasswordHash: ...
+
+    @abstractmethod
+    def verify_sync(
+        self,
+        raw_password: RawPassword,
+        hashed_password: UserPasswordHash,
+    ) -> bool: ...
+
+    @asynccontextmanager
+    async def _permit(self) -> AsyncIterator[None]:
+        """:raises PasswordHasherBusyError:"""
+        try:
+            await asyncio.wait_for(
+                self._semaphore.acquire(),
+                timeout=self._semaphore_wait_timeout_s,
+            )
+        except TimeoutError as err:
+            raise PasswordHasherBusyError from err
+        try:
+            yield
+        finally:
+            self._semaphore.release()
@@ -0,0 +1,49 @@
+import logging
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Protocol
+
+from app.domain.ports.password_hasher import PasswordHasher
+from app.domain.value_objects.raw_password import RawPassword
+from app.domain.value_objects.user_password_hash import UserPasswordHash
+
+log = logging.getLogger(__name__)
+
+
+class AlgorithmPasswordHasher(PasswordHasher, Protocol):
+    @abstractmethod
+    def recognizes(self, hashed_password: UserPasswordHash) -> bool: ...
+
+
+class MultiAlgorithmPasswordHasher(PasswordHasher):
+    """
+    New hashes are created by `primary`. Stored hashes are verified by
+    whichever hasher recognizes their algorithm prefix, so switching
+    `primary` never invalidates existing passwords: legacy hashes keep
+    verifying and are replaced as soon as the password is set again
+    (sign-up, password change, admin reset).
+    """
+
+    def __init__(
+        self,
+        primary: AlgorithmPasswordHasher,
+        legacy: Sequence[AlgorithmPasswordHasher],
+    ) -> None:
+        self._primary = primary
+        self._hashers = (primary, *legacy)
+
+    async def hash(self, raw_password: RawPassword) -> UserPasswordHash:
+        """:raises PasswordHasherBusyError:"""
+        return await self._primary.hash(raw_password)
+
+    async def verify(
+        self,
+        raw_password: RawPassword,
+        hashed_password: UserPasswordHash,
+    ) -> bool:
+        """:raises PasswordHasherBusyError:"""
+        for hasher in self._hashers:
+            if hasher.recognizes(hashed_password):
+                return await hasher.verify(raw_password, hashed_password)
+        log.warning("Password hash of unknown algorithm.")
+        return False
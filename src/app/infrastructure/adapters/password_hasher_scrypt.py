@@ -0,0 +1,173 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import logging
+import os
+from typing import ClassVar, Final
+
+from app.domain.value_objects.raw_password import RawPassword
+from app.domain.value_objects.user_password_hash import UserPasswordHash
+from app.infrastructure.adapters.password_hasher_executor import (
+    ExecutorPasswordHasher,
+)
+from app.infrastructure.adapters.password_pepper import add_pepper
+from app.infrastructure.adapters.types import HasherSemaphore, HasherThreadPoolExecutor
+
+log = logging.getLogger(__name__)
+
+
+class ScryptPasswordHasher(ExecutorPasswordHasher):
+    """
+    Memory-hard alternative to bcrypt built on `hashlib.scrypt`.
+
+    Hashes are stored in a modular crypt format that carries
+    the cost parameters: `$scrypt$ln=<log2 N>,r=<r>,p=<p>$<salt>$<key>`
+    (unpadded base64). Verification uses the parameters from the hash,
+    so retuning the cost only affects newly created hashes. Parameters
+    beyond fixed bounds don't verify, so that a stored hash cannot
+    exhaust memory or make `hashlib.scrypt` fail.
+    """
+
+    PREFIX: ClassVar[Final[bytes]] = b"$scrypt$"
+    SALT_LEN: ClassVar[Final[int]] = 16
+    KEY_LEN: ClassVar[Final[int]] = 32
+    MAX_COST_LOG2: ClassVar[Final[int]] = 20
+    MAX_BLOCK_SIZE: ClassVar[Final[int]] = 32
+    MAX_PARALLELISM: ClassVar[Final[int]] = 16
+    MAX_MEMORY_BYTES: ClassVar[Final[int]] = 268_435_456  # 256 MiB
+    MIN_KEY_LEN: ClassVar[Final[int]] = 16
+    MAX_KEY_LEN: ClassVar[Final[int]] = 64
+
+    def __init__(
+        self,
+        pepper: bytes,
+        cost_log2: int,
+        block_size: int,
+        parallelism: int,
+        executor: HasherThreadPoolExecutor,
+        semaphore: HasherSemaphore,
+        semaphore_wait_timeout_s: float,
+    ) -> None:
+        """:raises ValueError:"""
+        if not self._are_parameters_bounded(cost_log2, block_size, parallelism):
+            raise ValueError("Scrypt parameters exceed the verification bounds.")
+        super().__init__(executor, semaphore, semaphore_wait_timeout_s)
+        self._pepper = pepper
+        self._cost_log2 = cost_log2
+        self._block_size = block_size
+        self._parallelism = parallelism
+
+    def recognizes(self, hashed_password: UserPasswordHash) -> bool:
+        return hashed_password.value.startswith(self.PREFIX)
+
+    def hash_sync(self, raw_password: RawPassword) -> UserPasswordHash:
+        log.debug("hash")
+        salt = os.urandom(self.SALT_LEN)
+        key = self._derive_key(
+            add_pepper(raw_password, self._pepper),
+            salt=salt,
+            cost_log2=self._cost_log2,
+            block_size=self._block_size,
+            parallelism=self._parallelism,
+        )
+        params = b"ln=%d,r=%d,p=%d" % (
+            self._cost_log2,
+            self._block_size,
+            self._parallelism,
+        )
+        return UserPasswordHash(
+            b"$".join((
+                self.PREFIX + params,
+                self._b64encode(salt),
+                self._b64encode(key),
+            ))
+        )
+
+    def verify_sync(
+        self, raw_password: RawPassword, hashed_password: UserPasswordHash
+    ) -> bool:
+        log.debug("verify")
+        try:
+            params, encoded_salt, encoded_key = hashed_password.value.removeprefix(
+                self.PREFIX
+            ).split(b"$")
+            cost_log2, block_size, parallelism = (
+                int(param.partition(b"=")[2]) for param in params.split(b",")
+            )
+            salt = self._b64decode(encoded_salt)
+            expected_key = self._b64decode(encoded_key)
+        except (ValueError, binascii.Error):
+            log.warning("Malformed scrypt password hash.")
+            return False
+        if not (
+            self._are_parameters_bounded(cost_log2, block_size, parallelism)
+            and self.MIN_KEY_LEN <= len(expected_key) <= self.MAX_KEY_LEN
+        ):
+            log.warning("Scrypt password hash beyond the parameter bounds.")
+            return False
+        try:
+            key = self._derive_key(
+                add_pepper(raw_password, self._pepper),
+                salt=salt,
+                cost_log2=cost_log2,
+                block_size=block_size,
+                parallelism=parallelism,
+                key_len=len(expected_key),
+            )
+        except (ValueError, MemoryError):
+            log.warning("Scrypt password hash could not be derived.")
+            return False
+        return hmac.compare_digest(key, expected_key)
+
+    def _are_parameters_bounded(
+        self,
+        cost_log2: int,
+        block_size: int,
+        parallelism: int,
+    ) -> bool:
+        if not (
+            1 <= cost_log2 <= self.MAX_COST_LOG2
+            and 1 <= block_size <= self.MAX_BLOCK_SIZE
+            and 1 <= parallelism <= self.MAX_PARALLELISM
+        ):
+            return False
+        memory_bytes = self._memory_bytes(cost_log2, block_size, parallelism)
+        return not memory_bytes > self.MAX_MEMORY_BYTES
+
+    @staticmethod
+    def _memory_bytes(cost_log2: int, block_size: int, parallelism: int) -> int:
+        """The exact OpenSSL working set: 128 * r * (N + p + 2) bytes."""
+        return 128 * block_size * ((1 << cost_log2) + parallelism + 2)
+
+    def _derive_key(
+        self,
+        peppered_password: bytes,
+        *,
+        salt: bytes,
+        cost_log2: int,
+        block_size: int,
+        parallelism: int,
+        key_len: int = KEY_LEN,
+    ) -> bytes:
+        """
+        Parameters:
+        https://cheatsheetseries.owasp.org/cheatsheets/Password_Storage_Cheat_Sheet.html#scrypt
+        """
+        return hashlib.scrypt(
+            peppered_password,
+            salt=salt,
+            n=1 << cost_log2,
+            r=block_size,
+            p=parallelism,
+            maxmem=self._memory_bytes(cost_log2, block_size, parallelism),
+            dklen=key_len,
+        )
+
+    @staticmethod
+    def _b64encode(data: bytes) -> bytes:
+        return base64.b64encode(data).rstrip(b"=")
+
+    @staticmethod
+    def _b64decode(data: bytes) -> bytes:
+        return base64.b64decode(data + b"=" * (-len(data) % 4), validate=True)
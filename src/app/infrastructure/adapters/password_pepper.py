@@ -0,0 +1,20 @@
+import base64
+import hashlib
+import hmac
+
+from app.domain.value_objects.raw_password import RawPassword
+
+
+def add_pepper(raw_password: RawPassword, pepper: bytes) -> bytes:
+    """
+    Pre-hashing:
+    https://cheatsheetseries.owasp.org/cheatsheets/Password_Storage_Cheat_Sheet.html#pre-hashing-passwords-with-bcrypt
+    Shared by all hashing algorithms, so switching the algorithm
+    never changes what is fed into the key derivation.
+    """
+    hmac_password = hmac.new(
+        key=pepper,
+        msg=raw_password.value,
+        digestmod=hashlib.sha384,
+    ).digest()
+    return base64.b64encode(hmac_password)
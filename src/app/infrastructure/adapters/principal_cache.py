@@ -0,0 +1,55 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+
+from app.application.common.ports.principal_cache import Principal, PrincipalCache
+from app.domain.value_objects.user_id import UserId
+
+
+class InMemoryPrincipalCache(PrincipalCache):
+    """
+    Per-process principals, trusted for `max_age_s` after being read.
+    Invalidations by this process apply at once; changes made by other
+    processes show up once the entries expire.
+    At most `max_entries` are kept, least recently used evicted first.
+    """
+
+    def __init__(
+        self,
+        max_age_s: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_age_s = max_age_s
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[UserId, tuple[Principal, float]] = OrderedDict()
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self, user_id: UserId) -> Principal | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        principal, stored_at = entry
+        if self._clock() - stored_at >= self._max_age_s:
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return principal
+
+    def store(self, principal: Principal, *, version: int) -> None:
+        if version != self._version:
+            return
+        self._entries[principal.id_] = (principal, self._clock())
+        self._entries.move_to_end(principal.id_)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_ids: Iterable[UserId]) -> None:
+        self._version += 1
+        for user_id in user_ids:
+            self._entries.pop(user_id, None)
@@ -0,0 +1,46 @@
+from sqlalchemy import Select, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.common.ports.principal_cache import Principal
+from app.application.common.ports.principal_reader import PrincipalReader
+from app.domain.enums.user_role import UserRole
+from app.domain.value_objects.user_id import UserId
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.user import (
+    is_registered,
+    users_table,
+)
+
+
+def select_principal(user_id: UserId) -> Select[tuple[UserRole, bool]]:
+    # All columns are included in the primary key index
+    return select(users_table.c.role, users_table.c.is_active).where(
+        users_table.c.id == user_id.value,
+        is_registered,
+    )
+
+
+class SqlaPrincipalReader(PrincipalReader):
+    """
+    Each read takes a pooled connection for its single statement, in
+    autocommit: no round trips to begin and roll back a transaction.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def read_by_id(self, user_id: UserId) -> Principal | None:
+        """:raises DataMapperError:"""
+        try:
+            async with self._session_factory() as session:
+                connection = await session.connection(
+                    execution_options={"isolation_level": "AUTOCOMMIT"}
+                )
+                row = (await connection.execute(select_principal(user_id))).first()
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+        if row is None:
+            return None
+        return Principal(id_=user_id, role=row.role, is_active=row.is_active)
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from typing import ClassVar, Final, cast
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.adapters.user_data_mapper_sqla import SqlaUserDataMapper
+from app.infrastructure.adapters.username_bloom_filter import UsernameBloomFilter
+from app.infrastructure.adapters.users_version_sqla import SqlaUsersVersion
+from app.infrastructure.exceptions.gateway import DataMapperError
+
+log = logging.getLogger(__name__)
+
+
+class ReservationSweeper:
+    """
+    Deletes, every `INTERVAL_S`, the username reservations of registrations
+    that neither completed nor cancelled them, as when their process died
+    while hashing, once `SqlaUserDataMapper.RESERVATION_TTL` has passed.
+    Each process sweeps; concurrent sweeps delete each row once.
+    """
+
+    INTERVAL_S: ClassVar[Final[float]] = 60
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        username_filter: UsernameBloomFilter,
+    ) -> None:
+        self._session_factory = session_factory
+        self._username_filter = username_filter
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def sweep(self) -> int:
+        """
+        :raises DataMapperError:
+        :raises SQLAlchemyError:
+
+        Returns how many reservations were deleted.
+        """
+        async with self._session_factory() as session:
+            main_session = cast(MainAsyncSession, session)
+            deleted = await SqlaUserDataMapper(
+                main_session,
+                self._username_filter,
+            ).delete_expired_reservations()
+            await session.commit()
+            # After the commit, so the new version never shows the deleted
+            if deleted:
+                await SqlaUsersVersion(main_session).bump()
+        return deleted
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.INTERVAL_S)
+            try:
+                deleted = await self.sweep()
+            except (SQLAlchemyError, DataMapperError):
+                log.exception("Reservation sweep failed.")
+                continue
+            if deleted:
+                log.info("Reservation sweep: deleted %d expired.", deleted)
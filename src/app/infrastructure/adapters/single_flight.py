@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+log = logging.getLogger(__name__)
+
+
+def _create_outcome() -> asyncio.Future[Any]:
+    return asyncio.get_running_loop().create_future()
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class Flight:
+    """Outcome of an operation, in flight until `outcome` is done."""
+
+    outcome: asyncio.Future[Any] = field(default_factory=_create_outcome)
+    expires_at: float = math.inf
+    size: int = 0
+
+
+class SingleFlightCache[K: Hashable, F: Flight]:
+    """
+    Keeps the outcomes of keyed operations for `ttl_s`.
+
+    - Concurrent callers of a key share one run (single-flight),
+      including its error; a cancelled run is retried by the next caller.
+    - Failed runs are not kept.
+    - At most `max_entries` are kept, the oldest evicted first; with
+      `refresh_on_hit`, the least recently used. Runs in flight are never
+      evicted, so that callers waiting on them aren't run again.
+    - `measure` gives the size of a result, summed up in `size`.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        ttl_s: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+        refresh_on_hit: bool = False,
+        measure: Callable[[Any], int] | None = None,
+    ) -> None:
+        self._name = name
+        self._ttl_s = ttl_s
+        self._max_entries = max_entries
+        self._clock = clock
+        self._refresh_on_hit = refresh_on_hit
+        self._measure = measure
+        self._entries: OrderedDict[K, F] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    async def get_or_run[T](
+        self,
+        key: K,
+        operation: Callable[[], Awaitable[T]],
+        create: Callable[[], F],
+        on_found: Callable[[F], None] | None = None,
+    ) -> tuple[T, bool]:
+        """
+        Returns the result and whether it was another caller's.
+        `create` makes the entry of a run, right before it starts.
+        `on_found` sees a kept or in-flight entry before it is waited on,
+        and may raise to refuse it.
+        """
+        while True:
+            entry = self._get(key)
+            if entry is None:
+                return await self._run_first(key, create(), operation), False
+            if on_found is not None:
+                on_found(entry)
+            try:
+                result = await asyncio.shield(entry.outcome)
+            except asyncio.CancelledError:
+                current_task = asyncio.current_task()
+                if current_task is not None and current_task.cancelling():
+                    raise
+                # The first run was cancelled: run again as the first
+                continue
+            return cast(T, result), True
+
+    def forget_done(self, predicate: Callable[[F], bool]) -> None:
+        """Runs in flight are kept for the callers waiting on them."""
+        for key, entry in list(self._entries.items()):
+            if entry.outcome.done() and predicate(entry):
+                self._forget(key, entry)
+
+    def _get(self, key: K) -> F | None:
+        self._evict()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            self._forget(key, entry)
+            return None
+        if self._refresh_on_hit:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def _run_first[T](
+        self,
+        key: K,
+        entry: F,
+        operation: Callable[[], Awaitable[T]],
+    ) -> T:
+        self._entries[key] = entry
+        self._evict()
+        try:
+            result = await operation()
+        except asyncio.CancelledError:
+            self._forget(key, entry)
+            entry.outcome.cancel()
+            raise
+        except Exception as err:
+            self._forget(key, entry)
+            entry.outcome.set_exception(err)
+            entry.outcome.exception()  # retrieved here if nobody waits
+            raise
+        entry.outcome.set_result(result)
+        if self._entries.get(key) is entry:
+            entry.expires_at = self._clock() + self._ttl_s
+            if self._measure is not None:
+                entry.size = self._measure(result)
+                self._size += entry.size
+        return result
+
+    def _forget(self, key: K, entry: F) -> None:
+        if self._entries.get(key) is entry:
+            del self._entries[key]
+            self._size -= entry.size
+
+    def _evict(self) -> None:
+        """
+        Expired entries are dropped from the front, where the oldest
+        gather, and any done ones while over `max_entries`.
+        """
+        now = self._clock()
+        for _ in range(len(self._entries)):
+            key, entry = next(iter(self._entries.items()))
+            overflow = len(self._entries) > self._max_entries
+            if entry.expires_at > now and not overflow:
+                return
+            if entry.outcome.done():
+                self._forget(key, entry)
+            else:
+                self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            log.warning("%s is full of runs in flight.", self._name)
@@ -0,0 +1,66 @@
+import math
+import time
+from collections import Counter
+from collections.abc import Callable, Mapping
+
+from app.application.common.ports.user_counter import UserCounter
+from app.domain.enums.user_role import UserRole
+
+
+class InMemoryUserCountCache(UserCounter):
+    """
+    Per-process user counts, recounted by the reader once older than
+    `ttl_s` and adjusted in between by this process's own changes.
+    Changes made by other processes show up after the next recount.
+
+    Users are counted per role and activation state, so changes keep
+    every count current, and totals filtered by role or activation
+    are sums of them.
+    """
+
+    def __init__(
+        self,
+        ttl_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._counts: Counter[tuple[UserRole, bool]] = Counter()
+        self._counted_at = -math.inf
+
+    def get_total(
+        self,
+        *,
+        role: UserRole | None = None,
+        is_active: bool | None = None,
+    ) -> int | None:
+        """`None` until counted and once expired."""
+        if self._clock() - self._counted_at >= self._ttl_s:
+            return None
+        return sum(
+            count
+            for (count_role, count_is_active), count in self._counts.items()
+            if role in {None, count_role} and is_active in {None, count_is_active}
+        )
+
+    def store(self, counts: Mapping[tuple[UserRole, bool], int]) -> None:
+        """Counts by role and activation state; missing ones are zero."""
+        self._counts = Counter(counts)
+        self._counted_at = self._clock()
+
+    def record_user_created(self, *, role: UserRole, is_active: bool) -> None:
+        self._counts[role, is_active] += 1
+
+    def record_activation_changed(self, *, role: UserRole, is_active: bool) -> None:
+        self._counts[role, not is_active] -= 1
+        self._counts[role, is_active] += 1
+
+    def record_role_changed(
+        self,
+        *,
+        old_role: UserRole,
+        new_role: UserRole,
+        is_active: bool,
+    ) -> None:
+        self._counts[old_role, is_active] -= 1
+        self._counts[new_role, is_active] += 1
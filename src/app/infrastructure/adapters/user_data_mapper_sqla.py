@@ -1,18 +1,48 @@
-from sqlalchemy import select
+from collections.abc import AsyncIterator, Sequence
+from datetime import timedelta
+from typing import ClassVar, Final
+from uuid import UUID
+
+from sqlalchemy import any_, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import class_mapper, undefer, with_loader_criteria
+from sqlalchemy.orm.attributes import instance_state
 
+from app.application.common.ports.principal_cache import Principal
 from app.application.common.ports.user_command_gateway import UserCommandGateway
 from app.domain.entities.user import User
+from app.domain.enums.user_role import UserRole
 from app.domain.value_objects.user_id import UserId
 from app.domain.value_objects.username import Username
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.principal_reader_sqla import select_principal
 from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.adapters.username_bloom_filter import UsernameBloomFilter
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.expressions import uuid_array
+from app.infrastructure.persistence_sqla.mappings.user import (
+    is_registered,
+    users_table,
+)
 
 
 class SqlaUserDataMapper(UserCommandGateway):
-    def __init__(self, session: MainAsyncSession) -> None:
+    USERNAME_SCAN_BATCH_SIZE: ClassVar[Final[int]] = 10_000
+    # Far beyond any hashing: older placeholders belong to registrations
+    # that will never complete
+    RESERVATION_TTL: ClassVar[Final[timedelta]] = timedelta(minutes=10)
+
+    def __init__(
+        self,
+        session: MainAsyncSession,
+        username_filter: UsernameBloomFilter,
+    ) -> None:
         self._session = session
+        self._username_filter = username_filter
+        # Row versions of the placeholders reserved in this session
+        self._reservations: dict[UserId, int] = {}
 
     def add(self, user: User) -> None:
         """:raises DataMapperError:"""
@@ -20,20 +50,215 @@ class SqlaUserDataMapper(UserCommandGateway):
             self._session.add(user)
         except SQLAlchemyError as err:
             raise DataMapperError(DB_QUERY_FAILED) from err
+        self._username_filter.add(user.username.value)
+
+    async def reserve(self, user: User) -> bool:
+        """:raises DataMapperError:"""
+        stmt = (
+            insert(users_table)
+            .values(
+                id=user.id_.value,
+                username=user.username.value,
+                password_hash=user.password_hash.value,
+                role=user.role,
+                is_active=user.is_active,
+                reserved_at=func.now(),
+            )
+            .on_conflict_do_nothing(index_elements=[users_table.c.username])
+            .returning(users_table.c.version)
+        )
+
+        try:
+            version = (await self._session.execute(stmt)).scalar_one_or_none()
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+        self._username_filter.add(user.username.value)
+        if version is None:
+            return False
+        self._reservations[user.id_] = version
+        return True
+
+    async def add_many(self, users: Sequence[User]) -> set[UserId]:
+        """:raises DataMapperError:"""
+        if not users:
+            return set()
+        stmt = (
+            insert(users_table)
+            .values([
+                {
+                    "id": user.id_.value,
+                    "username": user.username.value,
+                    "password_hash": user.password_hash.value,
+                    "role": user.role,
+                    "is_active": user.is_active,
+                }
+                for user in users
+            ])
+            .on_conflict_do_nothing(index_elements=[users_table.c.username])
+            .returning(users_table.c.id)
+        )
+
+        try:
+            inserted = (await self._session.scalars(stmt)).all()
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+        for user in users:
+            self._username_filter.add(user.username.value)
+        return {UserId(user_id) for user_id in inserted}
+
+    async def complete_reservation(self, user: User) -> bool:
+        """
+        :raises DataMapperError:
+
+        Only the placeholder as reserved by this mapper is completed,
+        not one that expired and was deleted, or changed since.
+        """
+        version = self._reservations.get(user.id_)
+        if version is None:
+            return False
+        stmt = (
+            update(users_table)
+            .where(
+                users_table.c.id == user.id_.value,
+                users_table.c.reserved_at.is_not(None),
+                users_table.c.version == version,
+            )
+            .values(
+                password_hash=user.password_hash.value,
+                is_active=user.is_active,
+                reserved_at=None,
+                version=users_table.c.version + 1,
+            )
+        )
+
+        try:
+            result = await self._session.execute(stmt)
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+        return bool(result.rowcount)  # type: ignore[attr-defined]
+
+    async def cancel_reservation(self, user: User) -> None:
+        """
+        :raises DataMapperError:
+
+        Completed users are never deleted: after a completion that was
+        rolled back, the placeholder is.
+        """
+        version = self._reservations.get(user.id_)
+        if version is None:
+            return
+        stmt = delete(users_table).where(
+            users_table.c.id == user.id_.value,
+            users_table.c.reserved_at.is_not(None),
+            users_table.c.version == version,
+        )
+
+        try:
+            await self._session.execute(stmt)
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+
+    async def delete_expired_reservations(self) -> int:
+        """
+        :raises DataMapperError:
+
+        Deletes the placeholders reserved longer than `RESERVATION_TTL`
+        ago, freeing their usernames. Returns how many were deleted.
+        """
+        stmt = delete(users_table).where(
+            users_table.c.reserved_at < func.now() - self.RESERVATION_TTL
+        )
+
+        try:
+            result = await self._session.execute(stmt)
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+        return int(result.rowcount)  # type: ignore[attr-defined]
 
     async def read_by_id(
         self,
         user_id: UserId,
         for_update: bool = False,
+        with_password_hash: bool = False,
     ) -> User | None:
+        """
+        :raises DataMapperError:
+
+        A user already in the session is returned without a query,
+        unless it is to be locked. Placeholders are not returned.
+        """
+        options = [with_loader_criteria(User, is_registered)]
+        if with_password_hash:
+            options.append(undefer(User.password_hash))  # type: ignore
+
+        try:
+            user: User | None = await self._session.get(
+                User,
+                user_id.value,
+                options=options,
+                # Even `False` would skip the identity map
+                with_for_update=True if for_update else None,
+            )
+            if (
+                user is not None
+                and with_password_hash
+                and "password_hash" in instance_state(user).unloaded
+            ):
+                # Already in the session, loaded without it: partial loads
+                # name the column under the composite
+                column_key = (
+                    class_mapper(User)
+                    .get_property_by_column(users_table.c.password_hash)
+                    .key
+                )
+                await self._session.refresh(user, [column_key])
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+        return user
+
+    async def read_principal_by_id(self, user_id: UserId) -> Principal | None:
+        """
+        :raises DataMapperError:
+
+        Taken from the user if already in the session.
+        """
+        user: User | None = self._session.identity_map.get(
+            self._session.identity_key(User, user_id.value)
+        )
+        if (
+            user is not None
+            and not {"role", "is_active"} & instance_state(user).unloaded
+        ):
+            return Principal.from_user(user)
+
+        try:
+            row = (await self._session.execute(select_principal(user_id))).first()
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+        if row is None:
+            return None
+        return Principal(id_=user_id, role=row.role, is_active=row.is_active)
+
+    async def read_many_by_ids(
+        self,
+        user_ids: Sequence[UserId],
+        for_update: bool = False,
+    ) -> list[User]:
         """:raises DataMapperError:"""
-        stmt = select(User).where(User.id_ == user_id)  # type: ignore
+        if not user_ids:
+            return []
+        ids = uuid_array([user_id.value for user_id in user_ids])
+        stmt = (
+            select(User)
+            .where(users_table.c.id == any_(ids), is_registered)
+            .order_by(users_table.c.id)
+        )
 
         if for_update:
             stmt = stmt.with_for_update()
 
         try:
-            return (await self._session.execute(stmt)).scalar_one_or_none()
+            return list((await self._session.scalars(stmt)).all())
         except SQLAlchemyError as err:
             raise DataMapperError(DB_QUERY_FAILED) from err
 
@@ -41,14 +266,131 @@ class SqlaUserDataMapper(UserCommandGateway):
         self,
         username: Username,
         for_update: bool = False,
+        with_password_hash: bool = False,
     ) -> User | None:
-        """:raises DataMapperError:"""
-        stmt = select(User).where(User.username == username)  # type: ignore
+        """
+        :raises DataMapperError:
+
+        Always queried: the username filter may miss users created
+        by other processes, and a miss here would fail their log-in.
+        """
+        stmt = select(User).where(User.username == username, is_registered)  # type: ignore
 
         if for_update:
             stmt = stmt.with_for_update()
+        if with_password_hash:
+            stmt = stmt.options(undefer(User.password_hash))  # type: ignore
+
+        try:
+            user: User | None = (await self._session.execute(stmt)).scalar_one_or_none()
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+        return user
+
+    async def read_taken_usernames(
+        self,
+        usernames: Sequence[Username],
+    ) -> set[Username]:
+        """
+        :raises DataMapperError:
+
+        Skips the usernames the filter has never seen. It may miss users
+        created by other processes since its last scan; inserting them
+        then fails on the unique username instead.
+        """
+        try:
+            candidates = [
+                username.value
+                for username in usernames
+                if await self._username_filter.might_contain(
+                    username.value,
+                    self.stream_usernames,
+                )
+            ]
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+        if not candidates:
+            return set()
+
+        stmt = select(users_table.c.username).where(
+            users_table.c.username.in_(candidates)
+        )
+
+        try:
+            taken = (await self._session.scalars(stmt)).all()
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+        for _ in range(len(candidates) - len(taken)):
+            self._username_filter.record_false_positive()
+        return {Username(username) for username in taken}
+
+    async def set_activation_many(
+        self,
+        user_ids: Sequence[UserId],
+        *,
+        is_active: bool,
+    ) -> set[UserId]:
+        """:raises DataMapperError:"""
+        if not user_ids:
+            return set()
+        ids = uuid_array([user_id.value for user_id in user_ids])
+        stmt = (
+            update(users_table)
+            .where(
+                users_table.c.id == any_(ids),
+                users_table.c.is_active != is_active,
+                is_registered,
+            )
+            .values(is_active=is_active, version=users_table.c.version + 1)
+            .returning(users_table.c.id)
+        )
 
         try:
-            return (await self._session.execute(stmt)).scalar_one_or_none()
+            updated = (await self._session.scalars(stmt)).all()
         except SQLAlchemyError as err:
             raise DataMapperError(DB_QUERY_FAILED) from err
+        return {UserId(user_id) for user_id in updated}
+
+    async def set_role_many(
+        self,
+        user_ids: Sequence[UserId],
+        *,
+        role: UserRole,
+    ) -> set[UserId]:
+        """:raises DataMapperError:"""
+        if not user_ids:
+            return set()
+        ids = uuid_array([user_id.value for user_id in user_ids])
+        stmt = (
+            update(users_table)
+            .where(
+                users_table.c.id == any_(ids),
+                users_table.c.role != role,
+                is_registered,
+            )
+            .values(role=role, version=users_table.c.version + 1)
+            .returning(users_table.c.id)
+        )
+
+        try:
+            updated = (await self._session.scalars(stmt)).all()
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+        return {UserId(user_id) for user_id in updated}
+
+    async def stream_usernames(self, user_id_floor: UUID) -> AsyncIterator[str]:
+        """
+        :raises SQLAlchemyError:
+
+        Usernames of users with IDs from `user_id_floor`, fetched in batches.
+        Scanned in a session of its own: the scan is shared by the requests
+        waiting for it, and must not join the transaction of one of them.
+        """
+        stmt = (
+            select(users_table.c.username)
+            .where(users_table.c.id >= user_id_floor)
+            .execution_options(yield_per=self.USERNAME_SCAN_BATCH_SIZE)
+        )
+        async with AsyncSession(self._session.bind) as session:
+            async for username in await session.stream_scalars(stmt):
+                yield username
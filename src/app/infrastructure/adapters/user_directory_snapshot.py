@@ -0,0 +1,551 @@
+import asyncio
+import logging
+import math
+import time
+from array import array
+from bisect import bisect_left
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
+from dataclasses import dataclass
+from itertools import accumulate, compress
+from operator import attrgetter, le
+from typing import Any, ClassVar, Final, TypedDict, cast
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.application.common.ports.user_query_gateway import (
+    ListUsersCursorQM,
+    ListUsersQM,
+    SparseUserQueryModel,
+    UserQueryGateway,
+    UserQueryModel,
+)
+from app.application.common.ports.users_version import UsersVersion
+from app.application.common.query_params.cursor_pagination import (
+    CursorPaginationParams,
+)
+from app.application.common.query_params.field_selection import (
+    FieldSelectionParams,
+)
+from app.application.common.query_params.filtering import (
+    UserFilteringParams,
+    UsernameMatch,
+)
+from app.application.common.query_params.offset_pagination import (
+    OffsetPaginationParams,
+    TotalMode,
+)
+from app.application.common.query_params.sorting import SortingOrder, SortingParams
+from app.domain.enums.user_role import UserRole
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.adapters.user_reader_cache import CachedUserReader
+from app.infrastructure.adapters.user_reader_fields import (
+    SELECTABLE_FIELDS,
+    resolve_selected_columns,
+)
+from app.infrastructure.adapters.user_reader_sorting import resolve_sorting_columns
+from app.infrastructure.adapters.users_version_sqla import SqlaUsersVersion
+from app.infrastructure.persistence_sqla.mappings.user import (
+    is_registered,
+    users_table,
+)
+
+log = logging.getLogger(__name__)
+
+# In the order of the Postgres enum, which sorts by it
+ROLES: Final[tuple[UserRole, ...]] = tuple(UserRole)
+ROLE_CODES: Final[Mapping[UserRole, int]] = {
+    role: code for code, role in enumerate(ROLES)
+}
+ID_SIZE: Final[int] = 16
+
+
+class UserDirectoryMetrics(TypedDict):
+    enabled: bool
+    version: int | None
+    users: int
+    approx_bytes: int
+    builds: int
+    last_build_s: float | None
+    served: int
+    served_stale: int
+    fallbacks: int
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class _Order:
+    """
+    Row numbers in one sorting, as runs sharing the value of its leading
+    field; the runs of every sorting but by ID are ordered by username.
+    """
+
+    rows: Sequence[int]
+    runs: tuple[tuple[object, int, int], ...]
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class _Columns:
+    """Users by row number, which follows the username order."""
+
+    ids: bytes
+    usernames: bytes
+    username_bounds: array[int]
+    role_codes: bytes
+    active_flags: bytes
+    orders: Mapping[tuple[str, ...], _Order]
+    # As in the "C" collation, which prefix lookups rely on
+    bytewise_usernames: bool
+
+    @property
+    def size(self) -> int:
+        return len(self.role_codes)
+
+    @property
+    def approx_bytes(self) -> int:
+        return (
+            len(self.ids)
+            + len(self.usernames)
+            + len(self.username_bounds) * self.username_bounds.itemsize
+            + len(self.role_codes)
+            + len(self.active_flags)
+            + sum(
+                len(order.rows) * order.rows.itemsize
+                for order in self.orders.values()
+                if isinstance(order.rows, array)
+            )
+        )
+
+    def username_at(self, row: int) -> bytes:
+        return self.usernames[self.username_bounds[row] : self.username_bounds[row + 1]]
+
+    def build_query_model(self, row: int, keys: Sequence[str]) -> SparseUserQueryModel:
+        values: dict[str, Any] = {}
+        for key in keys:
+            if key == "id_":
+                values[key] = UUID(bytes=self.ids[row * ID_SIZE : (row + 1) * ID_SIZE])
+            elif key == "username":
+                values[key] = self.username_at(row).decode()
+            elif key == "role":
+                values[key] = ROLES[self.role_codes[row]]
+            else:
+                values[key] = bool(self.active_flags[row])
+        return cast(SparseUserQueryModel, values)
+
+
+class _ColumnsLoader:
+    def __init__(self) -> None:
+        self._ids = bytearray()
+        self._usernames = bytearray()
+        self._username_bounds = array("Q", [0])
+        self._role_codes = bytearray()
+        self._active_flags = bytearray()
+        self._id_ranks = array("I")
+        self._last_username = b""
+        self._bytewise_usernames = True
+
+    def extend(self, rows: Sequence[Sequence[Any]]) -> None:
+        """
+        `rows` come in username order, as ID, username, role, activation
+        and the rank of the ID. Column by column: a batch costs a few passes
+        in C rather than a few Python calls per user.
+        """
+        if not rows:
+            return
+        ids, usernames, roles, active_flags, id_ranks = zip(*rows, strict=True)
+        encoded = list(map(str.encode, usernames))
+        if self._bytewise_usernames:
+            self._bytewise_usernames = self._last_username <= encoded[0] and all(
+                map(le, encoded, encoded[1:])
+            )
+        self._last_username = encoded[-1]
+        self._ids += b"".join(map(attrgetter("bytes"), ids))
+        bounds = accumulate(map(len, encoded), initial=len(self._usernames))
+        next(bounds)  # Already the last one
+        self._username_bounds.extend(bounds)
+        self._usernames += b"".join(encoded)
+        self._role_codes.extend(map(ROLE_CODES.__getitem__, roles))
+        self._active_flags.extend(active_flags)
+        self._id_ranks.extend(id_ranks)
+
+    def finish(self) -> _Columns:
+        """Linear in the number of users: no sorting is left to do here."""
+        size = len(self._role_codes)
+        by_id = array("I", bytes(size * 4))
+        for row, rank in enumerate(self._id_ranks):
+            by_id[rank] = row
+        return _Columns(
+            ids=bytes(self._ids),
+            usernames=bytes(self._usernames),
+            username_bounds=self._username_bounds,
+            role_codes=bytes(self._role_codes),
+            active_flags=bytes(self._active_flags),
+            orders={
+                ("id",): _Order(rows=by_id, runs=((None, 0, size),)),
+                ("username",): _Order(rows=range(size), runs=((None, 0, size),)),
+                ("role", "username"): self._group(self._role_codes, ROLES),
+                ("is_active", "username"): self._group(
+                    self._active_flags,
+                    (False, True),
+                ),
+            },
+            bytewise_usernames=self._bytewise_usernames,
+        )
+
+    @staticmethod
+    def _group(codes: bytearray, values: Sequence[object]) -> _Order:
+        """Stable counting sort: each run keeps the username order."""
+        rows = array("I")
+        for code in range(len(values)):
+            rows.extend(compress(range(len(codes)), map(code.__eq__, codes)))
+        counts = [codes.count(code) for code in range(len(values))]
+        starts = [0, *accumulate(counts)]
+        return _Order(
+            rows=rows,
+            runs=tuple(
+                (value, starts[code], starts[code + 1])
+                for code, value in enumerate(values)
+            ),
+        )
+
+
+class UserDirectorySnapshot:
+    """
+    Per-process columnar copy of the user directory, serving offset pages
+    from memory as slices of presorted row orders.
+
+    - Loaded by a streaming scan at startup, tagged with the users version
+      read before it (see `UsersVersion`). The loop only awaits each batch:
+      the columns are built in a worker thread.
+    - A committed user change by any process makes it reload in
+      the background, `refresh_delay_s` later, so that a burst of changes
+      costs one load; loads start at most once per `refresh_interval_s`.
+      Until the newer copy is loaded, pages are served from the older one,
+      tagged with its version. Once a load fails, pages fall back to
+      Postgres until one succeeds.
+    - Pages that are not slices of its row orders fall back too:
+      username substrings, username prefixes sorted by ID or under
+      a collation other than "C", and filters on both role and activation,
+      or on any field the sorting doesn't start with, except for
+      the username sorting.
+
+    Until loaded, and if disabled, every page falls back.
+    """
+
+    LOAD_BATCH_SIZE: ClassVar[Final[int]] = 10_000
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        enabled: bool,
+        refresh_interval_s: float,
+        refresh_delay_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._session_factory = session_factory
+        self._enabled = enabled
+        self._refresh_interval_s = refresh_interval_s
+        self._refresh_delay_s = refresh_delay_s
+        self._clock = clock
+        self._columns: _Columns | None = None
+        self._version: int | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._refresh_started_at = -math.inf
+        self._refresh_failed = False
+        self._builds = 0
+        self._last_build_s: float | None = None
+        self._served = 0
+        self._served_stale = 0
+        self._fallbacks = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def metrics(self) -> UserDirectoryMetrics:
+        """
+        `served`, `served_stale` and `fallbacks` count pages since startup;
+        `served` includes `served_stale`.
+        """
+        return UserDirectoryMetrics(
+            enabled=self._enabled,
+            version=self._version,
+            users=self._columns.size if self._columns else 0,
+            approx_bytes=self._columns.approx_bytes if self._columns else 0,
+            builds=self._builds,
+            last_build_s=self._last_build_s,
+            served=self._served,
+            served_stale=self._served_stale,
+            fallbacks=self._fallbacks,
+        )
+
+    async def load(self) -> None:
+        """
+        :raises DataMapperError:
+        :raises SQLAlchemyError:
+        """
+        started_at = self._clock()
+        stmt = (
+            select(
+                users_table.c.id,
+                users_table.c.username,
+                users_table.c.role,
+                users_table.c.is_active,
+                (func.row_number().over(order_by=users_table.c.id) - 1).label(
+                    "id_rank"
+                ),
+            )
+            .where(is_registered)
+            .order_by(users_table.c.username)
+            .execution_options(yield_per=self.LOAD_BATCH_SIZE)
+        )
+        loader = _ColumnsLoader()
+        async with self._session_factory() as session:
+            # Read first: changes the scan misses are then newer than it
+            version = await SqlaUsersVersion(cast(MainAsyncSession, session)).read()
+            result = await session.stream(stmt)
+            async for rows in result.partitions():
+                await asyncio.to_thread(loader.extend, rows)
+        columns = await asyncio.to_thread(loader.finish)
+        if self._version is None or version > self._version:
+            self._columns, self._version = columns, version
+        self._builds += 1
+        self._last_build_s = self._clock() - started_at
+        log.debug("User directory loaded: %s", self.metrics)
+
+    async def close(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+
+    def read_page(
+        self,
+        version: int,
+        pagination: OffsetPaginationParams,
+        sorting: SortingParams,
+        filtering: UserFilteringParams | None = None,
+        field_selection: FieldSelectionParams | None = None,
+    ) -> ListUsersQM | None:
+        """
+        :raises SortingError:
+        :raises FieldSelectionError:
+
+        `None` if the page must be read from Postgres. The total is exact.
+        A page of an older copy, served while a newer one loads, carries
+        the users version it reflects.
+        """
+        fields = tuple(col.name for col in resolve_sorting_columns(sorting))
+        keys = [
+            SELECTABLE_FIELDS[col.name]
+            for col in resolve_selected_columns(field_selection)
+        ]
+        columns, columns_version = self._columns, self._version
+        if columns is None or columns_version is None or columns_version < version:
+            self._schedule_refresh()
+        if (
+            columns is None
+            or columns_version is None
+            # Read before the last load, or stale since the last one failed
+            or columns_version > version
+            or (columns_version < version and self._refresh_failed)
+        ):
+            self._fallbacks += 1
+            return None
+        runs = self._find_runs(columns, fields, filtering or UserFilteringParams())
+        if runs is None:
+            self._fallbacks += 1
+            return None
+        order, bounds = runs
+        rows = self._slice(
+            order,
+            bounds,
+            pagination,
+            ascending=sorting.order == SortingOrder.ASC,
+        )
+        self._served += 1
+        page = ListUsersQM(
+            users=[columns.build_query_model(row, keys) for row in rows],
+            total=sum(stop - start for start, stop in bounds),
+            total_mode=TotalMode.EXACT,
+        )
+        if columns_version < version:
+            self._served_stale += 1
+            page["as_of_users_version"] = columns_version
+        return page
+
+    @staticmethod
+    def _find_runs(
+        columns: _Columns,
+        fields: tuple[str, ...],
+        filtering: UserFilteringParams,
+    ) -> tuple[_Order, list[tuple[int, int]]] | None:
+        """Bounds of the matching rows in the order of `fields`."""
+        filters = {
+            field: value
+            for field, value in (
+                ("role", filtering.role),
+                ("is_active", filtering.is_active),
+            )
+            if value is not None
+        }
+        if fields == ("username",) and len(filters) == 1:
+            # A run of another order has the same one
+            fields = (*filters, "username")
+        if set(filters) - {fields[0]}:
+            return None
+        order = columns.orders[fields]
+        runs = [
+            (start, stop)
+            for value, start, stop in order.runs
+            if filters.get(fields[0], value) == value
+        ]
+        if filtering.username is None:
+            return order, runs
+        if (
+            filtering.username_match != UsernameMatch.PREFIX
+            or fields == ("id",)
+            or not columns.bytewise_usernames
+        ):
+            return None
+
+        # No UTF-8 byte is 0xFF: all that start with the prefix sort below it
+        prefix = filtering.username.encode()
+        bounds = []
+        for start, stop in runs:
+            low = bisect_left(order.rows, prefix, start, stop, key=columns.username_at)
+            high = bisect_left(
+                order.rows,
+                prefix + b"\xff",
+                low,
+                stop,
+                key=columns.username_at,
+            )
+            bounds.append((low, high))
+        return order, bounds
+
+    @staticmethod
+    def _slice(
+        order: _Order,
+        bounds: list[tuple[int, int]],
+        pagination: OffsetPaginationParams,
+        *,
+        ascending: bool,
+    ) -> list[int]:
+        offset = pagination.offset
+        rows: list[int] = []
+        for start, stop in bounds if ascending else reversed(bounds):
+            if offset >= stop - start:
+                offset -= stop - start
+                continue
+            wanted = pagination.limit - len(rows)
+            if ascending:
+                rows.extend(
+                    order.rows[start + offset : min(start + offset + wanted, stop)]
+                )
+            else:
+                high = stop - offset
+                rows.extend(reversed(order.rows[max(high - wanted, start) : high]))
+            offset = 0
+            if len(rows) == pagination.limit:
+                break
+        return rows
+
+    def _schedule_refresh(self) -> None:
+        """Changes seen until the refresh starts are all loaded by it."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        delay = max(
+            self._refresh_delay_s,
+            self._refresh_started_at + self._refresh_interval_s - self._clock(),
+        )
+        self._refresh_task = asyncio.create_task(self._refresh(delay))
+
+    async def _refresh(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._refresh_started_at = self._clock()
+        try:
+            await self.load()
+        except Exception:
+            self._refresh_failed = True
+            log.exception("User directory load failed.")
+        else:
+            self._refresh_failed = False
+
+
+class SnapshotUserReader(UserQueryGateway):
+    """
+    Serves offset pages from `UserDirectorySnapshot` when it can,
+    and everything else through the cached reader.
+    """
+
+    def __init__(
+        self,
+        reader: CachedUserReader,
+        snapshot: UserDirectorySnapshot,
+        users_version: UsersVersion,
+    ) -> None:
+        self._reader = reader
+        self._snapshot = snapshot
+        self._users_version = users_version
+
+    async def read_all(
+        self,
+        pagination: OffsetPaginationParams,
+        sorting: SortingParams,
+        total_mode: TotalMode = TotalMode.EXACT,
+        filtering: UserFilteringParams | None = None,
+        field_selection: FieldSelectionParams | None = None,
+    ) -> ListUsersQM:
+        """
+        :raises DataMapperError:
+        :raises SortingError:
+        :raises FieldSelectionError:
+        :raises ReaderError:
+        """
+        if self._snapshot.enabled:
+            page = self._snapshot.read_page(
+                await self._users_version.read(),
+                pagination,
+                sorting,
+                filtering,
+                field_selection,
+            )
+            if page is not None:
+                return page
+        return await self._reader.read_all(
+            pagination,
+            sorting,
+            total_mode,
+            filtering,
+            field_selection,
+        )
+
+    async def read_all_by_cursor(
+        self,
+        pagination: CursorPaginationParams,
+        sorting: SortingParams,
+        filtering: UserFilteringParams | None = None,
+        field_selection: FieldSelectionParams | None = None,
+    ) -> ListUsersCursorQM:
+        """
+        :raises DataMapperError:
+        :raises PaginationError:
+        :raises SortingError:
+        :raises FieldSelectionError:
+        :raises ReaderError:
+        """
+        return await self._reader.read_all_by_cursor(
+            pagination,
+            sorting,
+            filtering,
+            field_selection,
+        )
+
+    async def stream_all(self, sorting: SortingParams) -> AsyncIterator[UserQueryModel]:
+        """
+        :raises SortingError:
+        :raises ReaderError:
+        """
+        return await self._reader.stream_all(sorting)
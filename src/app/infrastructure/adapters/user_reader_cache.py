@@ -0,0 +1,214 @@
+import math
+import sys
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, TypedDict
+
+from app.application.common.ports.user_query_gateway import (
+    ListUsersCursorQM,
+    ListUsersQM,
+    UserQueryGateway,
+    UserQueryModel,
+)
+from app.application.common.ports.users_version import UsersVersion
+from app.application.common.query_params.cursor_pagination import (
+    CursorPaginationParams,
+)
+from app.application.common.query_params.field_selection import (
+    FieldSelectionParams,
+)
+from app.application.common.query_params.filtering import UserFilteringParams
+from app.application.common.query_params.offset_pagination import (
+    OffsetPaginationParams,
+    TotalMode,
+)
+from app.application.common.query_params.sorting import SortingParams
+from app.infrastructure.adapters.single_flight import Flight, SingleFlightCache
+from app.infrastructure.adapters.user_reader_sqla import SqlaUserReader
+
+
+class UserQueryCacheMetrics(TypedDict):
+    entries: int
+    approx_bytes: int
+    hits: int
+    coalesced: int
+    misses: int
+    hit_ratio: float | None
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class _Entry(Flight):
+    version: int
+
+
+class UserQueryCache:
+    """
+    Per-process results of user list queries, keyed by their parameters
+    and by the users version they were read at: any committed user change,
+    made by any process, leaves older results unreachable. Entries also
+    expire after `ttl_s`, for changes made outside the application.
+
+    - Concurrent misses of a query share one read (single-flight),
+      including its error; a cancelled read is retried by the next caller.
+    - Failed reads are not kept.
+    - At most `max_entries` are kept, least recently used evicted first;
+      entries of older versions go once a newer one is stored.
+
+    Results are shared between callers, so they must not be modified.
+    """
+
+    def __init__(
+        self,
+        ttl_s: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._flights: SingleFlightCache[tuple[int, Hashable], _Entry] = (
+            SingleFlightCache(
+                name="User query cache",
+                ttl_s=ttl_s,
+                max_entries=max_entries,
+                clock=clock,
+                refresh_on_hit=True,
+                measure=estimate_result_size,
+            )
+        )
+        self._latest_version = -math.inf
+        self._hits = 0
+        self._coalesced = 0
+        self._misses = 0
+
+    @property
+    def metrics(self) -> UserQueryCacheMetrics:
+        """
+        `approx_bytes` is the size of the stored results, shared objects
+        counted for each of them. Callers joining a read in flight are
+        `coalesced`, and count as hits in `hit_ratio`.
+        """
+        served = self._hits + self._coalesced
+        lookups = served + self._misses
+        return UserQueryCacheMetrics(
+            entries=len(self._flights),
+            approx_bytes=self._flights.size,
+            hits=self._hits,
+            coalesced=self._coalesced,
+            misses=self._misses,
+            hit_ratio=served / lookups if lookups else None,
+        )
+
+    async def get_or_read[T](
+        self,
+        key: Hashable,
+        version: int,
+        read: Callable[[], Awaitable[T]],
+    ) -> T:
+        result, _ = await self._flights.get_or_run(
+            (version, key),
+            read,
+            create=partial(self._create_entry, version),
+            on_found=self._count_found,
+        )
+        return result
+
+    def _create_entry(self, version: int) -> _Entry:
+        self._misses += 1
+        if version > self._latest_version:
+            self._latest_version = version
+            self._flights.forget_done(lambda entry: entry.version < version)
+        return _Entry(version=version)
+
+    def _count_found(self, entry: _Entry) -> None:
+        if entry.outcome.done():
+            self._hits += 1
+        else:
+            self._coalesced += 1
+
+
+def estimate_result_size(result: Any) -> int:
+    """Shallow sizes of a list result, its users and their values."""
+    users = result["users"]
+    size = sys.getsizeof(result) + sys.getsizeof(users)
+    for user in users:
+        size += sys.getsizeof(user) + sum(map(sys.getsizeof, user.values()))
+    return size
+
+
+class CachedUserReader(UserQueryGateway):
+    """
+    Serves user lists through `UserQueryCache`, at the users version
+    of the request. Streams are never cached.
+    """
+
+    def __init__(
+        self,
+        reader: SqlaUserReader,
+        cache: UserQueryCache,
+        users_version: UsersVersion,
+    ) -> None:
+        self._reader = reader
+        self._cache = cache
+        self._users_version = users_version
+
+    async def read_all(
+        self,
+        pagination: OffsetPaginationParams,
+        sorting: SortingParams,
+        total_mode: TotalMode = TotalMode.EXACT,
+        filtering: UserFilteringParams | None = None,
+        field_selection: FieldSelectionParams | None = None,
+    ) -> ListUsersQM:
+        """
+        :raises DataMapperError:
+        :raises SortingError:
+        :raises FieldSelectionError:
+        :raises ReaderError:
+        """
+        filtering = filtering or UserFilteringParams()
+        return await self._cache.get_or_read(
+            (pagination, sorting, total_mode, filtering, field_selection),
+            await self._users_version.read(),
+            partial(
+                self._reader.read_all,
+                pagination,
+                sorting,
+                total_mode,
+                filtering,
+                field_selection,
+            ),
+        )
+
+    async def read_all_by_cursor(
+        self,
+        pagination: CursorPaginationParams,
+        sorting: SortingParams,
+        filtering: UserFilteringParams | None = None,
+        field_selection: FieldSelectionParams | None = None,
+    ) -> ListUsersCursorQM:
+        """
+        :raises DataMapperError:
+        :raises PaginationError:
+        :raises SortingError:
+        :raises FieldSelectionError:
+        :raises ReaderError:
+        """
+        filtering = filtering or UserFilteringParams()
+        return await self._cache.get_or_read(
+            (pagination, sorting, filtering, field_selection),
+            await self._users_version.read(),
+            partial(
+                self._reader.read_all_by_cursor,
+                pagination,
+                sorting,
+                filtering,
+                field_selection,
+            ),
+        )
+
+    async def stream_all(self, sorting: SortingParams) -> AsyncIterator[UserQueryModel]:
+        """
+        :raises SortingError:
+        :raises ReaderError:
+        """
+        return await self._reader.stream_all(sorting)
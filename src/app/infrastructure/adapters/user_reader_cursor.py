@@ -0,0 +1,62 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Self
+
+from sqlalchemy import Column
+
+from app.application.common.exceptions.query import PaginationError
+from app.application.common.query_params.sorting import SortingParams
+
+INVALID_CURSOR = "Invalid cursor."
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserListCursor:
+    """
+    Position after the last user of a page: the values of its sorting
+    columns. Encoded as unpadded URL-safe base64 of JSON. The sorting it
+    was issued for is included, so it can't be replayed with another one.
+    """
+
+    sorting: SortingParams
+    values: tuple[Any, ...]
+
+    def encode(self) -> str:
+        payload = [
+            list(self.sorting.fields),
+            self.sorting.order.value,
+            [
+                value if isinstance(value, bool | int | str) else str(value)
+                for value in self.values
+            ],
+        ]
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    @classmethod
+    def decode(
+        cls,
+        cursor: str,
+        sorting: SortingParams,
+        columns: Sequence[Column[Any]],
+    ) -> Self:
+        """:raises PaginationError:"""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            fields, order, values = json.loads(raw)
+            if (fields, order) != (list(sorting.fields), sorting.order.value):
+                raise PaginationError(f"{INVALID_CURSOR} Sorting has changed.")
+            if len(values) != len(columns):
+                raise PaginationError(INVALID_CURSOR)
+            decoded = []
+            for column, value in zip(columns, values, strict=True):
+                python_type = column.type.python_type
+                if python_type in {bool, str} and not isinstance(value, python_type):
+                    raise PaginationError(INVALID_CURSOR)
+                decoded.append(python_type(value))
+            return cls(sorting=sorting, values=tuple(decoded))
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as err:
+            raise PaginationError(INVALID_CURSOR) from err
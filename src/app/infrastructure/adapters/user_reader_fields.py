@@ -0,0 +1,54 @@
+from collections.abc import Mapping, Sequence
+from typing import Any, Final, cast
+
+from sqlalchemy import Column
+
+from app.application.common.exceptions.query import FieldSelectionError
+from app.application.common.ports.user_query_gateway import (
+    SparseUserQueryModel,
+)
+from app.application.common.query_params.field_selection import (
+    FieldSelectionParams,
+)
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+
+# Keys of `UserQueryModel` by selectable field.
+# Every covering index of the users mapping includes all of them.
+SELECTABLE_FIELDS: Final[Mapping[str, str]] = {
+    "id": "id_",
+    "username": "username",
+    "role": "role",
+    "is_active": "is_active",
+}
+
+
+def resolve_selected_columns(
+    selection: FieldSelectionParams | None,
+) -> tuple[Column[Any], ...]:
+    """
+    :raises FieldSelectionError:
+
+    All selectable fields without a selection.
+    """
+    if selection is None:
+        return tuple(users_table.c[field] for field in SELECTABLE_FIELDS)
+    unknown = [field for field in selection.fields if field not in SELECTABLE_FIELDS]
+    if unknown:
+        raise FieldSelectionError(
+            f"Invalid fields: '{','.join(unknown)}'."
+            f" Supported: {', '.join(SELECTABLE_FIELDS)}."
+        )
+    return tuple(users_table.c[field] for field in selection.fields)
+
+
+def build_query_models(
+    rows: Sequence[Sequence[Any]],
+    selected_cols: tuple[Column[Any], ...],
+) -> list[SparseUserQueryModel]:
+    """The selected columns must lead each row; the rest is left out."""
+    keys = [SELECTABLE_FIELDS[col.name] for col in selected_cols]
+    size = len(keys)
+    return [
+        cast(SparseUserQueryModel, dict(zip(keys, row[:size], strict=True)))
+        for row in rows
+    ]
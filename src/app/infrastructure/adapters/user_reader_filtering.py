@@ -0,0 +1,52 @@
+from sqlalchemy import ColumnElement, bindparam
+
+from app.application.common.query_params.filtering import (
+    UserFilteringParams,
+    UsernameMatch,
+)
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+
+
+def build_filter_conditions(
+    filtering: UserFilteringParams | None,
+) -> list[ColumnElement[bool]]:
+    """
+    Each condition is backed by an index in the users mapping:
+    a prefix by the `text_pattern_ops` one, a substring by the trigram one,
+    role and activation by the sorting and partial ones.
+    Wildcards in the filter values match literally.
+    """
+    conditions: list[ColumnElement[bool]] = []
+    if filtering is None:
+        return conditions
+    if filtering.username is not None:
+        username = escape_like(filtering.username)
+        pattern = (
+            f"{username}%"
+            if filtering.username_match == UsernameMatch.PREFIX
+            else f"%{username}%"
+        )
+        # Inlined: planned with a parameter, as a prepared statement may be,
+        # the pattern gives no index bounds and every username gets scanned
+        conditions.append(
+            users_table.c.username.like(
+                bindparam("username_pattern", pattern, literal_execute=True)
+            )
+        )
+    # Inlined too, so the planner can match the partial indexes' predicates
+    if filtering.role is not None:
+        conditions.append(
+            users_table.c.role
+            == bindparam("role", filtering.role, literal_execute=True)
+        )
+    if filtering.is_active is not None:
+        conditions.append(
+            users_table.c.is_active
+            == bindparam("is_active", filtering.is_active, literal_execute=True)
+        )
+    return conditions
+
+
+def escape_like(value: str) -> str:
+    """For the default `LIKE` escape character, the backslash."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
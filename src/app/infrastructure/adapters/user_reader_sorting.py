@@ -0,0 +1,34 @@
+from typing import Any, Final
+
+from sqlalchemy import Column
+
+from app.application.common.exceptions.query import SortingError
+from app.application.common.query_params.sorting import SortingParams
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+
+# Each ends with a unique field, so the order is total, and has a covering
+# index in the users mapping, so pages are read by index-only scans.
+SORTABLE_FIELDS: Final[tuple[tuple[str, ...], ...]] = (
+    ("id",),
+    ("username",),
+    ("role", "username"),
+    ("is_active", "username"),
+)
+
+
+def resolve_sorting_columns(sorting: SortingParams) -> tuple[Column[Any], ...]:
+    """
+    :raises SortingError:
+
+    The requested fields must start one of `SORTABLE_FIELDS`, which is then
+    used in full: sorting by role orders each role by username.
+    """
+    size = len(sorting.fields)
+    for fields in SORTABLE_FIELDS:
+        if fields[:size] == sorting.fields:
+            return tuple(users_table.c[field] for field in fields)
+    supported = ", ".join(",".join(fields) for fields in SORTABLE_FIELDS)
+    raise SortingError(
+        f"Invalid sorting fields: '{','.join(sorting.fields)}'."
+        f" Supported: {supported} or their prefixes."
+    )
@@ -1,59 +1,225 @@
 import logging
+from collections.abc import AsyncIterator
+from typing import Any, ClassVar, Final
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, func, literal, select, text, tuple_
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncResult
 
-from app.application.common.exceptions.query import SortingError
 from app.application.common.ports.user_query_gateway import (
+    ListUsersCursorQM,
     ListUsersQM,
     UserQueryGateway,
     UserQueryModel,
 )
-from app.application.common.query_params.offset_pagination import OffsetPaginationParams
+from app.application.common.query_params.cursor_pagination import (
+    CursorPaginationParams,
+)
+from app.application.common.query_params.field_selection import (
+    FieldSelectionParams,
+)
+from app.application.common.query_params.filtering import UserFilteringParams
+from app.application.common.query_params.offset_pagination import (
+    OffsetPaginationParams,
+    TotalMode,
+)
 from app.application.common.query_params.sorting import SortingOrder, SortingParams
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
 from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.adapters.user_count_cache import InMemoryUserCountCache
+from app.infrastructure.adapters.user_reader_cursor import UserListCursor
+from app.infrastructure.adapters.user_reader_fields import (
+    build_query_models,
+    resolve_selected_columns,
+)
+from app.infrastructure.adapters.user_reader_filtering import (
+    build_filter_conditions,
+)
+from app.infrastructure.adapters.user_reader_sorting import resolve_sorting_columns
 from app.infrastructure.exceptions.gateway import ReaderError
-from app.infrastructure.persistence_sqla.mappings.user import users_table
+from app.infrastructure.persistence_sqla.expressions import ExplainJson
+from app.infrastructure.persistence_sqla.mappings.user import (
+    is_registered,
+    users_table,
+)
 
 log = logging.getLogger(__name__)
 
+# Scaled to the current table size, as the planner does
+USERS_ROW_ESTIMATE = text("""
+    SELECT reltuples / relpages
+        * (pg_relation_size(oid) / current_setting('block_size')::integer)
+    FROM pg_class
+    WHERE oid = to_regclass(:table_name) AND reltuples >= 0 AND relpages > 0
+""")
+
 
 class SqlaUserReader(UserQueryGateway):
-    def __init__(self, session: MainAsyncSession) -> None:
+    STREAM_BATCH_SIZE: ClassVar[Final[int]] = 1_000
+
+    def __init__(
+        self,
+        session: MainAsyncSession,
+        user_count_cache: InMemoryUserCountCache,
+    ) -> None:
         self._session = session
+        self._user_count_cache = user_count_cache
 
     async def read_all(
         self,
         pagination: OffsetPaginationParams,
         sorting: SortingParams,
+        total_mode: TotalMode = TotalMode.EXACT,
+        filtering: UserFilteringParams | None = None,
+        field_selection: FieldSelectionParams | None = None,
     ) -> ListUsersQM:
         """
         :raises SortingError:
+        :raises FieldSelectionError:
         :raises ReaderError:
         """
-        sorting_col = users_table.c.get(sorting.field)
-        if sorting_col is None:
-            raise SortingError(f"Invalid sorting field: '{sorting.field}'")
-
-        order_by = (
-            sorting_col.asc()
-            if sorting.order == SortingOrder.ASC
-            else sorting_col.desc()
+        sorting_cols = resolve_sorting_columns(sorting)
+        selected_cols = resolve_selected_columns(field_selection)
+        ascending = sorting.order == SortingOrder.ASC
+        filtering = filtering or UserFilteringParams()
+        conditions = build_filter_conditions(filtering)
+        if total_mode == TotalMode.CACHED and filtering.username is not None:
+            # Users are counted by role and activation only
+            total_mode = TotalMode.EXACT
+
+        stmt = (
+            select(*selected_cols)
+            .where(is_registered, *conditions)
+            .order_by(*(col.asc() if ascending else col.desc() for col in sorting_cols))
+            .limit(pagination.limit)
+            .offset(pagination.offset)
         )
+        if total_mode == TotalMode.EXACT:
+            # Counts every matching user, so the page costs scanning them all
+            stmt = stmt.add_columns(func.count().over().label("total"))
+
+        try:
+            result = await self._session.execute(stmt)
+            rows = result.all()
+        except SQLAlchemyError as err:
+            raise ReaderError(DB_QUERY_FAILED) from err
 
+        users = build_query_models(rows, selected_cols)
+        if total_mode == TotalMode.EXACT:
+            total = rows[0].total if rows else 0
+        else:
+            total, total_mode = await self._read_total(
+                total_mode,
+                filtering,
+                conditions,
+            )
+        return ListUsersQM(users=users, total=total, total_mode=total_mode)
+
+    async def _read_total(
+        self,
+        total_mode: TotalMode,
+        filtering: UserFilteringParams,
+        conditions: list[ColumnElement[bool]],
+    ) -> tuple[int, TotalMode]:
+        """:raises ReaderError:"""
+        if total_mode == TotalMode.CACHED:
+            total = self._user_count_cache.get_total(
+                role=filtering.role,
+                is_active=filtering.is_active,
+            )
+            if total is not None:
+                return total, TotalMode.CACHED
+        elif conditions:
+            return await self._estimate_matches(conditions), TotalMode.ESTIMATED
+        else:
+            try:
+                estimate = (
+                    await self._session.execute(
+                        USERS_ROW_ESTIMATE,
+                        {"table_name": users_table.name},
+                    )
+                ).scalar_one_or_none()
+            except SQLAlchemyError as err:
+                raise ReaderError(DB_QUERY_FAILED) from err
+            if estimate is not None:
+                return round(estimate), TotalMode.ESTIMATED
+
+        # Expired cache or a table never analyzed: count, and cache the counts
         stmt = (
             select(
-                users_table.c.id,
-                users_table.c.username,
                 users_table.c.role,
                 users_table.c.is_active,
-                func.count().over().label("total"),
+                func.count().label("total"),
             )
-            .order_by(order_by)
-            .limit(pagination.limit)
-            .offset(pagination.offset)
+            .where(is_registered)
+            .group_by(users_table.c.role, users_table.c.is_active)
         )
+        try:
+            rows = (await self._session.execute(stmt)).all()
+        except SQLAlchemyError as err:
+            raise ReaderError(DB_QUERY_FAILED) from err
+        self._user_count_cache.store({
+            (row.role, row.is_active): row.total for row in rows
+        })
+        total = sum(
+            row.total
+            for row in rows
+            if filtering.role in {None, row.role}
+            and filtering.is_active in {None, row.is_active}
+        )
+        return total, TotalMode.EXACT
+
+    async def _estimate_matches(self, conditions: list[ColumnElement[bool]]) -> int:
+        """
+        :raises ReaderError:
+
+        The planner's row estimate, from the column statistics:
+        the query is planned but not run.
+        """
+        stmt = ExplainJson(select(users_table.c.id).where(is_registered, *conditions))
+        try:
+            plan = (await self._session.execute(stmt)).scalar_one()
+        except SQLAlchemyError as err:
+            raise ReaderError(DB_QUERY_FAILED) from err
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def read_all_by_cursor(
+        self,
+        pagination: CursorPaginationParams,
+        sorting: SortingParams,
+        filtering: UserFilteringParams | None = None,
+        field_selection: FieldSelectionParams | None = None,
+    ) -> ListUsersCursorQM:
+        """
+        :raises PaginationError:
+        :raises SortingError:
+        :raises FieldSelectionError:
+        :raises ReaderError:
+        """
+        sorting_cols = resolve_sorting_columns(sorting)
+        selected_cols = resolve_selected_columns(field_selection)
+        ascending = sorting.order == SortingOrder.ASC
+
+        # Sorting values come after the selected ones, for the next cursor
+        selected = {col.name for col in selected_cols}
+        cursor_cols = [col for col in sorting_cols if col.name not in selected]
+        stmt = (
+            select(*selected_cols, *cursor_cols)
+            .where(is_registered, *build_filter_conditions(filtering))
+            .order_by(*(col.asc() if ascending else col.desc() for col in sorting_cols))
+            .limit(pagination.limit + 1)
+        )
+        if pagination.cursor is not None:
+            cursor = UserListCursor.decode(pagination.cursor, sorting, sorting_cols)
+            position = tuple_(
+                *(
+                    literal(value, col.type)
+                    for col, value in zip(sorting_cols, cursor.values, strict=True)
+                )
+            )
+            # Row comparison, so the covering index can seek to it
+            keys = tuple_(*sorting_cols)
+            stmt = stmt.where(keys > position if ascending else keys < position)
 
         try:
             result = await self._session.execute(stmt)
@@ -61,17 +227,59 @@ class SqlaUserReader(UserQueryGateway):
         except SQLAlchemyError as err:
             raise ReaderError(DB_QUERY_FAILED) from err
 
-        if not rows:
-            return ListUsersQM(users=[], total=0)
+        next_cursor = None
+        if len(rows) > pagination.limit:
+            rows = rows[: pagination.limit]
+            last = rows[-1]
+            next_cursor = UserListCursor(
+                sorting=sorting,
+                values=tuple(getattr(last, col.name) for col in sorting_cols),
+            ).encode()
+
+        users = build_query_models(rows, selected_cols)
+        return ListUsersCursorQM(users=users, next_cursor=next_cursor)
 
-        users = [
-            UserQueryModel(
-                id_=row.id,
-                username=row.username,
-                role=row.role,
-                is_active=row.is_active,
+    async def stream_all(self, sorting: SortingParams) -> AsyncIterator[UserQueryModel]:
+        """
+        :raises SortingError:
+        :raises ReaderError:
+        """
+        sorting_cols = resolve_sorting_columns(sorting)
+        ascending = sorting.order == SortingOrder.ASC
+
+        stmt = (
+            select(
+                users_table.c.id,
+                users_table.c.username,
+                users_table.c.role,
+                users_table.c.is_active,
             )
-            for row in rows
-        ]
-        total = rows[0].total
-        return ListUsersQM(users=users, total=total)
+            .where(is_registered)
+            .order_by(*(col.asc() if ascending else col.desc() for col in sorting_cols))
+            .execution_options(yield_per=self.STREAM_BATCH_SIZE)
+        )
+
+        try:
+            # Server-side cursor: a batch is fetched only once consumed
+            result = await self._session.stream(stmt)
+        except SQLAlchemyError as err:
+            raise ReaderError(DB_QUERY_FAILED) from err
+        return self._iter_users(result)
+
+    async def _iter_users(
+        self,
+        result: AsyncResult[Any],
+    ) -> AsyncIterator[UserQueryModel]:
+        """:raises ReaderError:"""
+        try:
+            async for row in result:
+                yield UserQueryModel(
+                    id_=row.id,
+                    username=row.username,
+                    role=row.role,
+                    is_active=row.is_active,
+                )
+        except SQLAlchemyError as err:
+            raise ReaderError(DB_QUERY_FAILED) from err
+        finally:
+            await result.close()
@@ -0,0 +1,238 @@
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import struct
+import time
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from typing import ClassVar, Final, Self, TypedDict
+from uuid import UUID
+
+log = logging.getLogger(__name__)
+
+type UsernameStream = Callable[[UUID], AsyncIterator[str]]
+
+
+class UsernameFilterMetrics(TypedDict):
+    enabled: bool
+    ready: bool
+    size_bits: int
+    hash_count: int
+    usernames_added: int
+    skipped_usernames: int
+    false_positives: int
+    false_positive_rate: float | None
+    estimated_false_positive_rate: float
+    refreshes: int
+
+
+class UsernameBloomFilter:
+    """
+    Per-process Bloom filter of existing usernames, consulted only by bulk
+    user creation: usernames it has never seen are not looked up before
+    inserting them. Other paths insert or query directly, so a disabled
+    filter holds nothing and answers "maybe" to every username.
+
+    - Built from a streaming scan of all usernames, or from a snapshot
+      file plus a scan of users created after it.
+    - Usernames reserved by this process are added immediately.
+      Those created by other processes are picked up by a catch-up scan
+      of recent user IDs (UUIDv7, so time-ordered), which a miss triggers
+      when the last one is older than `refresh_interval_s`.
+      Concurrent misses share one scan.
+    - Until the first scan succeeds, every username may exist.
+
+    Usernames are never removed; a stale entry only costs a query.
+    Between catch-up scans, usernames created by other processes are
+    missed: inserting them then fails on the unique username instead.
+    """
+
+    SNAPSHOT_TRAILER: ClassVar[Final[struct.Struct]] = struct.Struct("<4sQIQq")
+    SNAPSHOT_MAGIC: ClassVar[Final[bytes]] = b"UBF1"
+    # Users committed late or by a node with a lagging clock carry older IDs
+    CATCH_UP_LAG_MS: ClassVar[Final[int]] = 60_000
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        capacity: int,
+        false_positive_rate: float,
+        refresh_interval_s: float,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        size_bits = (
+            math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2 / 8)
+            * 8
+        )
+        self._size_bits = max(size_bits, 8)
+        self._hash_count = max(round(self._size_bits / capacity * math.log(2)), 1)
+        self._enabled = enabled
+        self._bits = bytearray(self._size_bits // 8 if enabled else 0)
+        self._refresh_interval_s = refresh_interval_s
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._refresh_lock = asyncio.Lock()
+        self._synced_until_ms: int | None = None
+        self._refreshed_at = -math.inf
+        self._usernames_added = 0
+        self._skipped_usernames = 0
+        self._false_positives = 0
+        self._refreshes = 0
+
+    @property
+    def metrics(self) -> UsernameFilterMetrics:
+        """
+        `skipped_usernames` were not looked up. `false_positive_rate` is
+        observed: false positives among checked usernames that do not
+        exist. The estimate follows from the number of usernames added
+        and the filter size.
+        """
+        absent_lookups = self._false_positives + self._skipped_usernames
+        load = self._hash_count * self._usernames_added / self._size_bits
+        return UsernameFilterMetrics(
+            enabled=self._enabled,
+            ready=self._synced_until_ms is not None,
+            size_bits=self._size_bits,
+            hash_count=self._hash_count,
+            usernames_added=self._usernames_added,
+            skipped_usernames=self._skipped_usernames,
+            false_positives=self._false_positives,
+            false_positive_rate=(
+                self._false_positives / absent_lookups if absent_lookups else None
+            ),
+            estimated_false_positive_rate=(1 - math.exp(-load)) ** self._hash_count,
+            refreshes=self._refreshes,
+        )
+
+    async def might_contain(self, username: str, stream: UsernameStream) -> bool:
+        """`stream` yields usernames of users with IDs from the given one."""
+        if not self._enabled or self._synced_until_ms is None:
+            return True
+        positions = self._positions(username)
+        if self._contains(positions):
+            return True
+        if self._clock() - self._refreshed_at >= self._refresh_interval_s:
+            await self.refresh(stream)
+            if self._contains(positions):
+                return True
+        self._skipped_usernames += 1
+        return False
+
+    def record_false_positive(self) -> None:
+        if self._synced_until_ms is not None:
+            self._false_positives += 1
+
+    def add(self, username: str) -> None:
+        if not self._enabled:
+            return
+        added = False
+        for position in self._positions(username):
+            index, mask = position >> 3, 1 << (position & 7)
+            if not self._bits[index] & mask:
+                self._bits[index] |= mask
+                added = True
+        self._usernames_added += added
+
+    async def refresh(self, stream: UsernameStream) -> None:
+        """Adds usernames of users created since the last scan."""
+        started_at = self._clock()
+        async with self._refresh_lock:
+            if self._refreshed_at >= started_at:
+                return  # Someone else scanned while we waited
+            scan_started_at = self._clock()
+            synced_until_ms = int(self._wall_clock() * 1000)
+            since_ms = (
+                0
+                if self._synced_until_ms is None
+                else max(self._synced_until_ms - self.CATCH_UP_LAG_MS, 0)
+            )
+            async for username in stream(UUID(int=since_ms << 80)):
+                self.add(username)
+            self._synced_until_ms = synced_until_ms
+            self._refreshed_at = scan_started_at
+            self._refreshes += 1
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        path: str,
+        *,
+        capacity: int,
+        false_positive_rate: float,
+        refresh_interval_s: float,
+    ) -> Self:
+        """
+        The snapshot is read into memory, so the file is not held open
+        and can be replaced on shutdown, even on Windows. A missing or
+        incompatible snapshot yields an empty filter, to be built by
+        a full scan.
+        """
+        bloom_filter = cls(
+            enabled=True,
+            capacity=capacity,
+            false_positive_rate=false_positive_rate,
+            refresh_interval_s=refresh_interval_s,
+        )
+        try:
+            with open(path, "rb") as file:
+                snapshot = file.read()
+        except OSError as err:
+            log.info("Username filter snapshot not loaded: %s", err)
+            return bloom_filter
+
+        bits_len = bloom_filter._size_bits // 8
+        if len(snapshot) != bits_len + cls.SNAPSHOT_TRAILER.size:
+            log.warning("Username filter snapshot is incompatible, ignoring it.")
+            return bloom_filter
+        magic, size_bits, hash_count, usernames_added, synced_until_ms = (
+            cls.SNAPSHOT_TRAILER.unpack_from(snapshot, bits_len)
+        )
+        if (magic, size_bits, hash_count) != (
+            cls.SNAPSHOT_MAGIC,
+            bloom_filter._size_bits,
+            bloom_filter._hash_count,
+        ):
+            log.warning("Username filter snapshot is incompatible, ignoring it.")
+            return bloom_filter
+
+        bloom_filter._bits[:] = memoryview(snapshot)[:bits_len]
+        bloom_filter._usernames_added = usernames_added
+        bloom_filter._synced_until_ms = synced_until_ms
+        return bloom_filter
+
+    def save_snapshot(self, path: str) -> None:
+        """
+        :raises OSError:
+
+        Written atomically, so readers never load a partial snapshot.
+        """
+        if self._synced_until_ms is None:
+            return
+        tmp_path = Path(f"{path}.tmp")
+        with tmp_path.open("wb") as file:
+            file.write(self._bits)
+            file.write(
+                self.SNAPSHOT_TRAILER.pack(
+                    self.SNAPSHOT_MAGIC,
+                    self._size_bits,
+                    self._hash_count,
+                    self._usernames_added,
+                    self._synced_until_ms,
+                )
+            )
+            file.flush()
+            os.fsync(file.fileno())
+        tmp_path.replace(path)
+
+    def _positions(self, username: str) -> list[int]:
+        digest = hashlib.blake2b(username.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8])
+        h2 = int.from_bytes(digest[8:]) | 1
+        return [(h1 + i * h2) % self._size_bits for i in range(self._hash_count)]
+
+    def _contains(self, positions: list[int]) -> bool:
+        return all(self._bits[p >> 3] & (1 << (p & 7)) for p in positions)
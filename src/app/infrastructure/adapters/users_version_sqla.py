@@ -0,0 +1,48 @@
+from sqlalchemy import select, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.application.common.ports.users_version import UsersVersion
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.user import users_version_seq
+
+# Last value handed out by any session, committed or not; until then,
+# the one before the start value, which `last_value` already shows
+USERS_VERSION_READ = text("""
+    SELECT CASE WHEN is_called THEN last_value ELSE last_value - 1 END
+    FROM users_version
+""")
+
+
+class SqlaUsersVersion(UsersVersion):
+    """
+    A sequence, unlike a row, is bumped without locks or transactions,
+    so concurrent changes never wait for each other to bump it.
+    The version is read once per request, until bumped.
+    """
+
+    def __init__(self, session: MainAsyncSession) -> None:
+        self._session = session
+        self._version: int | None = None
+
+    async def read(self) -> int:
+        """:raises DataMapperError:"""
+        if self._version is not None:
+            return self._version
+        try:
+            version: int = (
+                await self._session.execute(USERS_VERSION_READ)
+            ).scalar_one()
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
+        self._version = version
+        return version
+
+    async def bump(self) -> None:
+        """:raises DataMapperError:"""
+        self._version = None
+        try:
+            await self._session.execute(select(users_version_seq.next_value()))
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
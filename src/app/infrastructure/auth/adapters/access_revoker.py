@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from app.application.common.ports.access_revoker import AccessRevoker
 from app.domain.value_objects.user_id import UserId
 from app.infrastructure.auth.session.service import AuthSessionService
@@ -10,3 +12,7 @@ class AuthSessionAccessRevoker(AccessRevoker):
     async def remove_all_user_access(self, user_id: UserId) -> None:
         """:raises DataMapperError:"""
         await self._auth_session_service.terminate_all_sessions_for_user(user_id)
+
+    async def remove_all_users_access(self, user_ids: Sequence[UserId]) -> None:
+        """:raises DataMapperError:"""
+        await self._auth_session_service.terminate_all_sessions_for_users(user_ids)
@@ -1,4 +1,6 @@
-from sqlalchemy import delete
+from collections.abc import Sequence
+
+from sqlalchemy import any_, delete
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.domain.value_objects.user_id import UserId
@@ -9,6 +11,10 @@ from app.infrastructure.auth.session.ports.gateway import (
     AuthSessionGateway,
 )
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.expressions import uuid_array
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    auth_sessions_table,
+)
 
 
 class SqlaAuthSessionDataMapper(AuthSessionGateway):
@@ -59,3 +65,14 @@ class SqlaAuthSessionDataMapper(AuthSessionGateway):
             await self._session.execute(stmt)
         except SQLAlchemyError as err:
             raise DataMapperError(DB_QUERY_FAILED) from err
+
+    async def delete_all_for_users(self, user_ids: Sequence[UserId]) -> None:
+        """:raises DataMapperError:"""
+        ids = uuid_array([user_id.value for user_id in user_ids])
+        stmt = delete(auth_sessions_table).where(
+            auth_sessions_table.c.user_id == any_(ids)
+        )
+        try:
+            await self._session.execute(stmt)
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
@@ -5,6 +5,8 @@ from sqlalchemy.exc import SQLAlchemyError
 from app.infrastructure.adapters.constants import (
     DB_COMMIT_DONE,
     DB_COMMIT_FAILED,
+    DB_CONNECTION_NOT_RELEASED,
+    DB_CONNECTION_RELEASED,
     DB_QUERY_FAILED,
 )
 from app.infrastructure.auth.adapters.types import AuthAsyncSession
@@ -28,3 +30,18 @@ class SqlaAuthSessionTransactionManager(AuthSessionTransactionManager):
 
         except SQLAlchemyError as err:
             raise DataMapperError(f"{DB_QUERY_FAILED} {DB_COMMIT_FAILED}") from err
+
+    async def release_connection(self) -> None:
+        """:raises DataMapperError:"""
+        if not self._session.in_transaction():
+            return
+        if self._session.new or self._session.dirty or self._session.deleted:
+            log.warning("%s Auth session.", DB_CONNECTION_NOT_RELEASED)
+            return
+        try:
+            # Nothing to flush: ends the transaction, keeps objects loaded
+            await self._session.commit()
+            log.debug("%s Auth session.", DB_CONNECTION_RELEASED)
+
+        except SQLAlchemyError as err:
+            raise DataMapperError(DB_QUERY_FAILED) from err
@@ -9,6 +9,10 @@ class AlreadyAuthenticatedError(InfrastructureError):
     pass
 
 
+class LogInThrottledError(InfrastructureError):
+    pass
+
+
 class ReAuthenticationError(InfrastructureError):
     pass
 
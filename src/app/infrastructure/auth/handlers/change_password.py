@@ -30,6 +30,8 @@ class ChangePasswordHandler:
     - Open to authenticated users.
     - The current user can change their password.
     - New password must differ from current password.
+    - Passwords are verified and hashed without holding a row lock;
+      the new hash is applied only if the user was not modified since read.
     """
 
     def __init__(
@@ -51,25 +53,27 @@ class ChangePasswordHandler:
         :raises AuthenticationChangeError:
         :raises ReAuthenticationError:
         :raises PasswordHasherBusyError:
+        :raises ConcurrentModificationError:
         """
         log.info("Change password: started.")
 
-        current_user = await self._current_user_service.get_current_user(
-            for_update=True
-        )
+        current_user = await self._current_user_service.get_current_user()
 
         current_password = RawPassword(request_data.current_password)
         new_password = RawPassword(request_data.new_password)
         if current_password == new_password:
             raise AuthenticationChangeError(AUTH_PASSWORD_NEW_SAME_AS_CURRENT)
 
+        await self._transaction_manager.release_connection()
         if not await self._user_service.is_password_valid(
             current_user,
             current_password,
         ):
             raise ReAuthenticationError(AUTH_PASSWORD_INVALID)
 
-        await self._user_service.change_password(current_user, new_password)
+        password_hash = await self._user_service.hash_password(new_password)
+        self._user_service.set_password_hash(current_user, password_hash)
+        # Not retried: the current password was verified against the user as read
         await self._transaction_manager.commit()
 
         log.info("Change password: done. User ID: '%s'.", current_user.id_.value)
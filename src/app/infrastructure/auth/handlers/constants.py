@@ -4,6 +4,9 @@ AUTH_ACCOUNT_INACTIVE: Final[str] = "Your account is inactive. Please contact su
 AUTH_ALREADY_AUTHENTICATED: Final[str] = (
     "You are already authenticated. Consider logging out."
 )
+AUTH_LOG_IN_THROTTLED: Final[str] = (
+    "Too many failed log-in attempts. Try again in {retry_after_s} seconds."
+)
 AUTH_PASSWORD_INVALID: Final[str] = "Invalid password."
 AUTH_PASSWORD_NEW_SAME_AS_CURRENT: Final[str] = (
     "New password must differ from current password."
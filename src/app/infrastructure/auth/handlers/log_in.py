@@ -1,6 +1,8 @@
 import logging
+import math
 from dataclasses import dataclass
 
+from app.application.common.ports.transaction_manager import TransactionManager
 from app.application.common.ports.user_command_gateway import UserCommandGateway
 from app.application.common.services.current_user import CurrentUserService
 from app.domain.entities.user import User
@@ -11,13 +13,19 @@ from app.domain.value_objects.username import Username
 from app.infrastructure.auth.exceptions import (
     AlreadyAuthenticatedError,
     AuthenticationError,
+    LogInThrottledError,
 )
 from app.infrastructure.auth.handlers.constants import (
     AUTH_ACCOUNT_INACTIVE,
     AUTH_ALREADY_AUTHENTICATED,
+    AUTH_LOG_IN_THROTTLED,
     AUTH_PASSWORD_INVALID,
 )
 from app.infrastructure.auth.session.service import AuthSessionService
+from app.infrastructure.auth.throttling.log_in_throttle import LogInThrottle
+from app.infrastructure.auth.throttling.ports.client_address import (
+    ClientAddressProvider,
+)
 
 log = logging.getLogger(__name__)
 
@@ -40,6 +48,8 @@ class LogInHandler:
     when accessing protected routes before expiration.
     - If the JWT is invalid, expired, or the session is terminated,
     the user loses authentication.
+    - Repeated failures for a username or from an address
+    are throttled with exponential backoff.
     """
 
     def __init__(
@@ -47,12 +57,18 @@ class LogInHandler:
         current_user_service: CurrentUserService,
         user_command_gateway: UserCommandGateway,
         user_service: UserService,
+        transaction_manager: TransactionManager,
         auth_session_service: AuthSessionService,
+        log_in_throttle: LogInThrottle,
+        client_address_provider: ClientAddressProvider,
     ) -> None:
         self._current_user_service = current_user_service
         self._user_command_gateway = user_command_gateway
         self._user_service = user_service
+        self._transaction_manager = transaction_manager
         self._auth_session_service = auth_session_service
+        self._log_in_throttle = log_in_throttle
+        self._client_address_provider = client_address_provider
 
     async def execute(self, request_data: LogInRequest) -> None:
         """
@@ -60,6 +76,7 @@ class LogInHandler:
         :raises AuthorizationError:
         :raises DataMapperError:
         :raises DomainTypeError:
+        :raises LogInThrottledError:
         :raises UserNotFoundByUsernameError:
         :raises PasswordHasherBusyError:
         :raises AuthenticationError:
@@ -67,7 +84,7 @@ class LogInHandler:
         log.info("Log in: started. Username: '%s'.", request_data.username)
 
         try:
-            await self._current_user_service.get_current_user()
+            await self._current_user_service.get_current_principal()
             raise AlreadyAuthenticatedError(AUTH_ALREADY_AUTHENTICATED)
         except AuthenticationError:
             pass
@@ -75,12 +92,30 @@ class LogInHandler:
         username = Username(request_data.username)
         password = RawPassword(request_data.password)
 
-        user: User | None = await self._user_command_gateway.read_by_username(username)
+        client_address = self._client_address_provider.get_client_address()
+        retry_after_s = self._log_in_throttle.get_retry_after(
+            username.value,
+            client_address,
+        )
+        if retry_after_s is not None:
+            raise LogInThrottledError(
+                AUTH_LOG_IN_THROTTLED.format(retry_after_s=math.ceil(retry_after_s))
+            )
+
+        user: User | None = await self._user_command_gateway.read_by_username(
+            username,
+            with_password_hash=True,
+        )
         if user is None:
+            self._log_in_throttle.record_failure(username.value, client_address)
             raise UserNotFoundByUsernameError(username)
 
+        await self._transaction_manager.release_connection()
+
         if not await self._user_service.is_password_valid(user, password):
+            self._log_in_throttle.record_failure(username.value, client_address)
             raise AuthenticationError(AUTH_PASSWORD_INVALID)
+        self._log_in_throttle.record_success(username.value)
 
         if not user.is_active:
             raise AuthenticationError(AUTH_ACCOUNT_INACTIVE)
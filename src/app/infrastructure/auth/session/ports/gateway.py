@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import Protocol
 
 from app.domain.value_objects.user_id import UserId
@@ -30,3 +31,7 @@ class AuthSessionGateway(Protocol):
     @abstractmethod
     async def delete_all_for_user(self, user_id: UserId) -> None:
         """:raises DataMapperError:"""
+
+    @abstractmethod
+    async def delete_all_for_users(self, user_ids: Sequence[UserId]) -> None:
+        """:raises DataMapperError:"""
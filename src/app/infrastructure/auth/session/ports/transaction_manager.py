@@ -19,3 +19,13 @@ class AuthSessionTransactionManager(Protocol):
 
         Commit the successful outcome of a business transaction.
         """
+
+    @abstractmethod
+    async def release_connection(self) -> None:
+        """
+        :raises DataMapperError:
+
+        End the current read-only transaction and return its connection
+        to the pool before slow work that does not need the database.
+        Loaded objects stay usable; the next query starts a new transaction.
+        """
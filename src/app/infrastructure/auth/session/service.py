@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Final
 
@@ -28,6 +29,7 @@ AUTH_SESSION_EXPIRED: Final[str] = "Auth session expired."
 AUTH_SESSION_EXTENSION_FAILED: Final[str] = "Auth session extension failed."
 AUTH_SESSION_EXTRACTION_FAILED: Final[str] = "Auth session extraction failed."
 AUTH_SESSION_NOT_FOUND: Final[str] = "Auth session not found."
+AUTH_SESSION_RELEASE_FAILED: Final[str] = "Auth session connection release failed."
 
 
 class AuthSessionService:
@@ -81,6 +83,12 @@ class AuthSessionService:
         valid_auth_session = await self._validate_and_extend_session(raw_auth_session)
         self._cached_auth_session = valid_auth_session
 
+        # The auth session is cached from here on; don't pin a pooled connection
+        try:
+            await self._auth_transaction_manager.release_connection()
+        except DataMapperError as err:
+            log.error("%s: '%s'", AUTH_SESSION_RELEASE_FAILED, err)
+
         log.debug(
             "Get authenticated user ID: done. Auth session ID: '%s'. User ID: '%s'.",
             valid_auth_session.id_,
@@ -154,6 +162,28 @@ class AuthSessionService:
             user_id.value,
         )
 
+    async def terminate_all_sessions_for_users(
+        self,
+        user_ids: Sequence[UserId],
+    ) -> None:
+        """:raises DataMapperError:"""
+        log.debug(
+            "Terminate all sessions for users: started. Number of users: %d.",
+            len(user_ids),
+        )
+
+        await self._auth_session_gateway.delete_all_for_users(user_ids)
+        await self._auth_transaction_manager.commit()
+
+        if self._cached_auth_session and self._cached_auth_session.user_id in user_ids:
+            self._auth_session_transport.remove_current()
+            self._cached_auth_session = None
+
+        log.debug(
+            "Terminate all sessions for users: done. Number of users: %d.",
+            len(user_ids),
+        )
+
     async def _get_current_auth_session(self) -> AuthSession:
         """:raises AuthenticationError:"""
         log.debug("Get current auth session: started. Auth session ID: unknown.")
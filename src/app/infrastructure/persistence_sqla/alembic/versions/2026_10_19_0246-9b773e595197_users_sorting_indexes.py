@@ -0,0 +1,69 @@
+"""users sorting indexes
+
+Revision ID: 9b773e595197
+Revises: e325187c1eeb
+Create Date: 2026-10-19 02:46:45.692972
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b773e595197"
+down_revision: Union[str, None] = "e325187c1eeb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Each sorting of the user list gets a covering index, so its pages are
+# read by index-only scans. The primary key and the username constraint
+# are rebuilt with included columns rather than duplicated.
+# Indexes are built concurrently to keep the table writable.
+CONSTRAINT_INDEXES = {
+    "pk_users": ("PRIMARY KEY", ["id"], ["username", "role", "is_active"]),
+    "uq_users_username": ("UNIQUE", ["username"], ["id", "role", "is_active"]),
+}
+INDEXES = {
+    "ix_users_role_username": (["role", "username"], ["id", "is_active"]),
+    "ix_users_is_active_username": (["is_active", "username"], ["id", "role"]),
+}
+
+
+def replace_constraint_indexes(include: bool) -> None:
+    with op.get_context().autocommit_block():
+        for name, (_, columns, included) in CONSTRAINT_INDEXES.items():
+            op.create_index(
+                f"{name}_new",
+                "users",
+                columns,
+                unique=True,
+                postgresql_include=included if include else [],
+                postgresql_concurrently=True,
+            )
+    for name, (constraint_type, _, _) in CONSTRAINT_INDEXES.items():
+        op.execute(
+            f"ALTER TABLE users DROP CONSTRAINT {name},"
+            f" ADD CONSTRAINT {name} {constraint_type} USING INDEX {name}_new"
+        )
+
+
+def upgrade() -> None:
+    replace_constraint_indexes(include=True)
+    with op.get_context().autocommit_block():
+        for name, (columns, included) in INDEXES.items():
+            op.create_index(
+                name,
+                "users",
+                columns,
+                unique=False,
+                postgresql_include=included,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in reversed(INDEXES):
+            op.drop_index(name, table_name="users", postgresql_concurrently=True)
+    replace_constraint_indexes(include=False)
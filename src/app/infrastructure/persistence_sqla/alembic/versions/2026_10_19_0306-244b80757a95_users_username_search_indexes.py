@@ -0,0 +1,108 @@
+"""users username search indexes
+
+Revision ID: 244b80757a95
+Revises: 9b773e595197
+Create Date: 2026-10-19 03:06:13.557067
+
+"""
+
+import logging
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "244b80757a95"
+down_revision: Union[str, None] = "9b773e595197"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Prefix search uses the `text_pattern_ops` index whatever the database
+# collation, and covers its pages; substring search uses trigrams.
+# Indexes are built concurrently to keep the table writable.
+#
+# Trigrams need the `pg_trgm` extension: it is created unless it already
+# is, which takes a superuser, or, since it is trusted, the CREATE
+# privilege on the database. Where the server doesn't ship it or the role
+# may not create it, the trigram index is skipped with a warning:
+# substring search still works, by scanning the users. Downgrading drops
+# the indexes only: the extension may predate this revision or serve
+# other objects, and may not be the role's to drop.
+
+log = logging.getLogger("alembic.runtime.migration")
+
+TRGM_SKIPPED = """\
+Skipping ix_users_username_trgm: %s. Substring search of usernames will \
+scan the users. To add the index later, as a superuser:
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    CREATE INDEX CONCURRENTLY ix_users_username_trgm
+        ON users USING gin (username gin_trgm_ops);"""
+
+
+def ensure_pg_trgm() -> bool:
+    """Returns whether `pg_trgm` is installed, creating it if the role may."""
+    bind = op.get_bind()
+    if bind.scalar(sa.text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")):
+        return True
+    trusted = bind.scalar(
+        sa.text(
+            "SELECT bool_or(trusted) FROM pg_available_extension_versions "
+            "WHERE name = 'pg_trgm'"
+        )
+    )
+    if trusted is None:
+        log.warning(TRGM_SKIPPED, "the server doesn't ship pg_trgm")
+        return False
+    may_create = bind.scalar(
+        sa.text(
+            "SELECT rolsuper OR (:trusted "
+            "AND has_database_privilege(current_database(), 'CREATE')) "
+            "FROM pg_roles WHERE rolname = current_user"
+        ),
+        {"trusted": trusted},
+    )
+    if not may_create:
+        log.warning(TRGM_SKIPPED, "the role may not create pg_trgm")
+        return False
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    return True
+
+
+def upgrade() -> None:
+    has_trgm = ensure_pg_trgm()
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_username_pattern",
+            "users",
+            ["username"],
+            unique=False,
+            postgresql_ops={"username": "text_pattern_ops"},
+            postgresql_include=["id", "role", "is_active"],
+            postgresql_concurrently=True,
+        )
+        if has_trgm:
+            op.create_index(
+                "ix_users_username_trgm",
+                "users",
+                ["username"],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={"username": "gin_trgm_ops"},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_username_trgm",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_users_username_pattern",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,59 @@
+"""users filtering partial indexes
+
+Revision ID: e7566bebefed
+Revises: 244b80757a95
+Create Date: 2026-10-19 04:12:37.204518
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7566bebefed"
+down_revision: Union[str, None] = "244b80757a95"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Filtering by the minority states reads only matching index entries:
+# inactive users and admins, sorted by ID or by role and username.
+# Indexes are built concurrently to keep the table writable.
+INDEXES = {
+    "ix_users_inactive_id": (
+        ["id"],
+        ["username", "role", "is_active"],
+        "NOT is_active",
+    ),
+    "ix_users_inactive_role_username": (
+        ["role", "username"],
+        ["id", "is_active"],
+        "NOT is_active",
+    ),
+    "ix_users_admin_id": (
+        ["id"],
+        ["username", "role", "is_active"],
+        "role != 'USER'",
+    ),
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, (columns, included, where) in INDEXES.items():
+            op.create_index(
+                name,
+                "users",
+                columns,
+                unique=False,
+                postgresql_include=included,
+                postgresql_where=sa.text(where),
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in reversed(INDEXES):
+            op.drop_index(name, table_name="users", postgresql_concurrently=True)
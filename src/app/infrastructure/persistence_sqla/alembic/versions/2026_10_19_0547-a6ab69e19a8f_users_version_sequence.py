@@ -0,0 +1,26 @@
+"""users version sequence
+
+Revision ID: a6ab69e19a8f
+Revises: e7566bebefed
+Create Date: 2026-10-19 05:47:02.918364
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a6ab69e19a8f"
+down_revision: Union[str, None] = "e7566bebefed"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence("users_version")))
+
+
+def downgrade() -> None:
+    op.execute(sa.schema.DropSequence(sa.Sequence("users_version")))
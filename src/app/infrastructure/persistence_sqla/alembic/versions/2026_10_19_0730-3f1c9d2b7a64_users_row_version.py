@@ -0,0 +1,35 @@
+"""users row version
+
+Revision ID: 3f1c9d2b7a64
+Revises: a6ab69e19a8f
+Create Date: 2026-10-19 07:30:41.206512
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c9d2b7a64"
+down_revision: Union[str, None] = "a6ab69e19a8f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A constant default: no table rewrite
+    op.add_column(
+        "users",
+        sa.Column(
+            "version",
+            sa.Integer(),
+            server_default=sa.text("1"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "version")
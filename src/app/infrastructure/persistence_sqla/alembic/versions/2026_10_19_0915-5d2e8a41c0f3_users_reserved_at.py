@@ -0,0 +1,48 @@
+"""users reserved at
+
+Revision ID: 5d2e8a41c0f3
+Revises: 3f1c9d2b7a64
+Create Date: 2026-10-19 09:15:12.480361
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2e8a41c0f3"
+down_revision: Union[str, None] = "3f1c9d2b7a64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nullable without a default: no table rewrite
+    op.add_column(
+        "users",
+        sa.Column("reserved_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Placeholders left by registrations before this revision, recognizable
+    # by their empty hash, expire as if reserved now
+    op.execute(sa.text("UPDATE users SET reserved_at = now() WHERE password_hash = ''"))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_reserved_at",
+            "users",
+            ["reserved_at"],
+            unique=False,
+            postgresql_where=sa.text("reserved_at IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_reserved_at",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("users", "reserved_at")
@@ -0,0 +1,97 @@
+"""users covering reserved at
+
+Revision ID: 7029b2791959
+Revises: 5d2e8a41c0f3
+Create Date: 2026-10-19 10:40:27.815093
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7029b2791959"
+down_revision: Union[str, None] = "5d2e8a41c0f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Listings leave placeholders out by `reserved_at`: the covering indexes
+# include it, so that their scans stay index-only. Each index is built
+# anew beside the old one, concurrently to keep the table writable, then
+# swapped in; constraints take theirs over.
+CONSTRAINT_INDEXES = {
+    "pk_users": ("PRIMARY KEY", ["id"], ["username", "role", "is_active"]),
+    "uq_users_username": ("UNIQUE", ["username"], ["id", "role", "is_active"]),
+}
+INDEXES = {
+    "ix_users_role_username": (["role", "username"], ["id", "is_active"], None),
+    "ix_users_is_active_username": (["is_active", "username"], ["id", "role"], None),
+    "ix_users_username_pattern": (
+        ["username"],
+        ["id", "role", "is_active"],
+        None,
+    ),
+    "ix_users_inactive_id": (
+        ["id"],
+        ["username", "role", "is_active"],
+        "NOT is_active",
+    ),
+    "ix_users_inactive_role_username": (
+        ["role", "username"],
+        ["id", "is_active"],
+        "NOT is_active",
+    ),
+    "ix_users_admin_id": (
+        ["id"],
+        ["username", "role", "is_active"],
+        "role != 'USER'",
+    ),
+}
+
+
+def replace_indexes(include_reserved_at: bool) -> None:
+    extra = ["reserved_at"] if include_reserved_at else []
+    with op.get_context().autocommit_block():
+        for name, (_, columns, included) in CONSTRAINT_INDEXES.items():
+            op.create_index(
+                f"{name}_new",
+                "users",
+                columns,
+                unique=True,
+                postgresql_include=included + extra,
+                postgresql_concurrently=True,
+            )
+        for name, (columns, included, where) in INDEXES.items():
+            op.create_index(
+                f"{name}_new",
+                "users",
+                columns,
+                unique=False,
+                postgresql_ops=(
+                    {"username": "text_pattern_ops"}
+                    if name == "ix_users_username_pattern"
+                    else {}
+                ),
+                postgresql_include=included + extra,
+                postgresql_where=sa.text(where) if where is not None else None,
+                postgresql_concurrently=True,
+            )
+    for name, (constraint_type, _, _) in CONSTRAINT_INDEXES.items():
+        op.execute(
+            f"ALTER TABLE users DROP CONSTRAINT {name},"
+            f" ADD CONSTRAINT {name} {constraint_type} USING INDEX {name}_new"
+        )
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.drop_index(name, table_name="users", postgresql_concurrently=True)
+            op.execute(f"ALTER INDEX {name}_new RENAME TO {name}")
+
+
+def upgrade() -> None:
+    replace_indexes(include_reserved_at=True)
+
+
+def downgrade() -> None:
+    replace_indexes(include_reserved_at=False)
@@ -0,0 +1,43 @@
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    UUID as SA_UUID,
+    BindParameter,
+    Select,
+    literal,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+def uuid_array(values: Sequence[UUID]) -> BindParameter[list[UUID]]:
+    """
+    Binds all values as one array parameter, for `column = ANY(...)`.
+    Unlike `IN (...)`, the statement stays the same for any number of values.
+    """
+    return literal(list(values), ARRAY(SA_UUID(as_uuid=True)))
+
+
+class ExplainJson(Executable, ClauseElement):
+    """
+    `EXPLAIN (FORMAT JSON)` of a select, which is planned but not run.
+    Returns one row holding the plan.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, stmt: Select[Any]) -> None:
+        self.stmt = stmt
+
+
+@compiles(ExplainJson)
+def _compile_explain_json(
+    element: ExplainJson,
+    compiler: SQLCompiler,
+    **kw: Any,
+) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.stmt, **kw)}"
@@ -1,4 +1,19 @@
-from sqlalchemy import UUID, Boolean, Column, Enum, LargeBinary, String, Table
+from sqlalchemy import (
+    UUID,
+    Boolean,
+    Column,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    LargeBinary,
+    PrimaryKeyConstraint,
+    Sequence,
+    String,
+    Table,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.orm import composite
 
 from app.domain.entities.user import User
@@ -11,8 +26,8 @@ from app.infrastructure.persistence_sqla.registry import mapper_registry
 users_table = Table(
     "users",
     mapper_registry.metadata,
-    Column("id", UUID(as_uuid=True), primary_key=True),
-    Column("username", String(Username.MAX_LEN), nullable=False, unique=True),
+    Column("id", UUID(as_uuid=True)),
+    Column("username", String(Username.MAX_LEN), nullable=False),
     Column("password_hash", LargeBinary, nullable=False),
     Column(
         "role",
@@ -21,8 +36,88 @@ users_table = Table(
         nullable=False,
     ),
     Column("is_active", Boolean, default=True, nullable=False),
+    # Row version for optimistic concurrency control: flushes of a user
+    # update it only if unchanged since read. Statements bypassing the
+    # mapper must increment it too
+    Column("version", Integer, server_default=text("1"), nullable=False),
+    # Set while the row is only a registration's placeholder, so that
+    # placeholders of registrations that never completed can expire
+    Column("reserved_at", DateTime(timezone=True), nullable=True),
+    # Each sorting of the user list has a covering index, so its pages
+    # are read by index-only scans; `reserved_at` is included to leave
+    # placeholders out of them in the index too
+    PrimaryKeyConstraint(
+        "id",
+        postgresql_include=["username", "role", "is_active", "reserved_at"],
+    ),
+    UniqueConstraint(
+        "username",
+        postgresql_include=["id", "role", "is_active", "reserved_at"],
+    ),
+    Index(
+        "ix_users_role_username",
+        "role",
+        "username",
+        postgresql_include=["id", "is_active", "reserved_at"],
+    ),
+    Index(
+        "ix_users_is_active_username",
+        "is_active",
+        "username",
+        postgresql_include=["id", "role", "reserved_at"],
+    ),
+    # Username search: `LIKE 'prefix%'` whatever the collation,
+    # and `LIKE '%substring%'` by trigrams
+    Index(
+        "ix_users_username_pattern",
+        "username",
+        postgresql_ops={"username": "text_pattern_ops"},
+        postgresql_include=["id", "role", "is_active", "reserved_at"],
+    ),
+    Index(
+        "ix_users_username_trgm",
+        "username",
+        postgresql_using="gin",
+        postgresql_ops={"username": "gin_trgm_ops"},
+    ),
 )
 
+# Filtering by the minority states: partial indexes hold only the matching
+# users, so their pages are read by index-only scans in sortings where
+# the full indexes would skip over everyone else, and they are small
+# and untouched by writes of everyone else
+Index(
+    "ix_users_inactive_id",
+    users_table.c.id,
+    postgresql_include=["username", "role", "is_active", "reserved_at"],
+    postgresql_where=~users_table.c.is_active,
+)
+Index(
+    "ix_users_inactive_role_username",
+    users_table.c.role,
+    users_table.c.username,
+    postgresql_include=["id", "is_active", "reserved_at"],
+    postgresql_where=~users_table.c.is_active,
+)
+Index(
+    "ix_users_admin_id",
+    users_table.c.id,
+    postgresql_include=["username", "role", "is_active", "reserved_at"],
+    postgresql_where=users_table.c.role != UserRole.USER,
+)
+Index(
+    "ix_users_reserved_at",
+    users_table.c.reserved_at,
+    postgresql_where=users_table.c.reserved_at.is_not(None),
+)
+
+# Registered users: leaves out the placeholders of registrations
+# in progress, which only hold their usernames
+is_registered = users_table.c.reserved_at.is_(None)
+
+# Change token of the users, read to tell clients their copy is current
+users_version_seq = Sequence("users_version", metadata=mapper_registry.metadata)
+
 
 def map_users_table() -> None:
     mapper_registry.map_imperatively(
@@ -31,9 +126,19 @@ def map_users_table() -> None:
         properties={
             "id_": composite(UserId, users_table.c.id),
             "username": composite(Username, users_table.c.username),
-            "password_hash": composite(UserPasswordHash, users_table.c.password_hash),
+            # Loaded only when asked for: most reads don't check passwords,
+            # and an implicit load would block the event loop
+            "password_hash": composite(
+                UserPasswordHash,
+                users_table.c.password_hash,
+                deferred=True,
+                raiseload=True,
+            ),
             "role": users_table.c.role,
             "is_active": users_table.c.is_active,
         },
+        version_id_col=users_table.c.version,
+        # Only registration statements, bypassing the mapper, touch it
+        exclude_properties=[users_table.c.reserved_at],
         column_prefix="_",
     )
@@ -0,0 +1,21 @@
+from starlette.requests import Request
+
+from app.infrastructure.auth.throttling.ports.client_address import (
+    ClientAddressProvider,
+)
+
+
+class StarletteClientAddressProvider(ClientAddressProvider):
+    """
+    Relies on the ASGI server for the peer address.
+    Behind a reverse proxy, run Uvicorn with `--proxy-headers`
+    and `--forwarded-allow-ips` so this is the real client.
+    """
+
+    def __init__(self, request: Request) -> None:
+        self._request = request
+
+    def get_client_address(self) -> str | None:
+        if self._request.client is None:
+            return None
+        return self._request.client.host
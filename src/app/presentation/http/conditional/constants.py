@@ -0,0 +1,10 @@
+from typing import Final
+
+ETAG_HEADER: Final[str] = "ETag"
+IF_NONE_MATCH_HEADER: Final[str] = "If-None-Match"
+IF_NONE_MATCH_MAX_LEN: Final[int] = 1024
+CACHE_CONTROL_HEADER: Final[str] = "Cache-Control"
+# Stored by the client only, and revalidated on each use
+CACHE_CONTROL_REVALIDATE: Final[str] = "private, no-cache"
+# Responses differ by the request headers it names
+VARY_HEADER: Final[str] = "Vary"
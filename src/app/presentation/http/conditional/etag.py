@@ -0,0 +1,44 @@
+import hashlib
+from typing import Annotated
+
+from fastapi import Header
+
+from app.presentation.http.conditional.constants import (
+    IF_NONE_MATCH_HEADER,
+    IF_NONE_MATCH_MAX_LEN,
+)
+
+IfNoneMatchHeader = Annotated[
+    str | None,
+    Header(alias=IF_NONE_MATCH_HEADER, max_length=IF_NONE_MATCH_MAX_LEN),
+]
+
+
+def make_weak_etag(version: int, query: str) -> str:
+    """
+    Tags the response to `query` at `version` of the data.
+    Weak, as equal tags mean the same data rather than the same bytes:
+    estimated and cached totals may move without a new version.
+    """
+    return f'W/"{version}-{_digest(query)}"'
+
+
+def read_etag_version(if_none_match: str | None, query: str) -> int | None:
+    """
+    The version in the first tag of `If-None-Match` made for `query`.
+    Tags made for other queries, and malformed ones, are ignored.
+    """
+    if if_none_match is None:
+        return None
+    digest = _digest(query)
+    for tag in if_none_match.split(","):
+        version, _, tag_digest = (
+            tag.strip().removeprefix("W/").strip('"').partition("-")
+        )
+        if tag_digest == digest and version.isascii() and version.isdigit():
+            return int(version)
+    return None
+
+
+def _digest(query: str) -> str:
+    return hashlib.blake2b(query.encode(), digest_size=8).hexdigest()
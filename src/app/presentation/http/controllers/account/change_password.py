@@ -7,6 +7,9 @@ from fastapi import APIRouter, Body, Security, status
 from fastapi_error_map import ErrorAwareRouter, rule
 
 from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.exceptions.concurrency import (
+    ConcurrentModificationError,
+)
 from app.domain.exceptions.base import DomainTypeError
 from app.infrastructure.auth.exceptions import (
     AuthenticationChangeError,
@@ -43,6 +46,7 @@ def create_change_password_router() -> APIRouter:
             DomainTypeError: status.HTTP_400_BAD_REQUEST,
             AuthenticationChangeError: status.HTTP_400_BAD_REQUEST,
             ReAuthenticationError: status.HTTP_403_FORBIDDEN,
+            ConcurrentModificationError: status.HTTP_409_CONFLICT,
             PasswordHasherBusyError: rule(
                 status=status.HTTP_503_SERVICE_UNAVAILABLE,
                 translator=ServiceUnavailableTranslator(),
@@ -11,6 +11,7 @@ from app.domain.exceptions.user import UserNotFoundByUsernameError
 from app.infrastructure.auth.exceptions import (
     AlreadyAuthenticatedError,
     AuthenticationError,
+    LogInThrottledError,
 )
 from app.infrastructure.auth.handlers.log_in import LogInHandler, LogInRequest
 from app.infrastructure.exceptions.gateway import DataMapperError
@@ -36,6 +37,7 @@ def create_log_in_router() -> APIRouter:
                 on_error=log_error,
             ),
             DomainTypeError: status.HTTP_400_BAD_REQUEST,
+            LogInThrottledError: status.HTTP_429_TOO_MANY_REQUESTS,
             UserNotFoundByUsernameError: status.HTTP_404_NOT_FOUND,
             PasswordHasherBusyError: rule(
                 status=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -1,11 +1,15 @@
+from functools import partial
 from inspect import getdoc
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, Response, status
 from fastapi_error_map import ErrorAwareRouter, rule
 
 from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.exceptions.concurrency import (
+    ConcurrentModificationError,
+)
 from app.domain.exceptions.base import DomainTypeError
 from app.domain.exceptions.user import (
     RoleAssignmentNotPermittedError,
@@ -26,6 +30,11 @@ from app.presentation.http.errors.callbacks import (
 from app.presentation.http.errors.translators import (
     ServiceUnavailableTranslator,
 )
+from app.presentation.http.idempotency.exceptions import IdempotencyKeyReusedError
+from app.presentation.http.idempotency.store import (
+    IdempotencyKeyHeader,
+    IdempotencyStore,
+)
 
 
 def create_sign_up_router() -> APIRouter:
@@ -43,6 +52,7 @@ def create_sign_up_router() -> APIRouter:
                 on_error=log_error,
             ),
             DomainTypeError: status.HTTP_400_BAD_REQUEST,
+            IdempotencyKeyReusedError: status.HTTP_422_UNPROCESSABLE_ENTITY,
             PasswordHasherBusyError: rule(
                 status=status.HTTP_503_SERVICE_UNAVAILABLE,
                 translator=ServiceUnavailableTranslator(),
@@ -50,15 +60,25 @@ def create_sign_up_router() -> APIRouter:
             ),
             RoleAssignmentNotPermittedError: status.HTTP_422_UNPROCESSABLE_ENTITY,
             UsernameAlreadyExistsError: status.HTTP_409_CONFLICT,
+            ConcurrentModificationError: status.HTTP_409_CONFLICT,
         },
         default_on_error=log_info,
         status_code=status.HTTP_201_CREATED,
     )
     @inject
     async def sign_up(
+        request: Request,
+        response: Response,
         request_data: SignUpRequest,
         handler: FromDishka[SignUpHandler],
+        idempotency_store: FromDishka[IdempotencyStore],
+        idempotency_key: IdempotencyKeyHeader = None,
     ) -> SignUpResponse:
-        return await handler.execute(request_data)
+        return await idempotency_store.execute(
+            request,
+            response,
+            idempotency_key,
+            partial(handler.execute, request_data),
+        )
 
     return router
@@ -0,0 +1,45 @@
+from collections.abc import Mapping
+from inspect import getdoc
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Security, status
+from fastapi_error_map import ErrorAwareRouter, rule
+
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.queries.read_metrics import ReadMetricsQueryService
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.presentation.http.auth.openapi_marker import cookie_scheme
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+
+
+def create_metrics_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.get(
+        "/metrics",
+        description=getdoc(ReadMetricsQueryService),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        dependencies=[Security(cookie_scheme)],
+    )
+    @inject
+    async def metrics(
+        interactor: FromDishka[ReadMetricsQueryService],
+    ) -> Mapping[str, object]:
+        return await interactor.execute()
+
+    return router
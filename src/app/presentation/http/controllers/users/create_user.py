@@ -1,8 +1,9 @@
+from functools import partial
 from inspect import getdoc
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Security, status
+from fastapi import APIRouter, Request, Response, Security, status
 from fastapi_error_map import ErrorAwareRouter, rule
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -12,6 +13,9 @@ from app.application.commands.create_user import (
     CreateUserResponse,
 )
 from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.exceptions.concurrency import (
+    ConcurrentModificationError,
+)
 from app.domain.enums.user_role import UserRole
 from app.domain.exceptions.base import DomainTypeError
 from app.domain.exceptions.user import (
@@ -26,6 +30,11 @@ from app.presentation.http.errors.callbacks import log_error, log_info
 from app.presentation.http.errors.translators import (
     ServiceUnavailableTranslator,
 )
+from app.presentation.http.idempotency.exceptions import IdempotencyKeyReusedError
+from app.presentation.http.idempotency.store import (
+    IdempotencyKeyHeader,
+    IdempotencyStore,
+)
 
 
 class CreateUserRequestPydantic(BaseModel):
@@ -56,6 +65,7 @@ def create_create_user_router() -> APIRouter:
             ),
             AuthorizationError: status.HTTP_403_FORBIDDEN,
             DomainTypeError: status.HTTP_400_BAD_REQUEST,
+            IdempotencyKeyReusedError: status.HTTP_422_UNPROCESSABLE_ENTITY,
             PasswordHasherBusyError: rule(
                 status=status.HTTP_503_SERVICE_UNAVAILABLE,
                 translator=ServiceUnavailableTranslator(),
@@ -63,6 +73,7 @@ def create_create_user_router() -> APIRouter:
             ),
             RoleAssignmentNotPermittedError: status.HTTP_422_UNPROCESSABLE_ENTITY,
             UsernameAlreadyExistsError: status.HTTP_409_CONFLICT,
+            ConcurrentModificationError: status.HTTP_409_CONFLICT,
         },
         default_on_error=log_info,
         status_code=status.HTTP_201_CREATED,
@@ -70,14 +81,23 @@ def create_create_user_router() -> APIRouter:
     )
     @inject
     async def create_user(
+        request: Request,
+        response: Response,
         request_data_pydantic: CreateUserRequestPydantic,
         interactor: FromDishka[CreateUserInteractor],
+        idempotency_store: FromDishka[IdempotencyStore],
+        idempotency_key: IdempotencyKeyHeader = None,
     ) -> CreateUserResponse:
         request_data = CreateUserRequest(
             username=request_data_pydantic.username,
             password=request_data_pydantic.password,
             role=request_data_pydantic.role,
         )
-        return await interactor.execute(request_data)
+        return await idempotency_store.execute(
+            request,
+            response,
+            idempotency_key,
+            partial(interactor.execute, request_data),
+        )
 
     return router
@@ -0,0 +1,106 @@
+from functools import partial
+from inspect import getdoc
+from typing import Annotated, Final
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Request, Response, Security, status
+from fastapi_error_map import ErrorAwareRouter, rule
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.application.commands.create_user import CreateUserRequest
+from app.application.commands.create_users import (
+    CreateUsersInteractor,
+    CreateUsersRequest,
+    CreateUsersResponse,
+)
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.domain.exceptions.user import RoleAssignmentNotPermittedError
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
+from app.presentation.http.auth.openapi_marker import cookie_scheme
+from app.presentation.http.controllers.users.create_user import (
+    CreateUserRequestPydantic,
+)
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+from app.presentation.http.idempotency.exceptions import IdempotencyKeyReusedError
+from app.presentation.http.idempotency.store import (
+    IdempotencyKeyHeader,
+    IdempotencyStore,
+)
+
+# Keeps a batch within one INSERT statement and a bounded hashing time
+CREATE_USERS_MAX_BATCH: Final[int] = 1000
+
+
+class CreateUsersRequestPydantic(BaseModel):
+    """
+    Using a Pydantic model here is generally unnecessary.
+    It's only implemented to render a specific Swagger UI (OpenAPI) schema.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    users: Annotated[
+        list[CreateUserRequestPydantic],
+        Field(min_length=1, max_length=CREATE_USERS_MAX_BATCH),
+    ]
+
+
+def create_create_users_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.post(
+        "/bulk",
+        description=getdoc(CreateUsersInteractor),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+            IdempotencyKeyReusedError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+            PasswordHasherBusyError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            RoleAssignmentNotPermittedError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        dependencies=[Security(cookie_scheme)],
+    )
+    @inject
+    async def create_users(
+        request: Request,
+        response: Response,
+        request_data_pydantic: CreateUsersRequestPydantic,
+        interactor: FromDishka[CreateUsersInteractor],
+        idempotency_store: FromDishka[IdempotencyStore],
+        idempotency_key: IdempotencyKeyHeader = None,
+    ) -> CreateUsersResponse:
+        request_data = CreateUsersRequest(
+            users=[
+                CreateUserRequest(
+                    username=item.username,
+                    password=item.password,
+                    role=item.role,
+                )
+                for item in request_data_pydantic.users
+            ]
+        )
+        return await idempotency_store.execute(
+            request,
+            response,
+            idempotency_key,
+            partial(interactor.execute, request_data),
+        )
+
+    return router
@@ -0,0 +1,215 @@
+import csv
+import io
+import logging
+from collections.abc import AsyncIterable, AsyncIterator, Mapping, Sequence
+from enum import StrEnum
+from inspect import getdoc
+from typing import Annotated, Any, Final, get_type_hints
+
+import orjson
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Depends, Header, Security, status
+from fastapi.responses import StreamingResponse
+from fastapi_error_map import ErrorAwareRouter, rule
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.exceptions.query import SortingError
+from app.application.common.ports.user_query_gateway import UserQueryModel
+from app.application.common.query_params.sorting import SortingOrder
+from app.application.queries.export_users import (
+    ExportUsersQueryService,
+    ExportUsersRequest,
+)
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.exceptions.gateway import DataMapperError, ReaderError
+from app.presentation.http.auth.openapi_marker import cookie_scheme
+from app.presentation.http.conditional.constants import VARY_HEADER
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+
+log = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE: Final[str] = "application/x-ndjson"
+CSV_MEDIA_TYPE: Final[str] = "text/csv"
+STREAM_CHUNK_SIZE: Final[int] = 64 * 1024
+CSV_FIELDS: Final[tuple[str, ...]] = tuple(get_type_hints(UserQueryModel))
+ACCEPT_MAX_LEN: Final[int] = 1024
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES: Final[Mapping[ExportFormat, str]] = {
+    ExportFormat.NDJSON: NDJSON_MEDIA_TYPE,
+    ExportFormat.CSV: CSV_MEDIA_TYPE,
+}
+
+
+async def encode_ndjson(
+    items: AsyncIterable[Mapping[str, Any]],
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    One JSON object per line, sent in chunks of about `chunk_size` bytes.
+    The next chunk is encoded only once the previous one has been sent,
+    so a slow client slows down the database reads instead of filling
+    memory.
+    """
+    chunk = bytearray()
+    try:
+        async for item in items:
+            chunk += orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE)
+            if len(chunk) >= chunk_size:
+                yield bytes(chunk)
+                chunk.clear()
+    except ReaderError:
+        # Headers are sent already; the broken stream tells the client
+        log.exception("Streaming failed, aborting the response.")
+        raise
+    if chunk:
+        yield bytes(chunk)
+
+
+def format_csv_value(value: object) -> object:
+    """As in JSON for booleans; `csv` writes anything else with `str`."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
+
+async def encode_csv(
+    items: AsyncIterable[Mapping[str, Any]],
+    fields: Sequence[str],
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    A header row of `fields`, then one row per item, sent in chunks
+    as `encode_ndjson` does.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    try:
+        async for item in items:
+            writer.writerow([format_csv_value(item[field]) for field in fields])
+            if buffer.tell() >= chunk_size:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+    except ReaderError:
+        # Headers are sent already; the broken stream tells the client
+        log.exception("Streaming failed, aborting the response.")
+        raise
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def negotiate_format(accept: str | None) -> ExportFormat:
+    """
+    The format whose media type `accept` gives the highest quality,
+    the first listed on a tie. NDJSON if it names neither: wildcards
+    included, as that is what clients got before CSV.
+    """
+    formats = {media_type: format_ for format_, media_type in MEDIA_TYPES.items()}
+    best, best_quality = ExportFormat.NDJSON, 0.0
+    for media_range in (accept or "").split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        format_ = formats.get(media_type.lower())
+        if format_ is None:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > best_quality:
+            best, best_quality = format_, quality
+    return best
+
+
+class ExportUsersRequestPydantic(BaseModel):
+    """
+    Using a Pydantic model here is generally unnecessary.
+    It's only implemented to render a specific Swagger UI (OpenAPI) schema.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    sorting_field: Annotated[
+        str,
+        Field(
+            pattern=r"^\w+(,\w+)*$",
+            max_length=100,
+            description="Comma-separated for a multi-column sorting.",
+        ),
+    ] = "username"
+    sorting_order: Annotated[SortingOrder, Field()] = SortingOrder.ASC
+    format: Annotated[
+        ExportFormat | None,
+        Field(description="Takes precedence over the Accept header."),
+    ] = None
+
+
+def create_export_users_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.get(
+        "/export",
+        description=getdoc(ExportUsersQueryService),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+            SortingError: status.HTTP_400_BAD_REQUEST,
+            ReaderError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        response_class=StreamingResponse,
+        responses={
+            status.HTTP_200_OK: {
+                "content": {media_type: {} for media_type in MEDIA_TYPES.values()},
+            },
+        },
+        dependencies=[Security(cookie_scheme)],
+    )
+    @inject
+    async def export_users(
+        request_data_pydantic: Annotated[ExportUsersRequestPydantic, Depends()],
+        interactor: FromDishka[ExportUsersQueryService],
+        accept: Annotated[str | None, Header(max_length=ACCEPT_MAX_LEN)] = None,
+    ) -> StreamingResponse:
+        export_format = request_data_pydantic.format or negotiate_format(accept)
+        request_data = ExportUsersRequest(
+            sorting_fields=tuple(request_data_pydantic.sorting_field.split(",")),
+            sorting_order=request_data_pydantic.sorting_order,
+        )
+        users = await interactor.execute(request_data)
+        return StreamingResponse(
+            (
+                encode_csv(users, CSV_FIELDS)
+                if export_format == ExportFormat.CSV
+                else encode_ndjson(users)
+            ),
+            media_type=MEDIA_TYPES[export_format],
+            headers={VARY_HEADER: "Accept"},
+        )
+
+    return router
@@ -1,28 +1,55 @@
 from inspect import getdoc
-from typing import Annotated
+from typing import Annotated, Final
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Depends, Security, status
+from fastapi import APIRouter, Depends, Response, Security, status
+from fastapi.responses import ORJSONResponse
 from fastapi_error_map import ErrorAwareRouter, rule
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.application.common.exceptions.authorization import AuthorizationError
-from app.application.common.exceptions.query import PaginationError, SortingError
-from app.application.common.ports.user_query_gateway import ListUsersQM
+from app.application.common.exceptions.query import (
+    FieldSelectionError,
+    FilteringError,
+    PaginationError,
+    SortingError,
+)
+from app.application.common.ports.user_query_gateway import (
+    ListUsersCursorQM,
+    ListUsersQM,
+)
+from app.application.common.query_params.cursor_pagination import PaginationMode
+from app.application.common.query_params.filtering import UsernameMatch
+from app.application.common.query_params.offset_pagination import TotalMode
 from app.application.common.query_params.sorting import SortingOrder
 from app.application.queries.list_users import (
     ListUsersQueryService,
     ListUsersRequest,
 )
+from app.domain.enums.user_role import UserRole
+from app.domain.value_objects.username import Username
 from app.infrastructure.auth.exceptions import AuthenticationError
 from app.infrastructure.exceptions.gateway import DataMapperError, ReaderError
 from app.presentation.http.auth.openapi_marker import cookie_scheme
+from app.presentation.http.conditional.constants import (
+    CACHE_CONTROL_HEADER,
+    CACHE_CONTROL_REVALIDATE,
+    ETAG_HEADER,
+)
+from app.presentation.http.conditional.etag import (
+    IfNoneMatchHeader,
+    make_weak_etag,
+    read_etag_version,
+)
 from app.presentation.http.errors.callbacks import log_error, log_info
 from app.presentation.http.errors.translators import (
     ServiceUnavailableTranslator,
 )
 
+# Larger sets are for the export endpoint, which streams them
+LIST_USERS_MAX_LIMIT: Final[int] = 1000
+
 
 class ListUsersRequestPydantic(BaseModel):
     """
@@ -32,10 +59,39 @@ class ListUsersRequestPydantic(BaseModel):
 
     model_config = ConfigDict(frozen=True)
 
-    limit: Annotated[int, Field(ge=1)] = 20
+    limit: Annotated[int, Field(ge=1, le=LIST_USERS_MAX_LIMIT)] = 20
     offset: Annotated[int, Field(ge=0)] = 0
-    sorting_field: Annotated[str, Field()] = "username"
+    sorting_field: Annotated[
+        str,
+        Field(
+            pattern=r"^\w+(,\w+)*$",
+            max_length=100,
+            description="Comma-separated for a multi-column sorting.",
+        ),
+    ] = "username"
     sorting_order: Annotated[SortingOrder, Field()] = SortingOrder.ASC
+    pagination: Annotated[PaginationMode, Field()] = PaginationMode.OFFSET
+    cursor: Annotated[str | None, Field(min_length=1, max_length=512)] = None
+    total_mode: Annotated[TotalMode | None, Field()] = None
+    username: Annotated[
+        str | None,
+        Field(
+            pattern=r"^[a-zA-Z0-9._-]+$",
+            max_length=Username.MAX_LEN,
+            description="Case-sensitive.",
+        ),
+    ] = None
+    username_match: Annotated[UsernameMatch, Field()] = UsernameMatch.PREFIX
+    role: Annotated[UserRole | None, Field()] = None
+    is_active: Annotated[bool | None, Field()] = None
+    fields: Annotated[
+        str | None,
+        Field(
+            pattern=r"^\w+(,\w+)*$",
+            max_length=100,
+            description="Comma-separated; all fields by default.",
+        ),
+    ] = None
 
 
 def create_list_users_router() -> APIRouter:
@@ -54,6 +110,8 @@ def create_list_users_router() -> APIRouter:
             AuthorizationError: status.HTTP_403_FORBIDDEN,
             PaginationError: status.HTTP_400_BAD_REQUEST,
             SortingError: status.HTTP_400_BAD_REQUEST,
+            FilteringError: status.HTTP_400_BAD_REQUEST,
+            FieldSelectionError: status.HTTP_400_BAD_REQUEST,
             ReaderError: rule(
                 status=status.HTTP_503_SERVICE_UNAVAILABLE,
                 translator=ServiceUnavailableTranslator(),
@@ -62,19 +120,46 @@ def create_list_users_router() -> APIRouter:
         },
         default_on_error=log_info,
         status_code=status.HTTP_200_OK,
+        response_model=ListUsersQM | ListUsersCursorQM,
+        responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not Modified"}},
         dependencies=[Security(cookie_scheme)],
     )
     @inject
     async def list_users(
         request_data_pydantic: Annotated[ListUsersRequestPydantic, Depends()],
         interactor: FromDishka[ListUsersQueryService],
-    ) -> ListUsersQM:
+        if_none_match: IfNoneMatchHeader = None,
+    ) -> Response:
+        query = request_data_pydantic.model_dump_json()
         request_data = ListUsersRequest(
             limit=request_data_pydantic.limit,
             offset=request_data_pydantic.offset,
-            sorting_field=request_data_pydantic.sorting_field,
+            sorting_fields=tuple(request_data_pydantic.sorting_field.split(",")),
             sorting_order=request_data_pydantic.sorting_order,
+            pagination_mode=request_data_pydantic.pagination,
+            cursor=request_data_pydantic.cursor,
+            total_mode=request_data_pydantic.total_mode,
+            username=request_data_pydantic.username,
+            username_match=request_data_pydantic.username_match,
+            role=request_data_pydantic.role,
+            is_active=request_data_pydantic.is_active,
+            fields=(
+                tuple(request_data_pydantic.fields.split(","))
+                if request_data_pydantic.fields is not None
+                else None
+            ),
+            known_users_version=read_etag_version(if_none_match, query),
         )
-        return await interactor.execute(request_data)
+        result = await interactor.execute(request_data)
+
+        headers = {
+            ETAG_HEADER: make_weak_etag(result["users_version"], query),
+            CACHE_CONTROL_HEADER: CACHE_CONTROL_REVALIDATE,
+        }
+        if result["page"] is None:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        # Users are encoded as read, with the selected fields only:
+        # `response_model` documents them, without validating each again
+        return ORJSONResponse(result["page"], headers=headers)
 
     return router
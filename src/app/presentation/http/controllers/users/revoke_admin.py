@@ -12,6 +12,9 @@ from app.application.commands.revoke_admin import (
     RevokeAdminRequest,
 )
 from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.exceptions.concurrency import (
+    ConcurrentModificationError,
+)
 from app.domain.exceptions.user import (
     RoleChangeNotPermittedError,
     UserNotFoundByIdError,
@@ -41,6 +44,7 @@ def create_revoke_admin_router() -> APIRouter:
             AuthorizationError: status.HTTP_403_FORBIDDEN,
             UserNotFoundByIdError: status.HTTP_404_NOT_FOUND,
             RoleChangeNotPermittedError: status.HTTP_403_FORBIDDEN,
+            ConcurrentModificationError: status.HTTP_409_CONFLICT,
         },
         default_on_error=log_info,
         status_code=status.HTTP_204_NO_CONTENT,
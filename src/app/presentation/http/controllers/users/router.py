@@ -6,9 +6,15 @@ from app.presentation.http.controllers.users.activate_user import (
 from app.presentation.http.controllers.users.create_user import (
     create_create_user_router,
 )
+from app.presentation.http.controllers.users.create_users import (
+    create_create_users_router,
+)
 from app.presentation.http.controllers.users.deactivate_user import (
     create_deactivate_user_router,
 )
+from app.presentation.http.controllers.users.export_users import (
+    create_export_users_router,
+)
 from app.presentation.http.controllers.users.grant_admin import (
     create_grant_admin_router,
 )
@@ -19,6 +25,12 @@ from app.presentation.http.controllers.users.revoke_admin import (
 from app.presentation.http.controllers.users.set_user_password import (
     create_set_user_password_router,
 )
+from app.presentation.http.controllers.users.set_users_activation import (
+    create_set_users_activation_router,
+)
+from app.presentation.http.controllers.users.set_users_admin_role import (
+    create_set_users_admin_role_router,
+)
 
 
 def create_users_router() -> APIRouter:
@@ -27,7 +39,12 @@ def create_users_router() -> APIRouter:
         tags=["Users"],
     )
     router.include_router(create_create_user_router())
+    router.include_router(create_create_users_router())
     router.include_router(create_list_users_router())
+    router.include_router(create_export_users_router())
+    # Before the single-user routes, whose `/{user_id}/...` would match `/bulk/...`
+    router.include_router(create_set_users_activation_router())
+    router.include_router(create_set_users_admin_role_router())
     router.include_router(create_set_user_password_router())
     router.include_router(create_grant_admin_router())
     router.include_router(create_revoke_admin_router())
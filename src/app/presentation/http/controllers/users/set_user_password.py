@@ -1,10 +1,11 @@
+from functools import partial
 from inspect import getdoc
 from typing import Annotated
 from uuid import UUID
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Body, Path, Security, status
+from fastapi import APIRouter, Body, Path, Request, Response, Security, status
 from fastapi_error_map import ErrorAwareRouter, rule
 
 from app.application.commands.set_user_password import (
@@ -12,6 +13,9 @@ from app.application.commands.set_user_password import (
     SetUserPasswordRequest,
 )
 from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.exceptions.concurrency import (
+    ConcurrentModificationError,
+)
 from app.domain.exceptions.base import DomainTypeError
 from app.domain.exceptions.user import (
     UserNotFoundByIdError,
@@ -24,6 +28,11 @@ from app.presentation.http.errors.callbacks import log_error, log_info
 from app.presentation.http.errors.translators import (
     ServiceUnavailableTranslator,
 )
+from app.presentation.http.idempotency.exceptions import IdempotencyKeyReusedError
+from app.presentation.http.idempotency.store import (
+    IdempotencyKeyHeader,
+    IdempotencyStore,
+)
 
 
 def create_set_user_password_router() -> APIRouter:
@@ -41,7 +50,9 @@ def create_set_user_password_router() -> APIRouter:
             ),
             AuthorizationError: status.HTTP_403_FORBIDDEN,
             DomainTypeError: status.HTTP_400_BAD_REQUEST,
+            IdempotencyKeyReusedError: status.HTTP_422_UNPROCESSABLE_ENTITY,
             UserNotFoundByIdError: status.HTTP_404_NOT_FOUND,
+            ConcurrentModificationError: status.HTTP_409_CONFLICT,
             PasswordHasherBusyError: rule(
                 status=status.HTTP_503_SERVICE_UNAVAILABLE,
                 translator=ServiceUnavailableTranslator(),
@@ -54,14 +65,23 @@ def create_set_user_password_router() -> APIRouter:
     )
     @inject
     async def set_user_password(
+        request: Request,
+        response: Response,
         user_id: Annotated[UUID, Path()],
         password: Annotated[str, Body()],
         interactor: FromDishka[SetUserPasswordInteractor],
+        idempotency_store: FromDishka[IdempotencyStore],
+        idempotency_key: IdempotencyKeyHeader = None,
     ) -> None:
         request_data = SetUserPasswordRequest(
             user_id=user_id,
             password=password,
         )
-        await interactor.execute(request_data)
+        await idempotency_store.execute(
+            request,
+            response,
+            idempotency_key,
+            partial(interactor.execute, request_data),
+        )
 
     return router
@@ -0,0 +1,74 @@
+from inspect import getdoc
+from typing import Annotated, Final
+from uuid import UUID
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Security, status
+from fastapi_error_map import ErrorAwareRouter, rule
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.application.commands.set_users_activation import (
+    SetUsersActivationInteractor,
+    SetUsersActivationRequest,
+)
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.services.user_batch import UserBatchResponse
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.presentation.http.auth.openapi_marker import cookie_scheme
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+
+# Keeps the row locks of a batch short-lived
+SET_USERS_MAX_BATCH: Final[int] = 1000
+
+
+class SetUsersActivationRequestPydantic(BaseModel):
+    """
+    Using a Pydantic model here is generally unnecessary.
+    It's only implemented to render a specific Swagger UI (OpenAPI) schema.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    user_ids: Annotated[
+        list[UUID],
+        Field(min_length=1, max_length=SET_USERS_MAX_BATCH),
+    ]
+    is_active: bool
+
+
+def create_set_users_activation_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.put(
+        "/bulk/activation",
+        description=getdoc(SetUsersActivationInteractor),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        dependencies=[Security(cookie_scheme)],
+    )
+    @inject
+    async def set_users_activation(
+        request_data_pydantic: SetUsersActivationRequestPydantic,
+        interactor: FromDishka[SetUsersActivationInteractor],
+    ) -> UserBatchResponse:
+        request_data = SetUsersActivationRequest(
+            user_ids=request_data_pydantic.user_ids,
+            is_active=request_data_pydantic.is_active,
+        )
+        return await interactor.execute(request_data)
+
+    return router
@@ -0,0 +1,8 @@
+from typing import Final
+
+IDEMPOTENCY_KEY_HEADER: Final[str] = "Idempotency-Key"
+IDEMPOTENCY_KEY_MAX_LEN: Final[int] = 255
+IDEMPOTENCY_KEY_REUSED: Final[str] = (
+    "Idempotency key was already used with a different request."
+)
+IDEMPOTENT_REPLAYED_HEADER: Final[str] = "Idempotent-Replayed"
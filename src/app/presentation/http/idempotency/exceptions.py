@@ -0,0 +1,6 @@
+class IdempotencyError(Exception):
+    pass
+
+
+class IdempotencyKeyReusedError(IdempotencyError):
+    pass
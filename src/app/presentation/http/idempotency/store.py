@@ -0,0 +1,112 @@
+import hashlib
+import os
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import Annotated
+
+from fastapi import Header
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.infrastructure.adapters.single_flight import Flight, SingleFlightCache
+from app.presentation.http.auth.constants import COOKIE_ACCESS_TOKEN_NAME
+from app.presentation.http.idempotency.constants import (
+    IDEMPOTENCY_KEY_HEADER,
+    IDEMPOTENCY_KEY_MAX_LEN,
+    IDEMPOTENCY_KEY_REUSED,
+    IDEMPOTENT_REPLAYED_HEADER,
+)
+from app.presentation.http.idempotency.exceptions import IdempotencyKeyReusedError
+
+IdempotencyKeyHeader = Annotated[
+    str | None,
+    Header(
+        alias=IDEMPOTENCY_KEY_HEADER,
+        min_length=1,
+        max_length=IDEMPOTENCY_KEY_MAX_LEN,
+    ),
+]
+
+
+@dataclass(eq=False, slots=True, kw_only=True)
+class _Entry(Flight):
+    fingerprint: bytes
+
+
+class IdempotencyStore:
+    """
+    Remembers the first successful result of a request carrying
+    an `Idempotency-Key` header and replays it on retries.
+
+    - Keys are scoped to method, path and caller, so a replay never
+      crosses callers or endpoints. The caller is the access token cookie
+      or, for anonymous requests such as sign-up, the client address;
+      anonymous requests without an address run without replay.
+    - Only digests of the scope and request body are kept,
+      next to the handler's (small) return value.
+    - A duplicate arriving while the original is in flight waits
+      for its outcome, including errors, instead of running again.
+    - Failed requests are forgotten, so a retry after an error runs again.
+
+    The store is per process; retries landing on another worker run again.
+    """
+
+    def __init__(self, ttl_s: float, max_keys: int) -> None:
+        self._secret = os.urandom(16)
+        self._flights: SingleFlightCache[bytes, _Entry] = SingleFlightCache(
+            name="Idempotency store",
+            ttl_s=ttl_s,
+            max_entries=max_keys,
+        )
+
+    async def execute[T](
+        self,
+        request: Request,
+        response: Response,
+        key: str | None,
+        operation: Callable[[], Awaitable[T]],
+    ) -> T:
+        """:raises IdempotencyKeyReusedError:"""
+        caller = self._get_caller(request)
+        if key is None or caller is None:
+            return await operation()
+
+        entry_key = self._digest(
+            request.method.encode(),
+            request.url.path.encode(),
+            caller,
+            key.encode(),
+        )
+        fingerprint = self._digest(await request.body())
+        result, replayed = await self._flights.get_or_run(
+            entry_key,
+            operation,
+            create=partial(_Entry, fingerprint=fingerprint),
+            on_found=partial(self._check_fingerprint, fingerprint),
+        )
+        if replayed:
+            response.headers[IDEMPOTENT_REPLAYED_HEADER] = "true"
+        return result
+
+    @staticmethod
+    def _get_caller(request: Request) -> bytes | None:
+        access_token = request.cookies.get(COOKIE_ACCESS_TOKEN_NAME)
+        if access_token:
+            return b"token:" + access_token.encode()
+        if request.client is not None:
+            return b"address:" + request.client.host.encode()
+        return None
+
+    @staticmethod
+    def _check_fingerprint(fingerprint: bytes, entry: _Entry) -> None:
+        """:raises IdempotencyKeyReusedError:"""
+        if entry.fingerprint != fingerprint:
+            raise IdempotencyKeyReusedError(IDEMPOTENCY_KEY_REUSED)
+
+    def _digest(self, *parts: bytes) -> bytes:
+        digest = hashlib.blake2b(key=self._secret, digest_size=16)
+        for part in parts:
+            digest.update(len(part).to_bytes(4))
+            digest.update(part)
+        return digest.digest()
@@ -5,6 +5,9 @@ from dishka import AsyncContainer, Provider, make_async_container
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
 
+from app.infrastructure.adapters.reservation_sweeper_sqla import ReservationSweeper
+from app.infrastructure.adapters.user_directory_snapshot import UserDirectorySnapshot
+from app.infrastructure.adapters.username_bloom_filter import UsernameBloomFilter
 from app.infrastructure.persistence_sqla.mappings.all import map_tables
 from app.presentation.http.auth.asgi_middleware import (
     ASGIAuthMiddleware,
@@ -43,6 +46,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     container = app.state.dishka_container
     try:
         map_tables()
+        # Built eagerly: the first scan of usernames shouldn't delay a request
+        await container.get(UsernameBloomFilter)
+        await container.get(UserDirectorySnapshot)
+        await container.get(ReservationSweeper)
         yield
     finally:
         await container.close()
@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+
+
+class IdempotencySettings(BaseModel):
+    ttl_s: float = Field(alias="TTL_S", gt=0)
+    max_keys: int = Field(alias="MAX_KEYS", ge=1)
@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+
+
+class PrincipalCacheSettings(BaseModel):
+    max_age_s: float = Field(alias="MAX_AGE_S", ge=0)
+    max_entries: int = Field(alias="MAX_ENTRIES", ge=1)
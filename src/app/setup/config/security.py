@@ -37,14 +37,28 @@ class CookiesSettings(BaseModel):
 
 class PasswordSettings(BaseModel):
     pepper: str = Field(alias="PEPPER", min_length=32)
+    hasher_algorithm: Literal["bcrypt", "scrypt"] = Field(alias="HASHER_ALGORITHM")
     hasher_work_factor: int = Field(alias="HASHER_WORK_FACTOR", ge=10)
+    hasher_scrypt_cost_log2: int = Field(alias="HASHER_SCRYPT_COST_LOG2", ge=10)
+    hasher_scrypt_block_size: int = Field(alias="HASHER_SCRYPT_BLOCK_SIZE", ge=1)
+    hasher_scrypt_parallelism: int = Field(alias="HASHER_SCRYPT_PARALLELISM", ge=1)
     hasher_max_threads: int = Field(alias="HASHER_MAX_THREADS", ge=1)
     hasher_semaphore_wait_timeout_s: float = Field(
         alias="HASHER_SEMAPHORE_WAIT_TIMEOUT_S", gt=0
     )
 
 
+class LogInThrottleSettings(BaseModel):
+    window_s: float = Field(alias="WINDOW_S", gt=0)
+    max_failures_per_username: int = Field(alias="MAX_FAILURES_PER_USERNAME", ge=1)
+    max_failures_per_address: int = Field(alias="MAX_FAILURES_PER_ADDRESS", ge=1)
+    backoff_base_s: float = Field(alias="BACKOFF_BASE_S", gt=0)
+    backoff_max_s: float = Field(alias="BACKOFF_MAX_S", gt=0)
+    max_tracked_keys: int = Field(alias="MAX_TRACKED_KEYS", ge=1)
+
+
 class SecuritySettings(BaseModel):
     auth: AuthSettings
     cookies: CookiesSettings
     password: PasswordSettings
+    login_throttle: LogInThrottleSettings
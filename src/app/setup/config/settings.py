@@ -3,9 +3,15 @@ from pydantic import (
 )
 
 from app.setup.config.database import PostgresSettings, SqlaEngineSettings
+from app.setup.config.idempotency import IdempotencySettings
 from app.setup.config.loader import ValidEnvs, get_current_env, load_full_config
 from app.setup.config.logs import LoggingSettings
+from app.setup.config.principal_cache import PrincipalCacheSettings
 from app.setup.config.security import SecuritySettings
+from app.setup.config.user_count import UserCountSettings
+from app.setup.config.user_directory import UserDirectorySettings
+from app.setup.config.user_query_cache import UserQueryCacheSettings
+from app.setup.config.username_filter import UsernameFilterSettings
 
 
 class AppSettings(BaseModel):
@@ -13,6 +19,12 @@ class AppSettings(BaseModel):
     sqla: SqlaEngineSettings
     security: SecuritySettings
     logs: LoggingSettings
+    idempotency: IdempotencySettings
+    username_filter: UsernameFilterSettings
+    user_count: UserCountSettings
+    user_query_cache: UserQueryCacheSettings
+    user_directory: UserDirectorySettings
+    principal_cache: PrincipalCacheSettings
 
 
 def load_settings(env: ValidEnvs | None = None) -> AppSettings:
@@ -0,0 +1,5 @@
+from pydantic import BaseModel, Field
+
+
+class UserCountSettings(BaseModel):
+    cache_ttl_s: float = Field(alias="CACHE_TTL_S", ge=0)
@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+
+class UserDirectorySettings(BaseModel):
+    enabled: bool = Field(alias="ENABLED")
+    refresh_interval_s: float = Field(alias="REFRESH_INTERVAL_S", ge=0)
+    refresh_delay_s: float = Field(alias="REFRESH_DELAY_S", ge=0)
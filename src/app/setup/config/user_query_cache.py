@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+
+
+class UserQueryCacheSettings(BaseModel):
+    ttl_s: float = Field(alias="TTL_S", ge=0)
+    max_entries: int = Field(alias="MAX_ENTRIES", ge=1)
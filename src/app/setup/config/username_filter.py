@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+
+
+class UsernameFilterSettings(BaseModel):
+    enabled: bool = Field(alias="ENABLED")
+    capacity: int = Field(alias="CAPACITY", ge=1)
+    false_positive_rate: float = Field(alias="FALSE_POSITIVE_RATE", gt=0, lt=1)
+    refresh_interval_s: float = Field(alias="REFRESH_INTERVAL_S", ge=0)
+    snapshot_path: str | None = Field(alias="SNAPSHOT_PATH", default=None)
@@ -1,29 +1,55 @@
-from dishka import Provider, Scope, provide, provide_all
+from dishka import Provider, Scope, alias, provide, provide_all
 
 from app.application.commands.activate_user import ActivateUserInteractor
 from app.application.commands.create_user import CreateUserInteractor
+from app.application.commands.create_users import CreateUsersInteractor
 from app.application.commands.deactivate_user import DeactivateUserInteractor
 from app.application.commands.grant_admin import GrantAdminInteractor
 from app.application.commands.revoke_admin import RevokeAdminInteractor
 from app.application.commands.set_user_password import SetUserPasswordInteractor
+from app.application.commands.set_users_activation import (
+    SetUsersActivationInteractor,
+)
+from app.application.commands.set_users_admin_role import (
+    SetUsersAdminRoleInteractor,
+)
 from app.application.common.ports.access_revoker import AccessRevoker
 from app.application.common.ports.flusher import Flusher
 from app.application.common.ports.identity_provider import IdentityProvider
+from app.application.common.ports.metrics_reader import MetricsReader
+from app.application.common.ports.principal_cache import PrincipalCache
+from app.application.common.ports.principal_reader import PrincipalReader
 from app.application.common.ports.transaction_manager import (
     TransactionManager,
 )
 from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_counter import UserCounter
 from app.application.common.ports.user_query_gateway import UserQueryGateway
+from app.application.common.ports.users_version import UsersVersion
+from app.application.common.services.conflict_retry import ConflictRetryService
 from app.application.common.services.current_user import CurrentUserService
+from app.application.common.services.user_batch import UserBatchService
+from app.application.common.services.user_registration import (
+    UserRegistrationService,
+)
+from app.application.queries.export_users import ExportUsersQueryService
 from app.application.queries.list_users import ListUsersQueryService
+from app.application.queries.read_metrics import ReadMetricsQueryService
 from app.infrastructure.adapters.main_flusher_sqla import SqlaMainFlusher
 from app.infrastructure.adapters.main_transaction_manager_sqla import (
     SqlaMainTransactionManager,
 )
+from app.infrastructure.adapters.metrics_reader import InProcessMetricsReader
+from app.infrastructure.adapters.principal_cache import InMemoryPrincipalCache
+from app.infrastructure.adapters.principal_reader_sqla import SqlaPrincipalReader
+from app.infrastructure.adapters.user_count_cache import InMemoryUserCountCache
 from app.infrastructure.adapters.user_data_mapper_sqla import (
     SqlaUserDataMapper,
 )
+from app.infrastructure.adapters.user_directory_snapshot import SnapshotUserReader
+from app.infrastructure.adapters.user_reader_cache import CachedUserReader
 from app.infrastructure.adapters.user_reader_sqla import SqlaUserReader
+from app.infrastructure.adapters.users_version_sqla import SqlaUsersVersion
 from app.infrastructure.auth.adapters.access_revoker import (
     AuthSessionAccessRevoker,
 )
@@ -37,14 +63,26 @@ class ApplicationProvider(Provider):
 
     # Services
     services = provide_all(
+        ConflictRetryService,
         CurrentUserService,
+        UserBatchService,
+        UserRegistrationService,
     )
 
     # Ports Persistence
     tx_manager = provide(SqlaMainTransactionManager, provides=TransactionManager)
     flusher = provide(SqlaMainFlusher, provides=Flusher)
     user_command_gateway = provide(SqlaUserDataMapper, provides=UserCommandGateway)
-    user_query_gateway = provide(SqlaUserReader, provides=UserQueryGateway)
+    user_reader = provide(SqlaUserReader)
+    cached_user_reader = provide(CachedUserReader)
+    user_query_gateway = provide(SnapshotUserReader, provides=UserQueryGateway)
+    user_counter = alias(source=InMemoryUserCountCache, provides=UserCounter)
+    users_version = provide(SqlaUsersVersion, provides=UsersVersion)
+    principal_cache = alias(source=InMemoryPrincipalCache, provides=PrincipalCache)
+    principal_reader = provide(SqlaPrincipalReader, provides=PrincipalReader)
+
+    # Ports Monitoring
+    metrics_reader = provide(InProcessMetricsReader, provides=MetricsReader)
 
     # Ports Auth
     access_revoker = provide(AuthSessionAccessRevoker, provides=AccessRevoker)
@@ -55,12 +93,17 @@ class ApplicationProvider(Provider):
         ActivateUserInteractor,
         SetUserPasswordInteractor,
         CreateUserInteractor,
+        CreateUsersInteractor,
         DeactivateUserInteractor,
         GrantAdminInteractor,
         RevokeAdminInteractor,
+        SetUsersActivationInteractor,
+        SetUsersAdminRoleInteractor,
     )
 
     # Queries
     query_services = provide_all(
         ListUsersQueryService,
+        ExportUsersQueryService,
+        ReadMetricsQueryService,
     )
@@ -6,6 +6,12 @@ from app.domain.services.user import UserService
 from app.infrastructure.adapters.password_hasher_bcrypt import (
     BcryptPasswordHasher,
 )
+from app.infrastructure.adapters.password_hasher_multi import (
+    MultiAlgorithmPasswordHasher,
+)
+from app.infrastructure.adapters.password_hasher_scrypt import (
+    ScryptPasswordHasher,
+)
 from app.infrastructure.adapters.types import HasherSemaphore, HasherThreadPoolExecutor
 from app.infrastructure.adapters.user_id_generator_uuid import (
     UuidUserIdGenerator,
@@ -31,10 +37,29 @@ class DomainProvider(Provider):
         executor: HasherThreadPoolExecutor,
         semaphore: HasherSemaphore,
     ) -> PasswordHasher:
-        return BcryptPasswordHasher(
-            pepper=security.password.pepper.encode(),
-            work_factor=security.password.hasher_work_factor,
+        password = security.password
+        bcrypt_hasher = BcryptPasswordHasher(
+            pepper=password.pepper.encode(),
+            work_factor=password.hasher_work_factor,
+            executor=executor,
+            semaphore=semaphore,
+            semaphore_wait_timeout_s=password.hasher_semaphore_wait_timeout_s,
+        )
+        scrypt_hasher = ScryptPasswordHasher(
+            pepper=password.pepper.encode(),
+            cost_log2=password.hasher_scrypt_cost_log2,
+            block_size=password.hasher_scrypt_block_size,
+            parallelism=password.hasher_scrypt_parallelism,
             executor=executor,
             semaphore=semaphore,
-            semaphore_wait_timeout_s=security.password.hasher_semaphore_wait_timeout_s,
+            semaphore_wait_timeout_s=password.hasher_semaphore_wait_timeout_s,
+        )
+        if password.hasher_algorithm == "scrypt":
+            return MultiAlgorithmPasswordHasher(
+                primary=scrypt_hasher,
+                legacy=(bcrypt_hasher,),
+            )
+        return MultiAlgorithmPasswordHasher(
+            primary=bcrypt_hasher,
+            legacy=(scrypt_hasher,),
         )
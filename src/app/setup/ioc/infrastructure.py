@@ -5,6 +5,7 @@ from concurrent.futures import ThreadPoolExecutor
 from typing import cast
 
 from dishka import Provider, Scope, provide, provide_all
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -12,11 +13,18 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from app.infrastructure.adapters.principal_cache import InMemoryPrincipalCache
+from app.infrastructure.adapters.reservation_sweeper_sqla import ReservationSweeper
 from app.infrastructure.adapters.types import (
     HasherSemaphore,
     HasherThreadPoolExecutor,
     MainAsyncSession,
 )
+from app.infrastructure.adapters.user_count_cache import InMemoryUserCountCache
+from app.infrastructure.adapters.user_data_mapper_sqla import SqlaUserDataMapper
+from app.infrastructure.adapters.user_directory_snapshot import UserDirectorySnapshot
+from app.infrastructure.adapters.user_reader_cache import UserQueryCache
+from app.infrastructure.adapters.username_bloom_filter import UsernameBloomFilter
 from app.infrastructure.auth.adapters.data_mapper_sqla import (
     SqlaAuthSessionDataMapper,
 )
@@ -40,11 +48,24 @@ from app.infrastructure.auth.session.ports.transaction_manager import (
 from app.infrastructure.auth.session.ports.transport import AuthSessionTransport
 from app.infrastructure.auth.session.service import AuthSessionService
 from app.infrastructure.auth.session.timer_utc import UtcAuthSessionTimer
+from app.infrastructure.auth.throttling.log_in_throttle import LogInThrottle
+from app.infrastructure.auth.throttling.ports.client_address import (
+    ClientAddressProvider,
+)
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.presentation.http.auth.adapters.client_address_starlette import (
+    StarletteClientAddressProvider,
+)
 from app.presentation.http.auth.adapters.session_transport_jwt_cookie import (
     JwtCookieAuthSessionTransport,
 )
 from app.setup.config.database import PostgresSettings, SqlaEngineSettings
+from app.setup.config.principal_cache import PrincipalCacheSettings
 from app.setup.config.security import SecuritySettings
+from app.setup.config.user_count import UserCountSettings
+from app.setup.config.user_directory import UserDirectorySettings
+from app.setup.config.user_query_cache import UserQueryCacheSettings
+from app.setup.config.username_filter import UsernameFilterSettings
 
 log = logging.getLogger(__name__)
 
@@ -60,7 +81,7 @@ class MainAdaptersProvider(Provider):
         executor = HasherThreadPoolExecutor(
             ThreadPoolExecutor(
                 max_workers=security.password.hasher_max_threads,
-                thread_name_prefix="bcrypt",
+                thread_name_prefix="hasher",
             )
         )
         yield executor
@@ -72,6 +93,33 @@ class MainAdaptersProvider(Provider):
     def provide_hasher_semaphore(self, security: SecuritySettings) -> HasherSemaphore:
         return HasherSemaphore(asyncio.Semaphore(security.password.hasher_max_threads))
 
+    @provide
+    def provide_user_count_cache(
+        self,
+        user_count: UserCountSettings,
+    ) -> InMemoryUserCountCache:
+        return InMemoryUserCountCache(ttl_s=user_count.cache_ttl_s)
+
+    @provide
+    def provide_principal_cache(
+        self,
+        principal_cache: PrincipalCacheSettings,
+    ) -> InMemoryPrincipalCache:
+        return InMemoryPrincipalCache(
+            max_age_s=principal_cache.max_age_s,
+            max_entries=principal_cache.max_entries,
+        )
+
+    @provide
+    def provide_user_query_cache(
+        self,
+        user_query_cache: UserQueryCacheSettings,
+    ) -> UserQueryCache:
+        return UserQueryCache(
+            ttl_s=user_query_cache.ttl_s,
+            max_entries=user_query_cache.max_entries,
+        )
+
 
 class PersistenceSqlaProvider(Provider):
     @provide(scope=Scope.APP)
@@ -109,6 +157,80 @@ class PersistenceSqlaProvider(Provider):
         log.debug("Async session maker initialized.")
         return async_session_factory
 
+    @provide(scope=Scope.APP)
+    async def provide_username_bloom_filter(
+        self,
+        settings: UsernameFilterSettings,
+        async_session_factory: async_sessionmaker[AsyncSession],
+    ) -> AsyncIterator[UsernameBloomFilter]:
+        """Stays empty and answers "maybe" to every lookup if disabled."""
+        if settings.enabled and settings.snapshot_path:
+            username_filter = UsernameBloomFilter.from_snapshot(
+                settings.snapshot_path,
+                capacity=settings.capacity,
+                false_positive_rate=settings.false_positive_rate,
+                refresh_interval_s=settings.refresh_interval_s,
+            )
+        else:
+            username_filter = UsernameBloomFilter(
+                enabled=settings.enabled,
+                capacity=settings.capacity,
+                false_positive_rate=settings.false_positive_rate,
+                refresh_interval_s=settings.refresh_interval_s,
+            )
+        if settings.enabled:
+            log.debug("Building username filter...")
+            try:
+                async with async_session_factory() as session:
+                    data_mapper = SqlaUserDataMapper(
+                        cast(MainAsyncSession, session),
+                        username_filter,
+                    )
+                    await username_filter.refresh(data_mapper.stream_usernames)
+                log.debug("Username filter built: %s", username_filter.metrics)
+            except SQLAlchemyError:
+                log.exception("Username filter build failed.")
+        yield username_filter
+        if settings.enabled and settings.snapshot_path:
+            log.debug("Saving username filter snapshot...")
+            try:
+                username_filter.save_snapshot(settings.snapshot_path)
+            except OSError:
+                log.exception("Username filter snapshot not saved.")
+
+    @provide(scope=Scope.APP)
+    async def provide_user_directory_snapshot(
+        self,
+        settings: UserDirectorySettings,
+        async_session_factory: async_sessionmaker[AsyncSession],
+    ) -> AsyncIterator[UserDirectorySnapshot]:
+        """Serves no page if disabled."""
+        snapshot = UserDirectorySnapshot(
+            async_session_factory,
+            enabled=settings.enabled,
+            refresh_interval_s=settings.refresh_interval_s,
+            refresh_delay_s=settings.refresh_delay_s,
+        )
+        if settings.enabled:
+            log.debug("Loading user directory...")
+            try:
+                await snapshot.load()
+            except (SQLAlchemyError, DataMapperError):
+                log.exception("User directory load failed.")
+        yield snapshot
+        await snapshot.close()
+
+    @provide(scope=Scope.APP)
+    async def provide_reservation_sweeper(
+        self,
+        async_session_factory: async_sessionmaker[AsyncSession],
+        username_filter: UsernameBloomFilter,
+    ) -> AsyncIterator[ReservationSweeper]:
+        sweeper = ReservationSweeper(async_session_factory, username_filter)
+        sweeper.start()
+        yield sweeper
+        await sweeper.close()
+
     @provide(scope=Scope.REQUEST)
     async def provide_main_async_session(
         self,
@@ -172,6 +294,24 @@ class AuthHandlersProvider(Provider):
         LogOutHandler,
     )
 
+    @provide(scope=Scope.APP)
+    def provide_log_in_throttle(self, security: SecuritySettings) -> LogInThrottle:
+        throttle = security.login_throttle
+        return LogInThrottle(
+            window_s=throttle.window_s,
+            max_failures_per_username=throttle.max_failures_per_username,
+            max_failures_per_address=throttle.max_failures_per_address,
+            backoff_base_s=throttle.backoff_base_s,
+            backoff_max_s=throttle.backoff_max_s,
+            max_tracked_keys=throttle.max_tracked_keys,
+        )
+
+    # Ports
+    client_address_provider = provide(
+        StarletteClientAddressProvider,
+        provides=ClientAddressProvider,
+    )
+
 
 def infrastructure_providers() -> tuple[Provider, ...]:
     return (
@@ -5,6 +5,8 @@ from app.presentation.http.auth.access_token_processor_jwt import (
     JwtAccessTokenProcessor,
 )
 from app.presentation.http.auth.cookie_params import CookieParams
+from app.presentation.http.idempotency.store import IdempotencyStore
+from app.setup.config.idempotency import IdempotencySettings
 from app.setup.config.security import SecuritySettings
 
 
@@ -26,3 +28,13 @@ class PresentationProvider(Provider):
     @provide
     def provide_cookie_params(self, security: SecuritySettings) -> CookieParams:
         return CookieParams(secure=security.cookies.secure)
+
+    @provide(scope=Scope.APP)
+    def provide_idempotency_store(
+        self,
+        idempotency: IdempotencySettings,
+    ) -> IdempotencyStore:
+        return IdempotencyStore(
+            ttl_s=idempotency.ttl_s,
+            max_keys=idempotency.max_keys,
+        )
@@ -1,9 +1,15 @@
 from dishka import Provider, Scope, from_context, provide
 
 from app.setup.config.database import PostgresSettings, SqlaEngineSettings
+from app.setup.config.idempotency import IdempotencySettings
 from app.setup.config.logs import LoggingSettings
+from app.setup.config.principal_cache import PrincipalCacheSettings
 from app.setup.config.security import SecuritySettings
 from app.setup.config.settings import AppSettings
+from app.setup.config.user_count import UserCountSettings
+from app.setup.config.user_directory import UserDirectorySettings
+from app.setup.config.user_query_cache import UserQueryCacheSettings
+from app.setup.config.username_filter import UsernameFilterSettings
 
 
 class SettingsProvider(Provider):
@@ -26,3 +32,27 @@ class SettingsProvider(Provider):
     @provide
     def logs(self, settings: AppSettings) -> LoggingSettings:
         return settings.logs
+
+    @provide
+    def idempotency(self, settings: AppSettings) -> IdempotencySettings:
+        return settings.idempotency
+
+    @provide
+    def username_filter(self, settings: AppSettings) -> UsernameFilterSettings:
+        return settings.username_filter
+
+    @provide
+    def user_count(self, settings: AppSettings) -> UserCountSettings:
+        return settings.user_count
+
+    @provide
+    def user_query_cache(self, settings: AppSettings) -> UserQueryCacheSettings:
+        return settings.user_query_cache
+
+    @provide
+    def user_directory(self, settings: AppSettings) -> UserDirectorySettings:
+        return settings.user_directory
+
+    @provide
+    def principal_cache(self, settings: AppSettings) -> PrincipalCacheSettings:
+        return settings.principal_cache
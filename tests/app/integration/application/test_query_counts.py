@@ -0,0 +1,392 @@
+"""
+Statements per interactor, against the SQLAlchemy adapters, so that
+added round trips show up, and their handling of concurrent changes.
+Needs a PostgreSQL database in `TEST_POSTGRES_DSN` (SQLAlchemy URL)
+with `pg_trgm` available; tables are created in a throwaway schema
+and dropped afterwards.
+"""
+
+import os
+import uuid
+from collections.abc import AsyncIterator
+from functools import partial
+from typing import Any, cast
+from unittest.mock import create_autospec
+
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.application.commands.grant_admin import GrantAdminInteractor, GrantAdminRequest
+from app.application.commands.set_user_password import (
+    SetUserPasswordInteractor,
+    SetUserPasswordRequest,
+)
+from app.application.common.exceptions.concurrency import (
+    ConcurrentModificationError,
+)
+from app.application.common.ports.access_revoker import AccessRevoker
+from app.application.common.ports.identity_provider import IdentityProvider
+from app.application.common.ports.principal_cache import Principal
+from app.application.common.services.conflict_retry import ConflictRetryService
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.entities.user import User
+from app.domain.enums.user_role import UserRole
+from app.domain.ports.password_hasher import PasswordHasher
+from app.domain.ports.user_id_generator import UserIdGenerator
+from app.domain.services.user import UserService
+from app.domain.value_objects.raw_password import RawPassword
+from app.domain.value_objects.user_password_hash import UserPasswordHash
+from app.infrastructure.adapters.main_transaction_manager_sqla import (
+    SqlaMainTransactionManager,
+)
+from app.infrastructure.adapters.principal_cache import InMemoryPrincipalCache
+from app.infrastructure.adapters.principal_reader_sqla import SqlaPrincipalReader
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.adapters.user_count_cache import InMemoryUserCountCache
+from app.infrastructure.adapters.user_data_mapper_sqla import SqlaUserDataMapper
+from app.infrastructure.adapters.username_bloom_filter import UsernameBloomFilter
+from app.infrastructure.adapters.users_version_sqla import SqlaUsersVersion
+from app.infrastructure.auth.handlers.change_password import (
+    ChangePasswordHandler,
+    ChangePasswordRequest,
+)
+from app.infrastructure.persistence_sqla.mappings.all import map_tables
+from app.infrastructure.persistence_sqla.registry import mapper_registry
+from tests.app.integration.query_log import QueryLog
+from tests.app.unit.factories.user_entity import create_user
+from tests.app.unit.factories.value_objects import create_username
+
+TEST_POSTGRES_DSN = os.environ.get("TEST_POSTGRES_DSN")
+
+pytestmark = pytest.mark.skipif(
+    TEST_POSTGRES_DSN is None,
+    reason="TEST_POSTGRES_DSN is not set",
+)
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    if inspect(User, raiseerr=False) is None:
+        map_tables()
+    schema = f"test_queries_{uuid.uuid4().hex[:8]}"
+    admin_engine = create_async_engine(cast(str, TEST_POSTGRES_DSN))
+    async with admin_engine.begin() as connection:
+        if not (
+            await connection.execute(
+                text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+            )
+        ).first():
+            pytest.skip("pg_trgm is not available")
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await connection.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = create_async_engine(
+        cast(str, TEST_POSTGRES_DSN),
+        connect_args={"options": f"-csearch_path={schema},public"},
+    )
+    try:
+        async with engine.begin() as connection:
+            # Unchecked: tables of the same name in `public` are visible too
+            await connection.run_sync(
+                partial(mapper_registry.metadata.create_all, checkfirst=False)
+            )
+        yield engine
+    finally:
+        await engine.dispose()
+        async with admin_engine.begin() as connection:
+            await connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        await admin_engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    # As configured for requests
+    return async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+
+@pytest.fixture
+async def admin(session_factory: async_sessionmaker[AsyncSession]) -> User:
+    admin = create_user(username=create_username("admin"), role=UserRole.SUPER_ADMIN)
+    async with session_factory() as session:
+        session.add(admin)
+        await session.commit()
+    return admin
+
+
+@pytest.fixture
+async def target(session_factory: async_sessionmaker[AsyncSession]) -> User:
+    target = create_user(username=create_username("target"))
+    async with session_factory() as session:
+        session.add(target)
+        await session.commit()
+    return target
+
+
+@pytest.fixture
+async def session(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncIterator[MainAsyncSession]:
+    async with session_factory() as session:
+        yield cast(MainAsyncSession, session)
+
+
+def create_user_command_gateway(session: MainAsyncSession) -> SqlaUserDataMapper:
+    return SqlaUserDataMapper(
+        session,
+        UsernameBloomFilter(
+            enabled=True,
+            capacity=1000,
+            false_positive_rate=0.01,
+            refresh_interval_s=0,
+        ),
+    )
+
+
+@pytest.fixture
+def user_command_gateway(session: MainAsyncSession) -> SqlaUserDataMapper:
+    return create_user_command_gateway(session)
+
+
+@pytest.fixture
+def conflict_retry_service(session: MainAsyncSession) -> ConflictRetryService:
+    return ConflictRetryService(SqlaMainTransactionManager(session))
+
+
+@pytest.fixture
+def principal_cache() -> InMemoryPrincipalCache:
+    return InMemoryPrincipalCache(max_age_s=60, max_entries=10)
+
+
+@pytest.fixture
+def current_user_service(
+    session_factory: async_sessionmaker[AsyncSession],
+    admin: User,
+    user_command_gateway: SqlaUserDataMapper,
+    principal_cache: InMemoryPrincipalCache,
+) -> CurrentUserService:
+    identity_provider = create_autospec(IdentityProvider, instance=True)
+    identity_provider.get_current_user_id.return_value = admin.id_
+    return CurrentUserService(
+        identity_provider,
+        user_command_gateway,
+        create_autospec(AccessRevoker, instance=True),
+        principal_cache,
+        SqlaPrincipalReader(session_factory),
+    )
+
+
+@pytest.fixture
+def user_service() -> UserService:
+    password_hasher: Any = create_autospec(PasswordHasher, instance=True)
+    password_hasher.hash.return_value = UserPasswordHash(b"new")
+    password_hasher.verify.return_value = True
+    return UserService(
+        create_autospec(UserIdGenerator, instance=True),
+        password_hasher,
+    )
+
+
+@pytest.mark.parametrize(
+    ("is_principal_cached", "expected"),
+    [
+        # Principal (on a connection of its own), target,
+        # role if unchanged since read, users version
+        pytest.param(False, 4, id="principal-read"),
+        pytest.param(True, 3, id="principal-cached"),
+    ],
+)
+async def test_grant_admin(
+    engine: AsyncEngine,
+    session: MainAsyncSession,
+    admin: User,
+    target: User,
+    user_command_gateway: SqlaUserDataMapper,
+    principal_cache: InMemoryPrincipalCache,
+    current_user_service: CurrentUserService,
+    conflict_retry_service: ConflictRetryService,
+    user_service: UserService,
+    is_principal_cached: bool,
+    expected: int,
+) -> None:
+    if is_principal_cached:
+        principal_cache.store(Principal.from_user(admin), version=0)
+    sut = GrantAdminInteractor(
+        current_user_service,
+        conflict_retry_service,
+        user_command_gateway,
+        user_service,
+        SqlaMainTransactionManager(session),
+        InMemoryUserCountCache(ttl_s=0),
+        SqlaUsersVersion(session),
+        principal_cache,
+    )
+
+    with QueryLog(engine) as query_log:
+        await sut.execute(GrantAdminRequest(user_id=target.id_.value))
+
+    assert len(query_log.statements) == expected, query_log.statements
+
+
+async def test_set_user_password(
+    engine: AsyncEngine,
+    session: MainAsyncSession,
+    target: User,
+    user_command_gateway: SqlaUserDataMapper,
+    current_user_service: CurrentUserService,
+    conflict_retry_service: ConflictRetryService,
+    user_service: UserService,
+) -> None:
+    sut = SetUserPasswordInteractor(
+        current_user_service,
+        conflict_retry_service,
+        user_command_gateway,
+        user_service,
+        SqlaMainTransactionManager(session),
+    )
+
+    with QueryLog(engine) as query_log:
+        await sut.execute(
+            SetUserPasswordRequest(user_id=target.id_.value, password="password1")
+        )
+
+    # Principal, target, password hash if unchanged since read
+    assert len(query_log.statements) == 3, query_log.statements
+
+
+async def test_change_password(
+    engine: AsyncEngine,
+    session: MainAsyncSession,
+    current_user_service: CurrentUserService,
+    user_service: UserService,
+) -> None:
+    sut = ChangePasswordHandler(
+        current_user_service,
+        user_service,
+        SqlaMainTransactionManager(session),
+    )
+
+    with QueryLog(engine) as query_log:
+        await sut.execute(
+            ChangePasswordRequest(
+                current_password="password1",
+                new_password="password2",
+            )
+        )
+
+    # Current user with their password hash, password hash if unchanged since read
+    assert len(query_log.statements) == 2, query_log.statements
+
+
+async def test_change_password_fails_on_concurrent_change(
+    session_factory: async_sessionmaker[AsyncSession],
+    session: MainAsyncSession,
+    admin: User,
+    current_user_service: CurrentUserService,
+    user_service: UserService,
+) -> None:
+    sut = ChangePasswordHandler(
+        current_user_service,
+        user_service,
+        SqlaMainTransactionManager(session),
+    )
+    hash_password = user_service.hash_password
+
+    async def hash_password_meanwhile_changed(
+        raw_password: RawPassword,
+    ) -> UserPasswordHash:
+        async with session_factory() as other_session:
+            await create_user_command_gateway(
+                cast(MainAsyncSession, other_session)
+            ).set_role_many([admin.id_], role=UserRole.ADMIN)
+            await other_session.commit()
+        return await hash_password(raw_password)
+
+    user_service.hash_password = hash_password_meanwhile_changed  # type: ignore[method-assign]
+
+    with pytest.raises(ConcurrentModificationError):
+        await sut.execute(
+            ChangePasswordRequest(
+                current_password="password1",
+                new_password="password2",
+            )
+        )
+
+    async with session_factory() as other_session:
+        row = (
+            await other_session.execute(
+                text("SELECT role, password_hash FROM users WHERE id = :id"),
+                {"id": admin.id_.value},
+            )
+        ).one()
+    # The concurrent change is kept, the new hash isn't applied
+    assert (row.role, row.password_hash) == (
+        UserRole.ADMIN.name,
+        admin.password_hash.value,
+    )
+
+
+async def test_current_principal_of_user_in_session(
+    engine: AsyncEngine,
+    admin: User,
+    user_command_gateway: SqlaUserDataMapper,
+    current_user_service: CurrentUserService,
+) -> None:
+    with QueryLog(engine) as query_log:
+        # Kept in the session while referenced
+        user = await user_command_gateway.read_by_id(admin.id_)
+        principal = await current_user_service.get_current_principal()
+
+    assert user is not None
+    assert principal == Principal.from_user(admin)
+    assert len(query_log.statements) == 1, query_log.statements
+
+
+async def test_grant_admin_retries_on_concurrent_change(
+    engine: AsyncEngine,
+    session_factory: async_sessionmaker[AsyncSession],
+    session: MainAsyncSession,
+    target: User,
+    user_command_gateway: SqlaUserDataMapper,
+    current_user_service: CurrentUserService,
+    conflict_retry_service: ConflictRetryService,
+    user_service: UserService,
+    principal_cache: InMemoryPrincipalCache,
+) -> None:
+    sut = GrantAdminInteractor(
+        current_user_service,
+        conflict_retry_service,
+        user_command_gateway,
+        user_service,
+        SqlaMainTransactionManager(session),
+        InMemoryUserCountCache(ttl_s=0),
+        SqlaUsersVersion(session),
+        principal_cache,
+    )
+    # Kept in the session while referenced, as read before the change
+    stale_target = await user_command_gateway.read_by_id(target.id_)
+    async with session_factory() as other_session:
+        await create_user_command_gateway(
+            cast(MainAsyncSession, other_session)
+        ).set_activation_many([target.id_], is_active=False)
+        await other_session.commit()
+
+    with QueryLog(engine) as query_log:
+        await sut.execute(GrantAdminRequest(user_id=target.id_.value))
+
+    async with engine.connect() as connection:
+        row = (
+            await connection.execute(
+                text("SELECT role, is_active, version FROM users WHERE id = :id"),
+                {"id": target.id_.value},
+            )
+        ).one()
+    # Neither change is lost
+    assert stale_target is not None
+    assert (row.role, row.is_active, row.version) == (UserRole.ADMIN.name, False, 3)
+    # Principal, rejected role update; target, role, users version
+    assert len(query_log.statements) == 5, query_log.statements
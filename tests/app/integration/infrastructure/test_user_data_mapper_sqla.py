@@ -0,0 +1,314 @@
+"""
+Needs a PostgreSQL database in `TEST_POSTGRES_DSN` (SQLAlchemy URL)
+with `pg_trgm` available; tables are created in a throwaway schema
+and dropped afterwards.
+"""
+
+import os
+import uuid
+from collections.abc import AsyncIterator
+from datetime import timedelta
+from functools import partial
+from typing import cast
+
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.application.common.ports.principal_cache import Principal
+from app.domain.entities.user import User
+from app.domain.enums.user_role import UserRole
+from app.domain.value_objects.user_password_hash import UserPasswordHash
+from app.domain.value_objects.username import Username
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.adapters.user_data_mapper_sqla import SqlaUserDataMapper
+from app.infrastructure.adapters.username_bloom_filter import UsernameBloomFilter
+from app.infrastructure.persistence_sqla.mappings.all import map_tables
+from app.infrastructure.persistence_sqla.registry import mapper_registry
+from tests.app.integration.query_log import QueryLog
+from tests.app.unit.factories.user_entity import create_user
+from tests.app.unit.factories.value_objects import create_user_id
+
+TEST_POSTGRES_DSN = os.environ.get("TEST_POSTGRES_DSN")
+
+pytestmark = pytest.mark.skipif(
+    TEST_POSTGRES_DSN is None,
+    reason="TEST_POSTGRES_DSN is not set",
+)
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    if inspect(User, raiseerr=False) is None:
+        map_tables()
+    schema = f"test_mapper_{uuid.uuid4().hex[:8]}"
+    admin_engine = create_async_engine(cast(str, TEST_POSTGRES_DSN))
+    async with admin_engine.begin() as connection:
+        if not (
+            await connection.execute(
+                text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+            )
+        ).first():
+            pytest.skip("pg_trgm is not available")
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await connection.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = create_async_engine(
+        cast(str, TEST_POSTGRES_DSN),
+        connect_args={"options": f"-csearch_path={schema},public"},
+    )
+    try:
+        async with engine.begin() as connection:
+            # Unchecked: tables of the same name in `public` are visible too
+            await connection.run_sync(
+                partial(mapper_registry.metadata.create_all, checkfirst=False)
+            )
+        yield engine
+    finally:
+        await engine.dispose()
+        async with admin_engine.begin() as connection:
+            await connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        await admin_engine.dispose()
+
+
+@pytest.fixture
+async def user(engine: AsyncEngine) -> User:
+    user = create_user(role=UserRole.ADMIN)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        session.add(user)
+        await session.commit()
+    return user
+
+
+@pytest.fixture
+async def session(engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+
+
+@pytest.fixture
+def sut(session: AsyncSession) -> SqlaUserDataMapper:
+    return SqlaUserDataMapper(
+        cast(MainAsyncSession, session),
+        UsernameBloomFilter(
+            enabled=True,
+            capacity=1000,
+            false_positive_rate=0.01,
+            refresh_interval_s=0,
+        ),
+    )
+
+
+async def test_reads_principal(sut: SqlaUserDataMapper, user: User) -> None:
+    assert await sut.read_principal_by_id(user.id_) == Principal(
+        id_=user.id_,
+        role=UserRole.ADMIN,
+        is_active=True,
+    )
+    assert await sut.read_principal_by_id(create_user_id()) is None
+
+
+async def test_defers_password_hash(sut: SqlaUserDataMapper, user: User) -> None:
+    read = await sut.read_by_id(user.id_)
+
+    assert read is not None
+    assert read.username == user.username
+    with pytest.raises(InvalidRequestError):
+        _ = read.password_hash
+
+
+async def test_loads_password_hash_when_asked_for(
+    sut: SqlaUserDataMapper,
+    user: User,
+) -> None:
+    # Already in the identity map without it
+    await sut.read_by_id(user.id_)
+
+    by_id = await sut.read_by_id(user.id_, with_password_hash=True)
+    by_username = await sut.read_by_username(user.username, with_password_hash=True)
+
+    assert by_id is not None
+    assert by_id is by_username
+    assert by_id.password_hash == user.password_hash
+
+
+async def test_flushes_changes_without_password_hash(
+    sut: SqlaUserDataMapper,
+    session: AsyncSession,
+    user: User,
+) -> None:
+    read = await sut.read_by_id(user.id_)
+    assert read is not None
+
+    read.role = UserRole.USER
+    await session.commit()
+
+    assert await sut.read_principal_by_id(user.id_) == Principal(
+        id_=user.id_,
+        role=UserRole.USER,
+        is_active=True,
+    )
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        pytest.param({}, 1, id="from-session"),
+        pytest.param({"with_password_hash": True}, 2, id="password-hash-loaded"),
+        pytest.param({"for_update": True}, 2, id="locked"),
+    ],
+)
+async def test_reads_users_in_session_without_query(
+    engine: AsyncEngine,
+    sut: SqlaUserDataMapper,
+    user: User,
+    kwargs: dict[str, bool],
+    expected: int,
+) -> None:
+    with QueryLog(engine) as query_log:
+        first = await sut.read_by_id(user.id_)
+        second = await sut.read_by_id(user.id_, **kwargs)
+        principal = await sut.read_principal_by_id(user.id_)
+
+    assert first is second
+    assert principal == Principal.from_user(user)
+    assert len(query_log.statements) == expected, query_log.statements
+
+
+def create_placeholder(username: str) -> User:
+    return create_user(
+        username=Username(username),
+        password_hash=UserPasswordHash(b""),
+        is_active=False,
+    )
+
+
+async def read_reserved_at(session: AsyncSession, user: User) -> object:
+    return (
+        await session.execute(
+            text("SELECT reserved_at FROM users WHERE id = :id"),
+            {"id": user.id_.value},
+        )
+    ).scalar_one_or_none()
+
+
+async def test_completes_only_unchanged_own_reservation(
+    sut: SqlaUserDataMapper,
+    session: AsyncSession,
+) -> None:
+    placeholder, changed = create_placeholder("bobby"), create_placeholder("carol")
+    assert await sut.reserve(placeholder)
+    assert await sut.reserve(changed)
+    await session.execute(
+        text("UPDATE users SET version = version + 1 WHERE id = :id"),
+        {"id": changed.id_.value},
+    )
+    await session.commit()
+    other = SqlaUserDataMapper(
+        cast(MainAsyncSession, session),
+        UsernameBloomFilter(
+            enabled=False,
+            capacity=1,
+            false_positive_rate=0.5,
+            refresh_interval_s=0,
+        ),
+    )
+
+    assert not await other.complete_reservation(placeholder)
+    assert not await sut.complete_reservation(changed)
+    assert await sut.complete_reservation(placeholder)
+    await session.commit()
+    await sut.cancel_reservation(placeholder)
+    await session.commit()
+
+    assert await read_reserved_at(session, placeholder) is None
+
+
+async def test_deletes_only_expired_reservations(
+    sut: SqlaUserDataMapper,
+    session: AsyncSession,
+    user: User,
+) -> None:
+    expired, fresh = create_placeholder("bobby"), create_placeholder("carol")
+    assert await sut.reserve(expired)
+    assert await sut.reserve(fresh)
+    await session.execute(
+        text("UPDATE users SET reserved_at = now() - :age WHERE id = :id"),
+        {
+            "age": SqlaUserDataMapper.RESERVATION_TTL + timedelta(seconds=1),
+            "id": expired.id_.value,
+        },
+    )
+
+    assert await sut.delete_expired_reservations() == 1
+    await session.commit()
+
+    assert not await sut.complete_reservation(expired)
+    assert await read_reserved_at(session, fresh) is not None
+    assert await sut.read_principal_by_id(user.id_) is not None
+
+
+async def test_leaves_placeholders_out(
+    sut: SqlaUserDataMapper,
+    session: AsyncSession,
+    user: User,
+) -> None:
+    placeholder = create_placeholder("bobby")
+    assert await sut.reserve(placeholder)
+    await session.commit()
+    user_ids = [user.id_, placeholder.id_]
+
+    assert await sut.read_by_id(placeholder.id_) is None
+    assert await sut.read_by_id(placeholder.id_, for_update=True) is None
+    assert await sut.read_by_username(placeholder.username) is None
+    assert await sut.read_principal_by_id(placeholder.id_) is None
+    assert [read.id_ for read in await sut.read_many_by_ids(user_ids)] == [user.id_]
+    assert await sut.set_activation_many(user_ids, is_active=True) == set()
+    assert await sut.set_role_many(user_ids, role=UserRole.ADMIN) == set()
+    await session.commit()
+
+    assert await read_reserved_at(session, placeholder) is not None
+    assert await sut.complete_reservation(placeholder)
+
+
+async def stream_no_usernames(_: uuid.UUID) -> AsyncIterator[str]:  # noqa: RUF029
+    usernames: tuple[str, ...] = ()
+    for username in usernames:
+        yield username
+
+
+async def test_reads_username_unknown_to_filter(
+    session: AsyncSession,
+    user: User,
+) -> None:
+    username_filter = UsernameBloomFilter(
+        enabled=True,
+        capacity=1000,
+        false_positive_rate=0.01,
+        refresh_interval_s=3600,
+    )
+    # Scanned before the user was created by another process
+    await username_filter.refresh(stream_no_usernames)
+    sut = SqlaUserDataMapper(cast(MainAsyncSession, session), username_filter)
+
+    assert not await username_filter.might_contain(
+        user.username.value,
+        stream_no_usernames,
+    )
+    assert await sut.read_by_username(user.username) is not None
+
+
+async def test_streams_usernames_outside_session_transaction(
+    sut: SqlaUserDataMapper,
+    session: AsyncSession,
+    user: User,
+) -> None:
+    usernames = [username async for username in sut.stream_usernames(uuid.UUID(int=0))]
+
+    assert usernames == [user.username.value]
+    assert not session.in_transaction()
@@ -0,0 +1,285 @@
+"""
+Compares pages of `UserDirectorySnapshot` with those of `SqlaUserReader`,
+both leaving out placeholders of registrations in progress.
+Needs a PostgreSQL database in `TEST_POSTGRES_DSN` (SQLAlchemy URL)
+with `pg_trgm` available; tables are created in a throwaway schema
+and dropped afterwards.
+"""
+
+import asyncio
+import os
+import uuid
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from functools import partial
+from typing import cast
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.application.common.query_params.field_selection import (
+    FieldSelectionParams,
+)
+from app.application.common.query_params.filtering import (
+    UserFilteringParams,
+    UsernameMatch,
+)
+from app.application.common.query_params.offset_pagination import (
+    OffsetPaginationParams,
+)
+from app.application.common.query_params.sorting import SortingOrder, SortingParams
+from app.domain.enums.user_role import UserRole
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.adapters.user_count_cache import InMemoryUserCountCache
+from app.infrastructure.adapters.user_directory_snapshot import UserDirectorySnapshot
+from app.infrastructure.adapters.user_reader_sorting import SORTABLE_FIELDS
+from app.infrastructure.adapters.user_reader_sqla import SqlaUserReader
+from app.infrastructure.adapters.users_version_sqla import SqlaUsersVersion
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+from app.infrastructure.persistence_sqla.registry import mapper_registry
+
+TEST_POSTGRES_DSN = os.environ.get("TEST_POSTGRES_DSN")
+
+pytestmark = pytest.mark.skipif(
+    TEST_POSTGRES_DSN is None,
+    reason="TEST_POSTGRES_DSN is not set",
+)
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    schema = f"test_directory_{uuid.uuid4().hex[:8]}"
+    admin_engine = create_async_engine(cast(str, TEST_POSTGRES_DSN))
+    async with admin_engine.begin() as connection:
+        if not (
+            await connection.execute(
+                text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+            )
+        ).first():
+            pytest.skip("pg_trgm is not available")
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await connection.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = create_async_engine(
+        cast(str, TEST_POSTGRES_DSN),
+        connect_args={"options": f"-csearch_path={schema},public"},
+    )
+    try:
+        async with engine.begin() as connection:
+            # Unchecked: tables of the same name in `public` are visible too
+            await connection.run_sync(
+                partial(mapper_registry.metadata.create_all, checkfirst=False)
+            )
+            await connection.execute(
+                insert(users_table),
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        # Mixed case and lengths, so byte and length orders differ
+                        "username": f"{'uU'[i % 2]}ser_{i * 7919 % 1000}",
+                        "password_hash": b"",
+                        "role": list(UserRole)[i % len(UserRole)],
+                        "is_active": i % 10 != 0,
+                    }
+                    for i in range(1000)
+                ],
+            )
+            await connection.execute(
+                insert(users_table),
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "username": f"user_held_{i}",
+                        "password_hash": b"",
+                        "role": UserRole.USER,
+                        "is_active": False,
+                        "reserved_at": datetime.now(UTC),
+                    }
+                    for i in range(50)
+                ],
+            )
+        yield engine
+    finally:
+        await engine.dispose()
+        async with admin_engine.begin() as connection:
+            await connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        await admin_engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+@pytest.fixture
+async def sut(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncIterator[UserDirectorySnapshot]:
+    snapshot = UserDirectorySnapshot(
+        session_factory,
+        enabled=True,
+        refresh_interval_s=0,
+        refresh_delay_s=0.1,
+    )
+    await snapshot.load()
+    yield snapshot
+    await snapshot.close()
+
+
+async def read_version(session_factory: async_sessionmaker[AsyncSession]) -> int:
+    async with session_factory() as session:
+        return await SqlaUsersVersion(cast(MainAsyncSession, session)).read()
+
+
+@pytest.mark.parametrize("order", list(SortingOrder))
+@pytest.mark.parametrize(
+    "fields",
+    [pytest.param(fields, id=",".join(fields)) for fields in SORTABLE_FIELDS],
+)
+@pytest.mark.parametrize(
+    "filtering",
+    [
+        pytest.param(UserFilteringParams(), id="all"),
+        pytest.param(UserFilteringParams(username="user_1"), id="prefix"),
+        pytest.param(UserFilteringParams(role=UserRole.ADMIN), id="admins"),
+        pytest.param(UserFilteringParams(is_active=False), id="inactive"),
+        pytest.param(
+            UserFilteringParams(username="User_", is_active=True),
+            id="prefix-active",
+        ),
+    ],
+)
+async def test_serves_pages_of_sql_reader(
+    sut: UserDirectorySnapshot,
+    session_factory: async_sessionmaker[AsyncSession],
+    fields: tuple[str, ...],
+    order: SortingOrder,
+    filtering: UserFilteringParams,
+) -> None:
+    sorting = SortingParams(fields=fields, order=order)
+    version = await read_version(session_factory)
+
+    # Within every filtered set: the window count of an empty page is 0
+    for offset in (0, 15, 40):
+        pagination = OffsetPaginationParams(limit=20, offset=offset)
+        page = sut.read_page(version, pagination, sorting, filtering)
+        async with session_factory() as session:
+            expected = await SqlaUserReader(
+                cast(MainAsyncSession, session),
+                InMemoryUserCountCache(ttl_s=0),
+            ).read_all(pagination, sorting, filtering=filtering)
+
+        # Only unfiltered pages are always slices of a row order
+        assert page == expected or (page is None and filtering != UserFilteringParams())
+
+
+async def test_selects_fields(
+    sut: UserDirectorySnapshot,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    page = sut.read_page(
+        await read_version(session_factory),
+        OffsetPaginationParams(limit=2, offset=0),
+        SortingParams(fields=("username",), order=SortingOrder.ASC),
+        field_selection=FieldSelectionParams(fields=("username", "role")),
+    )
+
+    assert page is not None
+    assert [set(user) for user in page["users"]] == [{"username", "role"}] * 2
+
+
+async def test_falls_back_to_sql(
+    sut: UserDirectorySnapshot,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    page = sut.read_page(
+        await read_version(session_factory),
+        OffsetPaginationParams(limit=20, offset=0),
+        SortingParams(fields=("username",), order=SortingOrder.ASC),
+        UserFilteringParams(username="ser_", username_match=UsernameMatch.SUBSTRING),
+    )
+
+    assert page is None
+    assert sut.metrics["fallbacks"] == 1
+
+
+async def add_user(
+    session_factory: async_sessionmaker[AsyncSession],
+    username: str,
+) -> int:
+    async with session_factory() as session:
+        await session.execute(
+            insert(users_table).values(
+                id=uuid.uuid4(),
+                username=username,
+                password_hash=b"",
+                role=UserRole.USER,
+                is_active=True,
+            )
+        )
+        await session.commit()
+        await SqlaUsersVersion(cast(MainAsyncSession, session)).bump()
+    return await read_version(session_factory)
+
+
+async def test_serves_older_copy_while_reloading(
+    sut: UserDirectorySnapshot,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    pagination = OffsetPaginationParams(limit=1, offset=0)
+    sorting = SortingParams(fields=("username",), order=SortingOrder.ASC)
+    loaded_version = await read_version(session_factory)
+    await add_user(session_factory, "Aaron")
+    stale = sut.read_page(
+        await add_user(session_factory, "Aaron_2"),
+        pagination,
+        sorting,
+    )
+    version = await add_user(session_factory, "Aaron_3")
+
+    stale_again = sut.read_page(version, pagination, sorting)
+    for _ in range(100):  # Loaded in the background
+        if sut.metrics["version"] == version:
+            break
+        await asyncio.sleep(0.05)
+    page = sut.read_page(version, pagination, sorting)
+
+    assert stale is not None
+    assert stale_again == stale
+    assert stale.get("as_of_users_version") == loaded_version
+    assert stale["total"] == 1000
+    assert page is not None
+    assert "as_of_users_version" not in page
+    assert page["users"][0].get("username") == "Aaron"
+    # All three changes in a single load
+    assert (page["total"], sut.metrics["builds"]) == (1003, 2)
+    assert sut.metrics["served_stale"] == 2
+
+
+async def test_falls_back_to_sql_once_reload_fails(
+    sut: UserDirectorySnapshot,
+    session_factory: async_sessionmaker[AsyncSession],
+    engine: AsyncEngine,
+) -> None:
+    pagination = OffsetPaginationParams(limit=1, offset=0)
+    sorting = SortingParams(fields=("username",), order=SortingOrder.ASC)
+    version = await add_user(session_factory, "Aaron")
+    async with engine.begin() as connection:
+        await connection.execute(
+            text("ALTER TABLE users RENAME COLUMN username TO name")
+        )
+
+    assert sut.read_page(version, pagination, sorting) is not None
+    for _ in range(100):
+        if sut.metrics["fallbacks"]:
+            break
+        sut.read_page(version, pagination, sorting)
+        await asyncio.sleep(0.05)
+
+    assert sut.read_page(version, pagination, sorting) is None
+    assert sut.metrics["builds"] == 1
@@ -0,0 +1,323 @@
+"""
+EXPLAINs the queries of `SqlaUserReader` for every declared sorting,
+among placeholders of registrations in progress, which are never read.
+Needs a PostgreSQL database in `TEST_POSTGRES_DSN` (SQLAlchemy URL)
+with `pg_trgm` available; tables are created in a throwaway schema
+and dropped afterwards.
+"""
+
+import os
+import uuid
+from collections.abc import AsyncIterator, Iterator
+from datetime import UTC, datetime
+from functools import partial
+from typing import Any, cast
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from app.application.common.query_params.cursor_pagination import (
+    CursorPaginationParams,
+)
+from app.application.common.query_params.filtering import (
+    UserFilteringParams,
+    UsernameMatch,
+)
+from app.application.common.query_params.offset_pagination import (
+    OffsetPaginationParams,
+    TotalMode,
+)
+from app.application.common.query_params.sorting import SortingOrder, SortingParams
+from app.domain.enums.user_role import UserRole
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.adapters.user_count_cache import InMemoryUserCountCache
+from app.infrastructure.adapters.user_reader_sorting import SORTABLE_FIELDS
+from app.infrastructure.adapters.user_reader_sqla import SqlaUserReader
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+from app.infrastructure.persistence_sqla.registry import mapper_registry
+
+TEST_POSTGRES_DSN = os.environ.get("TEST_POSTGRES_DSN")
+
+pytestmark = pytest.mark.skipif(
+    TEST_POSTGRES_DSN is None,
+    reason="TEST_POSTGRES_DSN is not set",
+)
+
+SORT_NODE_TYPES = {"Sort", "Incremental Sort"}
+PLACEHOLDERS = 50
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    schema = f"test_plans_{uuid.uuid4().hex[:8]}"
+    admin_engine = create_async_engine(cast(str, TEST_POSTGRES_DSN))
+    async with admin_engine.begin() as connection:
+        if not (
+            await connection.execute(
+                text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+            )
+        ).first():
+            pytest.skip("pg_trgm is not available")
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await connection.execute(text(f"CREATE SCHEMA {schema}"))
+    # Too few rows for an index to beat a sequential scan on cost, so seq
+    # scans are priced out: a Sort node then means no index fits the order
+    engine = create_async_engine(
+        cast(str, TEST_POSTGRES_DSN),
+        connect_args={"options": f"-csearch_path={schema},public -cenable_seqscan=off"},
+    )
+    try:
+        async with engine.begin() as connection:
+            # Unchecked: tables of the same name in `public` are visible too
+            await connection.run_sync(
+                partial(mapper_registry.metadata.create_all, checkfirst=False)
+            )
+            await connection.execute(
+                insert(users_table),
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "username": f"user_{i:04}",
+                        "password_hash": b"",
+                        "role": list(UserRole)[i % len(UserRole)],
+                        "is_active": i % 10 != 0,
+                    }
+                    for i in range(1000)
+                ],
+            )
+            await connection.execute(
+                insert(users_table),
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "username": f"held_{i:04}",
+                        "password_hash": b"",
+                        "role": UserRole.USER,
+                        "is_active": False,
+                        "reserved_at": datetime.now(UTC),
+                    }
+                    for i in range(PLACEHOLDERS)
+                ],
+            )
+        async with engine.connect() as connection:
+            await connection.execution_options(isolation_level="AUTOCOMMIT")
+            await connection.execute(text("VACUUM ANALYZE users"))
+        yield engine
+    finally:
+        await engine.dispose()
+        async with admin_engine.begin() as connection:
+            await connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        await admin_engine.dispose()
+
+
+class QueryLog:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+        self.queries: list[tuple[str, Any]] = []
+
+    def __enter__(self) -> "QueryLog":
+        event.listen(self._engine.sync_engine, "before_cursor_execute", self._log)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        event.remove(self._engine.sync_engine, "before_cursor_execute", self._log)
+
+    def _log(self, *args: Any) -> None:
+        _, _, statement, parameters, _, _ = args
+        if "ORDER BY" in statement:
+            self.queries.append((statement, parameters))
+
+
+def iter_nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from iter_nodes(child)
+
+
+async def explain(
+    engine: AsyncEngine,
+    query: tuple[str, Any],
+) -> list[dict[str, Any]]:
+    statement, parameters = query
+    async with engine.connect() as connection:
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}",
+            parameters,
+        )
+        (plan,) = result.scalar_one()
+    return list(iter_nodes(plan["Plan"]))
+
+
+@pytest.mark.parametrize("order", list(SortingOrder))
+@pytest.mark.parametrize(
+    "fields",
+    [pytest.param(fields, id=",".join(fields)) for fields in SORTABLE_FIELDS],
+)
+async def test_reads_pages_by_index_only_scan(
+    engine: AsyncEngine,
+    fields: tuple[str, ...],
+    order: SortingOrder,
+) -> None:
+    sorting = SortingParams(fields=fields, order=order)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    with QueryLog(engine) as query_log:
+        async with session_factory() as session:
+            sut = SqlaUserReader(
+                cast(MainAsyncSession, session),
+                InMemoryUserCountCache(ttl_s=0),
+            )
+            await sut.read_all(OffsetPaginationParams(limit=20, offset=500), sorting)
+            first_page = await sut.read_all_by_cursor(
+                CursorPaginationParams(limit=20),
+                sorting,
+            )
+            await sut.read_all_by_cursor(
+                CursorPaginationParams(limit=20, cursor=first_page["next_cursor"]),
+                sorting,
+            )
+
+    assert len(query_log.queries) == 3
+    for query in query_log.queries:
+        node_types = {node["Node Type"] for node in await explain(engine, query)}
+        assert not SORT_NODE_TYPES & node_types, query[0]
+        assert "Index Only Scan" in node_types, query[0]
+
+
+@pytest.mark.parametrize(
+    "filtering",
+    [
+        pytest.param(UserFilteringParams(username="user_01"), id="prefix"),
+        pytest.param(
+            UserFilteringParams(
+                username="r_01",
+                username_match=UsernameMatch.SUBSTRING,
+            ),
+            id="substring",
+        ),
+    ],
+)
+async def test_searches_usernames_by_index(
+    engine: AsyncEngine,
+    filtering: UserFilteringParams,
+) -> None:
+    sorting = SortingParams(fields=("username",), order=SortingOrder.ASC)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    with QueryLog(engine) as query_log:
+        async with session_factory() as session:
+            sut = SqlaUserReader(
+                cast(MainAsyncSession, session),
+                InMemoryUserCountCache(ttl_s=0),
+            )
+            result = await sut.read_all(
+                OffsetPaginationParams(limit=20, offset=0),
+                sorting,
+                filtering=filtering,
+            )
+
+    assert result["total"] == 100
+    (query,) = query_log.queries
+    index_conds = [node.get("Index Cond", "") for node in await explain(engine, query)]
+    assert any("username" in cond for cond in index_conds), query[0]
+
+
+@pytest.mark.parametrize(
+    ("filtering", "fields", "index_name", "total"),
+    [
+        pytest.param(
+            UserFilteringParams(is_active=False),
+            ("id",),
+            "ix_users_inactive_id",
+            100,
+            id="inactive",
+        ),
+        pytest.param(
+            UserFilteringParams(role=UserRole.USER, is_active=False),
+            ("role", "username"),
+            "ix_users_inactive_role_username",
+            33,
+            id="inactive-users",
+        ),
+        pytest.param(
+            UserFilteringParams(role=UserRole.ADMIN),
+            ("id",),
+            "ix_users_admin_id",
+            333,
+            id="admins",
+        ),
+    ],
+)
+async def test_filters_by_partial_index(
+    engine: AsyncEngine,
+    filtering: UserFilteringParams,
+    fields: tuple[str, ...],
+    index_name: str,
+    total: int,
+) -> None:
+    sorting = SortingParams(fields=fields, order=SortingOrder.ASC)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    with QueryLog(engine) as query_log:
+        async with session_factory() as session:
+            sut = SqlaUserReader(
+                cast(MainAsyncSession, session),
+                InMemoryUserCountCache(ttl_s=60),
+            )
+            recounted = await sut.read_all(
+                OffsetPaginationParams(limit=20, offset=0),
+                sorting,
+                total_mode=TotalMode.CACHED,
+                filtering=filtering,
+            )
+            cached = await sut.read_all(
+                OffsetPaginationParams(limit=20, offset=20),
+                sorting,
+                total_mode=TotalMode.CACHED,
+                filtering=filtering,
+            )
+
+    assert (recounted["total"], recounted["total_mode"]) == (total, TotalMode.EXACT)
+    assert (cached["total"], cached["total_mode"]) == (total, TotalMode.CACHED)
+    for query in query_log.queries:
+        nodes = await explain(engine, query)
+        assert not SORT_NODE_TYPES & {node["Node Type"] for node in nodes}, query[0]
+        assert index_name in {node.get("Index Name") for node in nodes}, query[0]
+
+
+async def test_leaves_placeholders_out(engine: AsyncEngine) -> None:
+    sorting = SortingParams(fields=("username",), order=SortingOrder.ASC)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with session_factory() as session:
+        sut = SqlaUserReader(
+            cast(MainAsyncSession, session),
+            InMemoryUserCountCache(ttl_s=60),
+        )
+        counted = await sut.read_all(
+            OffsetPaginationParams(limit=1, offset=0),
+            sorting,
+            total_mode=TotalMode.EXACT,
+        )
+        recounted = await sut.read_all(
+            OffsetPaginationParams(limit=1, offset=0),
+            sorting,
+            total_mode=TotalMode.CACHED,
+        )
+        paged, cursor = [], None
+        while True:
+            page = await sut.read_all_by_cursor(
+                CursorPaginationParams(limit=500, cursor=cursor),
+                sorting,
+            )
+            paged += page["users"]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        streamed = [user async for user in await sut.stream_all(sorting)]
+
+    assert (counted["total"], recounted["total"]) == (1000, 1000)
+    for users in (paged, streamed):
+        assert len(users) == 1000
+        assert not any(user["username"].startswith("held_") for user in users)
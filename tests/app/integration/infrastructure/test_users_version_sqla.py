@@ -0,0 +1,75 @@
+"""
+Needs a PostgreSQL database in `TEST_POSTGRES_DSN` (SQLAlchemy URL);
+the sequence is created in a throwaway schema and dropped afterwards.
+"""
+
+import os
+import uuid
+from collections.abc import AsyncIterator
+from typing import cast
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.schema import CreateSequence
+
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.adapters.users_version_sqla import SqlaUsersVersion
+from app.infrastructure.persistence_sqla.mappings.user import users_version_seq
+
+TEST_POSTGRES_DSN = os.environ.get("TEST_POSTGRES_DSN")
+
+pytestmark = pytest.mark.skipif(
+    TEST_POSTGRES_DSN is None,
+    reason="TEST_POSTGRES_DSN is not set",
+)
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    schema = f"test_version_{uuid.uuid4().hex[:8]}"
+    engine = create_async_engine(
+        cast(str, TEST_POSTGRES_DSN),
+        connect_args={"options": f"-csearch_path={schema}"},
+    )
+    try:
+        async with engine.begin() as connection:
+            await connection.execute(text(f"CREATE SCHEMA {schema}"))
+            await connection.execute(CreateSequence(users_version_seq))
+        yield engine
+    finally:
+        async with engine.begin() as connection:
+            await connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        await engine.dispose()
+
+
+async def test_moves_on_each_bump_seen_by_other_sessions(engine: AsyncEngine) -> None:
+    session_factory = async_sessionmaker(engine)
+
+    async with session_factory() as writer, session_factory() as reader:
+        sut = SqlaUsersVersion(cast(MainAsyncSession, writer))
+        versions = [await SqlaUsersVersion(cast(MainAsyncSession, reader)).read()]
+        for _ in range(2):
+            # Uncommitted, as after a change's commit
+            await sut.bump()
+            # Each request reads it once
+            versions.append(
+                await SqlaUsersVersion(cast(MainAsyncSession, reader)).read()
+            )
+
+    assert versions[0] < versions[1] < versions[2]
+
+
+async def test_reads_once_until_bumped(engine: AsyncEngine) -> None:
+    session_factory = async_sessionmaker(engine)
+
+    async with session_factory() as session, session_factory() as other_session:
+        sut = SqlaUsersVersion(cast(MainAsyncSession, session))
+        other = SqlaUsersVersion(cast(MainAsyncSession, other_session))
+        first = await sut.read()
+        await other.bump()
+        unchanged = await sut.read()
+        await sut.bump()
+        bumped = await sut.read()
+
+    assert first == unchanged < bumped
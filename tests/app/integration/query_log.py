@@ -0,0 +1,37 @@
+from types import TracebackType
+from typing import Any, Self
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class QueryLog:
+    """
+    Statements sent through `engine` while entered, to assert how many
+    a request runs. Transaction control is not included.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+        self.statements: list[str] = []
+
+    def _record(
+        self,
+        connection: Any,
+        cursor: Any,
+        statement: str,
+        *args: Any,
+    ) -> None:
+        self.statements.append(statement)
+
+    def __enter__(self) -> Self:
+        event.listen(self._engine.sync_engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        event.remove(self._engine.sync_engine, "before_cursor_execute", self._record)
@@ -0,0 +1,187 @@
+"""
+Benchmark of the async hashing path: `BcryptPasswordHasher.hash`/`verify`
+driven through a real thread pool executor and semaphore.
+
+Usage:
+    python -m tests.app.performance.benchmark_password_hasher_async \\
+        --work-factors 10 11 --threads 1 4 --concurrency 1 8 64 \\
+        --operations 64 --output report.json
+
+Every combination of work factor, thread count, concurrency and
+operation (hash, verify) is measured separately. The JSON report
+contains throughput, latency percentiles (semaphore wait included),
+semaphore wait percentiles and the `PasswordHasherBusyError` rate.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+from app.domain.value_objects.raw_password import RawPassword
+from app.infrastructure.adapters.password_hasher_bcrypt import BcryptPasswordHasher
+from app.infrastructure.adapters.types import HasherSemaphore, HasherThreadPoolExecutor
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
+
+PEPPER = b"Cayenne!"
+
+Operation = Literal["hash", "verify"]
+
+
+class TimedSemaphore(asyncio.Semaphore):
+    """Records how long each `acquire` waited, including timed-out ones."""
+
+    def __init__(self, value: int) -> None:
+        super().__init__(value)
+        self.waits_s: list[float] = []
+
+    async def acquire(self) -> Literal[True]:
+        started = time.perf_counter()
+        try:
+            return await super().acquire()
+        finally:
+            self.waits_s.append(time.perf_counter() - started)
+
+
+def percentiles_ms(samples_s: list[float]) -> dict[str, float | None]:
+    if not samples_s:
+        return {"p50": None, "p95": None, "p99": None, "max": None}
+    if len(samples_s) == 1:
+        only = samples_s[0] * 1000
+        return {"p50": only, "p95": only, "p99": only, "max": only}
+    cuts = statistics.quantiles(samples_s, n=100, method="inclusive")
+    return {
+        "p50": cuts[49] * 1000,
+        "p95": cuts[94] * 1000,
+        "p99": cuts[98] * 1000,
+        "max": max(samples_s) * 1000,
+    }
+
+
+async def run_case(
+    *,
+    operation: Operation,
+    work_factor: int,
+    threads: int,
+    concurrency: int,
+    operations: int,
+    semaphore_wait_timeout_s: float,
+) -> dict[str, Any]:
+    raw_password = RawPassword("raw_password")
+    semaphore = TimedSemaphore(threads)
+    with ThreadPoolExecutor(
+        max_workers=threads,
+        thread_name_prefix="hasher",
+    ) as executor:
+        hasher = BcryptPasswordHasher(
+            pepper=PEPPER,
+            work_factor=work_factor,
+            executor=HasherThreadPoolExecutor(executor),
+            semaphore=HasherSemaphore(semaphore),
+            semaphore_wait_timeout_s=semaphore_wait_timeout_s,
+        )
+        hashed = hasher.hash_sync(raw_password)
+        call: Callable[[], Awaitable[object]]
+        if operation == "hash":
+            call = lambda: hasher.hash(raw_password)  # noqa: E731
+        else:
+            call = lambda: hasher.verify(raw_password, hashed)  # noqa: E731
+
+        latencies_s: list[float] = []
+        busy_errors = 0
+        remaining = operations
+
+        async def worker() -> None:
+            nonlocal remaining, busy_errors
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                try:
+                    await call()
+                except PasswordHasherBusyError:
+                    busy_errors += 1
+                else:
+                    latencies_s.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        async with asyncio.TaskGroup() as task_group:
+            for _ in range(concurrency):
+                task_group.create_task(worker())
+        elapsed_s = time.perf_counter() - started
+
+    return {
+        "operation": operation,
+        "work_factor": work_factor,
+        "threads": threads,
+        "concurrency": concurrency,
+        "operations": operations,
+        "elapsed_s": elapsed_s,
+        "throughput_ops_s": len(latencies_s) / elapsed_s,
+        "latency_ms": percentiles_ms(latencies_s),
+        "semaphore_wait_ms": percentiles_ms(semaphore.waits_s),
+        "busy_errors": busy_errors,
+        "busy_error_rate": busy_errors / operations,
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    results = [
+        await run_case(
+            operation=operation,
+            work_factor=work_factor,
+            threads=threads,
+            concurrency=concurrency,
+            operations=args.operations,
+            semaphore_wait_timeout_s=args.semaphore_wait_timeout_s,
+        )
+        for operation in args.operation
+        for work_factor in args.work_factors
+        for threads in args.threads
+        for concurrency in args.concurrency
+    ]
+    return {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "semaphore_wait_timeout_s": args.semaphore_wait_timeout_s,
+        "results": results,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--work-factors", type=int, nargs="+", default=[10, 11])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 64])
+    parser.add_argument("--operations", type=int, default=64)
+    parser.add_argument(
+        "--operation",
+        choices=["hash", "verify"],
+        nargs="+",
+        default=["hash", "verify"],
+    )
+    parser.add_argument("--semaphore-wait-timeout-s", type=float, default=1.0)
+    parser.add_argument("--output", help="Report path (default: stdout).")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(report + "\n")
+    else:
+        sys.stdout.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Throughput of bcrypt vs scrypt hashers on the current node.
+
+Usage:
+    python -m tests.app.performance.compare_password_hashers [threads]
+
+Both hashers release the GIL, so throughput should scale with threads
+up to the number of physical cores. scrypt additionally needs
+128 * r * N bytes per concurrent hash, which caps useful concurrency
+on memory-constrained nodes.
+"""
+
+import os
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from unittest.mock import Mock
+
+from app.domain.value_objects.raw_password import RawPassword
+from app.infrastructure.adapters.password_hasher_bcrypt import BcryptPasswordHasher
+from app.infrastructure.adapters.password_hasher_scrypt import ScryptPasswordHasher
+
+PEPPER = b"Cayenne!"
+DURATION_S = 3.0
+
+
+def create_hashers() -> dict[str, BcryptPasswordHasher | ScryptPasswordHasher]:
+    hashers: dict[str, BcryptPasswordHasher | ScryptPasswordHasher] = {}
+    for work_factor in (10, 11, 12):
+        hashers[f"bcrypt wf={work_factor}"] = BcryptPasswordHasher(
+            pepper=PEPPER,
+            work_factor=work_factor,
+            executor=Mock(),
+            semaphore=Mock(),
+            semaphore_wait_timeout_s=1,
+        )
+    # OWASP equivalents: same strength, different memory/CPU split
+    for cost_log2, parallelism in ((14, 5), (15, 3), (16, 2), (17, 1)):
+        hashers[f"scrypt ln={cost_log2} r=8 p={parallelism}"] = ScryptPasswordHasher(
+            pepper=PEPPER,
+            cost_log2=cost_log2,
+            block_size=8,
+            parallelism=parallelism,
+            executor=Mock(),
+            semaphore=Mock(),
+            semaphore_wait_timeout_s=1,
+        )
+    return hashers
+
+
+def measure_ops_per_s(operation: Callable[[], object], threads: int) -> float:
+    deadline = time.perf_counter() + DURATION_S
+
+    def worker() -> int:
+        done = 0
+        while time.perf_counter() < deadline:
+            operation()
+            done += 1
+        return done
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        total = sum(executor.map(lambda _: worker(), range(threads)))
+    return total / (time.perf_counter() - started)
+
+
+def main() -> None:
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    raw_password = RawPassword("raw_password")
+
+    header = f"{'hasher':<26}{'hash/s x1':>12}{f'hash/s x{threads}':>14}"
+    sys.stdout.write(f"{header}{'verify ms':>12}\n")
+    for name, hasher in create_hashers().items():
+        hashed = hasher.hash_sync(raw_password)
+        operation = partial(hasher.hash_sync, raw_password)
+        single = measure_ops_per_s(operation, 1)
+        parallel = measure_ops_per_s(operation, threads)
+        started = time.perf_counter()
+        hasher.verify_sync(raw_password, hashed)
+        verify_ms = (time.perf_counter() - started) * 1000
+        sys.stdout.write(
+            f"{name:<26}{single:>12.1f}{parallel:>14.1f}{verify_ms:>12.1f}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
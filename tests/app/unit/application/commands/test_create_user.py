@@ -0,0 +1,185 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import DEFAULT, create_autospec
+
+import pytest
+
+from app.application.commands.create_user import (
+    CreateUserInteractor,
+    CreateUserRequest,
+)
+from app.application.common.ports.access_revoker import AccessRevoker
+from app.application.common.ports.identity_provider import IdentityProvider
+from app.application.common.ports.principal_cache import Principal, PrincipalCache
+from app.application.common.ports.principal_reader import PrincipalReader
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_counter import UserCounter
+from app.application.common.ports.users_version import UsersVersion
+from app.application.common.services.current_user import CurrentUserService
+from app.application.common.services.user_registration import (
+    UserRegistrationService,
+)
+from app.domain.entities.user import User
+from app.domain.enums.user_role import UserRole
+from app.domain.ports.password_hasher import PasswordHasher
+from app.domain.ports.user_id_generator import UserIdGenerator
+from app.domain.services.user import UserService
+from app.domain.value_objects.raw_password import RawPassword
+from app.domain.value_objects.user_password_hash import UserPasswordHash
+from tests.app.unit.factories.user_entity import create_user
+from tests.app.unit.factories.value_objects import (
+    create_password_hash,
+    create_user_id,
+)
+
+
+class ConnectionPool:
+    def __init__(self) -> None:
+        self.checked_out = 0
+        self.peak = 0
+        self.peak_while_hashing = 0
+
+    def check_out(self) -> None:
+        self.checked_out += 1
+        self.peak = max(self.peak, self.checked_out)
+
+    def check_in(self) -> None:
+        self.checked_out -= 1
+
+
+type PooledSessionFactory = Callable[[User], tuple[Any, Any]]
+
+
+@pytest.fixture
+def pool() -> ConnectionPool:
+    return ConnectionPool()
+
+
+@pytest.fixture
+def create_pooled_session(pool: ConnectionPool) -> PooledSessionFactory:
+    """
+    The gateway and transaction manager of one session, which holds
+    a connection from the first query until the transaction ends.
+    """
+
+    def create(current_user: User) -> tuple[Any, Any]:
+        has_connection = False
+
+        def query(*_: object, **__: object) -> object:
+            nonlocal has_connection
+            if not has_connection:
+                pool.check_out()
+                has_connection = True
+            return DEFAULT
+
+        async def read(*args: object, **kwargs: object) -> object:
+            result = query(*args, **kwargs)
+            await asyncio.sleep(0)
+            return result
+
+        def end() -> None:
+            nonlocal has_connection
+            if has_connection:
+                pool.check_in()
+                has_connection = False
+
+        user_command_gateway = create_autospec(UserCommandGateway, instance=True)
+        user_command_gateway.read_principal_by_id.side_effect = read
+        for method in (
+            user_command_gateway.reserve,
+            user_command_gateway.complete_reservation,
+            user_command_gateway.cancel_reservation,
+        ):
+            method.side_effect = query
+        user_command_gateway.read_principal_by_id.return_value = Principal.from_user(
+            current_user
+        )
+        user_command_gateway.reserve.return_value = True
+        user_command_gateway.complete_reservation.return_value = True
+
+        transaction_manager = create_autospec(TransactionManager, instance=True)
+        for method in (
+            transaction_manager.commit,
+            transaction_manager.rollback,
+            transaction_manager.release_connection,
+        ):
+            method.side_effect = end
+        return user_command_gateway, transaction_manager
+
+    return create
+
+
+class SlowPasswordHasherStub(PasswordHasher):
+    def __init__(self, pool: ConnectionPool) -> None:
+        self._pool = pool
+
+    async def hash(self, raw_password: RawPassword) -> UserPasswordHash:
+        await asyncio.sleep(0.01)
+        # By now every request of the storm has read and is hashing
+        self._pool.peak_while_hashing = max(
+            self._pool.peak_while_hashing,
+            self._pool.checked_out,
+        )
+        return create_password_hash()
+
+    async def verify(
+        self,
+        raw_password: RawPassword,
+        hashed_password: UserPasswordHash,
+    ) -> bool:
+        return True
+
+
+async def test_returns_connections_to_pool_while_hashing(
+    pool: ConnectionPool,
+    create_pooled_session: PooledSessionFactory,
+) -> None:
+    # Arrange
+    storm_size = 50
+    admin = create_user(role=UserRole.SUPER_ADMIN)
+    identity_provider = create_autospec(IdentityProvider, instance=True)
+    identity_provider.get_current_user_id.return_value = admin.id_
+    user_id_generator = create_autospec(UserIdGenerator, instance=True)
+    user_id_generator.generate.side_effect = create_user_id
+    user_service = UserService(user_id_generator, SlowPasswordHasherStub(pool))
+    # Every request reads the current user
+    principal_cache = create_autospec(PrincipalCache, instance=True)
+    principal_cache.get.return_value = None
+
+    async def create_one(index: int) -> None:
+        user_command_gateway, transaction_manager = create_pooled_session(admin)
+        sut = CreateUserInteractor(
+            current_user_service=CurrentUserService(
+                identity_provider,
+                user_command_gateway,
+                create_autospec(AccessRevoker, instance=True),
+                principal_cache,
+                create_autospec(PrincipalReader, instance=True),
+            ),
+            user_registration_service=UserRegistrationService(
+                user_service,
+                user_command_gateway,
+                transaction_manager,
+                create_autospec(UserCounter, instance=True),
+                create_autospec(UsersVersion, instance=True),
+            ),
+        )
+        await sut.execute(
+            CreateUserRequest(
+                username=f"storm_user_{index}",
+                password="Good Password",
+                role=UserRole.USER,
+            )
+        )
+
+    # Act
+    async with asyncio.TaskGroup() as task_group:
+        for index in range(storm_size):
+            task_group.create_task(create_one(index))
+
+    # Assert
+    assert pool.peak == storm_size
+    assert pool.peak_while_hashing == 0
+    assert pool.checked_out == 0
@@ -0,0 +1,156 @@
+import asyncio
+from typing import Any
+from unittest.mock import create_autospec
+
+import pytest
+
+from app.application.commands.create_user import CreateUserRequest
+from app.application.commands.create_users import (
+    CreateUsersInteractor,
+    CreateUsersItemStatus,
+    CreateUsersRequest,
+)
+from app.application.common.ports.principal_cache import Principal
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_counter import UserCounter
+from app.application.common.ports.users_version import UsersVersion
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.entities.user import User
+from app.domain.enums.user_role import UserRole
+from app.domain.ports.password_hasher import PasswordHasher
+from app.domain.ports.user_id_generator import UserIdGenerator
+from app.domain.services.user import UserService
+from app.domain.value_objects.raw_password import RawPassword
+from app.domain.value_objects.user_id import UserId
+from app.domain.value_objects.user_password_hash import UserPasswordHash
+from app.domain.value_objects.username import Username
+from tests.app.unit.factories.user_entity import create_user
+from tests.app.unit.factories.value_objects import (
+    create_password_hash,
+    create_user_id,
+)
+
+
+class ConcurrencyTrackingHasherStub(PasswordHasher):
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+
+    async def hash(self, raw_password: RawPassword) -> UserPasswordHash:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.001)
+        self.running -= 1
+        return create_password_hash()
+
+    async def verify(
+        self,
+        raw_password: RawPassword,
+        hashed_password: UserPasswordHash,
+    ) -> bool:
+        return True
+
+
+@pytest.fixture
+def password_hasher() -> ConcurrencyTrackingHasherStub:
+    return ConcurrencyTrackingHasherStub()
+
+
+@pytest.fixture
+def user_command_gateway() -> Any:
+    user_command_gateway = create_autospec(UserCommandGateway, instance=True)
+    user_command_gateway.read_taken_usernames.return_value = set()
+
+    async def add_many(users: list[User]) -> set[UserId]:  # noqa: RUF029
+        return {user.id_ for user in users}
+
+    user_command_gateway.add_many.side_effect = add_many
+    return user_command_gateway
+
+
+@pytest.fixture
+def transaction_manager() -> Any:
+    return create_autospec(TransactionManager, instance=True)
+
+
+@pytest.fixture
+def sut(
+    password_hasher: ConcurrencyTrackingHasherStub,
+    user_command_gateway: Any,
+    transaction_manager: Any,
+) -> CreateUsersInteractor:
+    current_user_service = create_autospec(CurrentUserService, instance=True)
+    current_user_service.get_current_principal.return_value = Principal.from_user(
+        create_user(role=UserRole.SUPER_ADMIN),
+    )
+    user_id_generator = create_autospec(UserIdGenerator, instance=True)
+    user_id_generator.generate.side_effect = create_user_id
+    return CreateUsersInteractor(
+        current_user_service,
+        user_command_gateway,
+        UserService(user_id_generator, password_hasher),
+        transaction_manager,
+        create_autospec(UserCounter, instance=True),
+        create_autospec(UsersVersion, instance=True),
+    )
+
+
+def create_request(*usernames: str) -> CreateUsersRequest:
+    return CreateUsersRequest(
+        users=[
+            CreateUserRequest(
+                username=username,
+                password="Good Password",
+                role=UserRole.USER,
+            )
+            for username in usernames
+        ]
+    )
+
+
+async def test_reports_each_item_in_request_order(
+    sut: CreateUsersInteractor,
+    user_command_gateway: Any,
+    transaction_manager: Any,
+) -> None:
+    user_command_gateway.read_taken_usernames.return_value = {Username("taken1")}
+
+    response = await sut.execute(
+        create_request("new_user1", "x", "taken1", "new_user1", "new_user2")
+    )
+
+    assert [result["status"] for result in response["results"]] == [
+        CreateUsersItemStatus.CREATED,
+        CreateUsersItemStatus.INVALID,
+        CreateUsersItemStatus.USERNAME_TAKEN,
+        CreateUsersItemStatus.USERNAME_TAKEN,
+        CreateUsersItemStatus.CREATED,
+    ]
+    assert response["results"][1]["error"]
+    user_command_gateway.add_many.assert_awaited_once()
+    transaction_manager.commit.assert_awaited_once()
+
+
+async def test_reports_username_taken_meanwhile(
+    sut: CreateUsersInteractor,
+    user_command_gateway: Any,
+) -> None:
+    user_command_gateway.add_many.side_effect = None
+    user_command_gateway.add_many.return_value = set()
+
+    response = await sut.execute(create_request("new_user1"))
+
+    assert response["results"][0]["status"] == CreateUsersItemStatus.USERNAME_TAKEN
+    assert response["results"][0]["id"] is None
+
+
+async def test_bounds_concurrent_hashing(
+    sut: CreateUsersInteractor,
+    password_hasher: ConcurrencyTrackingHasherStub,
+    transaction_manager: Any,
+) -> None:
+    await sut.execute(create_request(*(f"new_user{i}" for i in range(20))))
+
+    assert password_hasher.peak == CreateUsersInteractor.HASH_CONCURRENCY
+    transaction_manager.release_connection.assert_awaited_once()
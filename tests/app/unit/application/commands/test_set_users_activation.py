@@ -0,0 +1,125 @@
+from typing import Any
+from unittest.mock import create_autospec
+
+import pytest
+
+from app.application.commands.set_users_activation import (
+    SetUsersActivationInteractor,
+    SetUsersActivationRequest,
+)
+from app.application.common.ports.access_revoker import AccessRevoker
+from app.application.common.ports.principal_cache import Principal, PrincipalCache
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_counter import UserCounter
+from app.application.common.ports.users_version import UsersVersion
+from app.application.common.services.current_user import CurrentUserService
+from app.application.common.services.user_batch import (
+    UserBatchItemStatus,
+    UserBatchService,
+)
+from app.domain.enums.user_role import UserRole
+from app.domain.ports.password_hasher import PasswordHasher
+from app.domain.ports.user_id_generator import UserIdGenerator
+from app.domain.services.user import UserService
+from app.domain.value_objects.user_id import UserId
+from tests.app.unit.factories.user_entity import create_user
+from tests.app.unit.factories.value_objects import create_user_id
+
+
+def change_all(user_ids: list[UserId], **_: object) -> set[UserId]:
+    return set(user_ids)
+
+
+@pytest.fixture
+def user_command_gateway() -> Any:
+    user_command_gateway = create_autospec(UserCommandGateway, instance=True)
+    user_command_gateway.set_activation_many.side_effect = change_all
+    return user_command_gateway
+
+
+@pytest.fixture
+def access_revoker() -> Any:
+    return create_autospec(AccessRevoker, instance=True)
+
+
+@pytest.fixture
+def sut(user_command_gateway: Any, access_revoker: Any) -> SetUsersActivationInteractor:
+    current_user_service = create_autospec(CurrentUserService, instance=True)
+    current_user_service.get_current_principal.return_value = Principal.from_user(
+        create_user(role=UserRole.ADMIN)
+    )
+    return SetUsersActivationInteractor(
+        current_user_service,
+        UserBatchService(user_command_gateway),
+        user_command_gateway,
+        UserService(
+            create_autospec(UserIdGenerator, instance=True),
+            create_autospec(PasswordHasher, instance=True),
+        ),
+        create_autospec(TransactionManager, instance=True),
+        create_autospec(UserCounter, instance=True),
+        create_autospec(UsersVersion, instance=True),
+        create_autospec(PrincipalCache, instance=True),
+        access_revoker,
+    )
+
+
+async def test_reports_each_id_in_request_order(
+    sut: SetUsersActivationInteractor,
+    user_command_gateway: Any,
+    access_revoker: Any,
+) -> None:
+    active_user = create_user(is_active=True)
+    inactive_user = create_user(is_active=False)
+    admin = create_user(role=UserRole.ADMIN)
+    missing_id = create_user_id()
+    user_command_gateway.read_many_by_ids.return_value = [
+        admin,
+        inactive_user,
+        active_user,
+    ]
+
+    response = await sut.execute(
+        SetUsersActivationRequest(
+            user_ids=[
+                active_user.id_.value,
+                missing_id.value,
+                admin.id_.value,
+                inactive_user.id_.value,
+                active_user.id_.value,
+            ],
+            is_active=False,
+        )
+    )
+
+    assert [(result["id"], result["status"]) for result in response["results"]] == [
+        (active_user.id_.value, UserBatchItemStatus.CHANGED),
+        (missing_id.value, UserBatchItemStatus.NOT_FOUND),
+        (admin.id_.value, UserBatchItemStatus.FORBIDDEN),
+        (inactive_user.id_.value, UserBatchItemStatus.UNCHANGED),
+    ]
+    user_command_gateway.set_activation_many.assert_awaited_once_with(
+        [active_user.id_],
+        is_active=False,
+    )
+    access_revoker.remove_all_users_access.assert_awaited_once_with([
+        active_user.id_,
+        inactive_user.id_,
+    ])
+
+
+async def test_keeps_sessions_on_activation(
+    sut: SetUsersActivationInteractor,
+    user_command_gateway: Any,
+    access_revoker: Any,
+) -> None:
+    user = create_user(is_active=False)
+    user_command_gateway.read_many_by_ids.return_value = [user]
+
+    response = await sut.execute(
+        SetUsersActivationRequest(user_ids=[user.id_.value], is_active=True)
+    )
+
+    assert response["results"][0]["status"] == UserBatchItemStatus.CHANGED
+    access_revoker.remove_all_users_access.assert_not_awaited()
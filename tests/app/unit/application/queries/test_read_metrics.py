@@ -0,0 +1,37 @@
+from typing import Any
+from unittest.mock import create_autospec
+
+import pytest
+
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.ports.metrics_reader import MetricsReader
+from app.application.common.ports.principal_cache import Principal
+from app.application.common.services.current_user import CurrentUserService
+from app.application.queries.read_metrics import ReadMetricsQueryService
+from app.domain.enums.user_role import UserRole
+from tests.app.unit.factories.user_entity import create_user
+
+
+def create_sut(role: UserRole) -> tuple[ReadMetricsQueryService, Any]:
+    current_user_service = create_autospec(CurrentUserService, instance=True)
+    current_user_service.get_current_principal.return_value = Principal.from_user(
+        create_user(role=role)
+    )
+    metrics_reader = create_autospec(MetricsReader, instance=True)
+    metrics_reader.read.return_value = {"user_query_cache": {"hits": 1}}
+    return ReadMetricsQueryService(current_user_service, metrics_reader), metrics_reader
+
+
+async def test_reads_metrics_for_admins() -> None:
+    sut, _ = create_sut(UserRole.ADMIN)
+
+    assert await sut.execute() == {"user_query_cache": {"hits": 1}}
+
+
+async def test_reads_no_metrics_for_users() -> None:
+    sut, metrics_reader = create_sut(UserRole.USER)
+
+    with pytest.raises(AuthorizationError):
+        await sut.execute()
+
+    metrics_reader.read.assert_not_called()
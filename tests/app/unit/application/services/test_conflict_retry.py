@@ -0,0 +1,74 @@
+from typing import Any
+from unittest.mock import AsyncMock, call, create_autospec
+
+import pytest
+
+from app.application.common.exceptions.concurrency import (
+    ConcurrentModificationError,
+)
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.common.services.conflict_retry import ConflictRetryService
+from app.domain.exceptions.user import UserNotFoundByIdError
+from tests.app.unit.factories.value_objects import create_user_id
+
+
+@pytest.fixture
+def transaction_manager() -> Any:
+    return create_autospec(TransactionManager, instance=True)
+
+
+@pytest.fixture
+def sut(transaction_manager: Any) -> ConflictRetryService:
+    return ConflictRetryService(transaction_manager)
+
+
+async def test_retries_from_fresh_transaction_until_committed(
+    sut: ConflictRetryService,
+    transaction_manager: Any,
+) -> None:
+    manager = AsyncMock()
+    manager.attempt.side_effect = [
+        ConcurrentModificationError(),
+        ConcurrentModificationError(),
+        "done",
+    ]
+    transaction_manager.rollback.side_effect = manager.rollback
+
+    result = await sut.run(manager.attempt)
+
+    assert result == "done"
+    assert manager.mock_calls == [
+        call.attempt(),
+        call.rollback(),
+        call.attempt(),
+        call.rollback(),
+        call.attempt(),
+    ]
+
+
+async def test_gives_up_after_max_attempts(
+    sut: ConflictRetryService,
+    transaction_manager: Any,
+) -> None:
+    attempt = AsyncMock(side_effect=ConcurrentModificationError())
+
+    with pytest.raises(ConcurrentModificationError):
+        await sut.run(attempt)
+
+    assert attempt.await_count == ConflictRetryService.MAX_ATTEMPTS
+    assert transaction_manager.rollback.await_count == (
+        ConflictRetryService.MAX_ATTEMPTS - 1
+    )
+
+
+async def test_raises_other_errors_at_once(
+    sut: ConflictRetryService,
+    transaction_manager: Any,
+) -> None:
+    attempt = AsyncMock(side_effect=UserNotFoundByIdError(create_user_id()))
+
+    with pytest.raises(UserNotFoundByIdError):
+        await sut.run(attempt)
+
+    attempt.assert_awaited_once()
+    transaction_manager.rollback.assert_not_awaited()
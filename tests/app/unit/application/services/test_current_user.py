@@ -0,0 +1,182 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.ports.access_revoker import AccessRevoker
+from app.application.common.ports.identity_provider import IdentityProvider
+from app.application.common.ports.principal_cache import Principal, PrincipalCache
+from app.application.common.ports.principal_reader import PrincipalReader
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.entities.user import User
+from app.domain.enums.user_role import UserRole
+from tests.app.unit.factories.user_entity import create_user
+
+
+@pytest.fixture
+def current_user() -> User:
+    return create_user(role=UserRole.ADMIN)
+
+
+@pytest.fixture
+def user_command_gateway(current_user: User) -> Any:
+    user_command_gateway = create_autospec(UserCommandGateway, instance=True)
+    user_command_gateway.read_by_id.return_value = current_user
+    user_command_gateway.read_principal_by_id.return_value = Principal.from_user(
+        current_user
+    )
+    return user_command_gateway
+
+
+@pytest.fixture
+def principal_cache() -> Any:
+    principal_cache = create_autospec(PrincipalCache, instance=True)
+    principal_cache.get.return_value = None
+    principal_cache.version = 7
+    return principal_cache
+
+
+@pytest.fixture
+def principal_reader(current_user: User) -> Any:
+    principal_reader = create_autospec(PrincipalReader, instance=True)
+    principal_reader.read_by_id.return_value = Principal.from_user(current_user)
+    return principal_reader
+
+
+@pytest.fixture
+def sut(
+    current_user: User,
+    user_command_gateway: Any,
+    principal_cache: Any,
+    principal_reader: Any,
+) -> CurrentUserService:
+    identity_provider = create_autospec(IdentityProvider, instance=True)
+    identity_provider.get_current_user_id.return_value = current_user.id_
+    return CurrentUserService(
+        identity_provider,
+        user_command_gateway,
+        create_autospec(AccessRevoker, instance=True),
+        principal_cache,
+        principal_reader,
+    )
+
+
+async def test_serves_cached_principal(
+    sut: CurrentUserService,
+    current_user: User,
+    user_command_gateway: Any,
+    principal_cache: Any,
+) -> None:
+    principal = Principal.from_user(current_user)
+    principal_cache.get.return_value = principal
+
+    assert await sut.get_current_principal() is principal
+    user_command_gateway.read_principal_by_id.assert_not_awaited()
+
+
+async def test_caches_principal_at_version_before_read(
+    sut: CurrentUserService,
+    current_user: User,
+    user_command_gateway: Any,
+    principal_cache: Any,
+) -> None:
+    principal = await sut.get_current_principal()
+
+    assert principal == Principal(
+        id_=current_user.id_,
+        role=UserRole.ADMIN,
+        is_active=True,
+    )
+    principal_cache.store.assert_called_once_with(principal, version=7)
+    user_command_gateway.read_by_id.assert_not_awaited()
+
+
+async def test_rejects_inactive_user_without_caching(
+    sut: CurrentUserService,
+    current_user: User,
+    user_command_gateway: Any,
+    principal_cache: Any,
+) -> None:
+    current_user.is_active = False
+    user_command_gateway.read_principal_by_id.return_value = Principal.from_user(
+        current_user
+    )
+
+    with pytest.raises(AuthorizationError):
+        await sut.get_current_principal()
+    principal_cache.store.assert_not_called()
+
+
+async def test_reads_own_user_with_password_hash(
+    sut: CurrentUserService,
+    current_user: User,
+    user_command_gateway: Any,
+) -> None:
+    assert await sut.get_current_user() is current_user
+    user_command_gateway.read_by_id.assert_awaited_once_with(
+        current_user.id_,
+        for_update=False,
+        with_password_hash=True,
+    )
+
+
+async def test_reads_alongside_principal(
+    sut: CurrentUserService,
+    current_user: User,
+    principal_reader: Any,
+    principal_cache: Any,
+) -> None:
+    principal_started, read_started = asyncio.Event(), asyncio.Event()
+
+    # Each waits for the other: would time out if run one after the other
+    async def read_principal(*_: object) -> Principal:
+        principal_started.set()
+        await asyncio.wait_for(read_started.wait(), timeout=1)
+        return Principal.from_user(current_user)
+
+    async def read() -> str:
+        read_started.set()
+        await asyncio.wait_for(principal_started.wait(), timeout=1)
+        return "target"
+
+    principal_reader.read_by_id.side_effect = read_principal
+
+    principal, target = await sut.read_with_principal(read)
+
+    assert (principal, target) == (Principal.from_user(current_user), "target")
+    principal_cache.store.assert_called_once_with(principal, version=7)
+
+
+async def test_reads_after_cached_principal(
+    sut: CurrentUserService,
+    current_user: User,
+    principal_reader: Any,
+    principal_cache: Any,
+) -> None:
+    principal = Principal.from_user(current_user)
+    principal_cache.get.return_value = principal
+
+    result = await sut.read_with_principal(AsyncMock(return_value="target"))
+
+    assert result == (principal, "target")
+    principal_reader.read_by_id.assert_not_awaited()
+
+
+async def test_rejects_inactive_user_despite_read(
+    sut: CurrentUserService,
+    current_user: User,
+    principal_reader: Any,
+) -> None:
+    current_user.is_active = False
+    principal_reader.read_by_id.return_value = Principal.from_user(current_user)
+
+    with pytest.raises(AuthorizationError):
+        await sut.read_with_principal(AsyncMock(return_value="target"))
+
+
+async def test_raises_read_error_itself(sut: CurrentUserService) -> None:
+    with pytest.raises(LookupError):
+        await sut.read_with_principal(AsyncMock(side_effect=LookupError))
@@ -0,0 +1,178 @@
+import asyncio
+from typing import Any, cast
+from unittest.mock import create_autospec
+
+import pytest
+
+from app.application.common.exceptions.concurrency import (
+    ConcurrentModificationError,
+)
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_counter import UserCounter
+from app.application.common.ports.users_version import UsersVersion
+from app.application.common.services.user_registration import (
+    UserRegistrationService,
+)
+from app.domain.enums.user_role import UserRole
+from app.domain.exceptions.user import UsernameAlreadyExistsError
+from app.domain.ports.password_hasher import PasswordHasher
+from app.domain.ports.user_id_generator import UserIdGenerator
+from app.domain.services.user import UserService
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.exceptions.password_hasher import PasswordHasherBusyError
+from tests.app.unit.factories.value_objects import (
+    create_password_hash,
+    create_raw_password,
+    create_user_id,
+    create_username,
+)
+
+
+@pytest.fixture
+def password_hasher() -> Any:
+    password_hasher = create_autospec(PasswordHasher, instance=True)
+    password_hasher.hash.return_value = create_password_hash()
+    return password_hasher
+
+
+@pytest.fixture
+def user_command_gateway() -> Any:
+    user_command_gateway = create_autospec(UserCommandGateway, instance=True)
+    user_command_gateway.reserve.return_value = True
+    user_command_gateway.complete_reservation.return_value = True
+    return user_command_gateway
+
+
+@pytest.fixture
+def user_counter() -> Any:
+    return create_autospec(UserCounter, instance=True)
+
+
+@pytest.fixture
+def users_version() -> Any:
+    return create_autospec(UsersVersion, instance=True)
+
+
+@pytest.fixture
+def sut(
+    password_hasher: Any,
+    user_command_gateway: Any,
+    user_counter: Any,
+    users_version: Any,
+) -> UserRegistrationService:
+    user_id_generator = create_autospec(UserIdGenerator, instance=True)
+    user_id_generator.generate.return_value = create_user_id()
+    return UserRegistrationService(
+        UserService(user_id_generator, password_hasher),
+        user_command_gateway,
+        cast(TransactionManager, create_autospec(TransactionManager, instance=True)),
+        user_counter,
+        users_version,
+    )
+
+
+async def test_stores_hash_after_reserving_username(
+    sut: UserRegistrationService,
+    user_command_gateway: Any,
+    user_counter: Any,
+    users_version: Any,
+) -> None:
+    user = await sut.register(create_username(), create_raw_password())
+
+    assert user.password_hash == create_password_hash()
+    assert user.is_active
+    user_command_gateway.reserve.assert_awaited_once()
+    user_command_gateway.complete_reservation.assert_awaited_once_with(user)
+    user_counter.record_user_created.assert_called_once_with(
+        role=UserRole.USER,
+        is_active=True,
+    )
+    users_version.bump.assert_awaited_once()
+
+
+async def test_rejects_taken_username_without_hashing(
+    sut: UserRegistrationService,
+    password_hasher: Any,
+    user_command_gateway: Any,
+) -> None:
+    user_command_gateway.reserve.return_value = False
+
+    with pytest.raises(UsernameAlreadyExistsError):
+        await sut.register(create_username(), create_raw_password())
+
+    password_hasher.hash.assert_not_awaited()
+
+
+async def test_frees_username_if_hashing_fails(
+    sut: UserRegistrationService,
+    password_hasher: Any,
+    user_command_gateway: Any,
+    user_counter: Any,
+    users_version: Any,
+) -> None:
+    password_hasher.hash.side_effect = PasswordHasherBusyError
+
+    with pytest.raises(PasswordHasherBusyError):
+        await sut.register(create_username(), create_raw_password())
+
+    user_command_gateway.cancel_reservation.assert_awaited_once()
+    user_command_gateway.complete_reservation.assert_not_awaited()
+    user_counter.record_user_created.assert_not_called()
+    users_version.bump.assert_awaited_once()
+
+
+async def test_fails_if_reservation_vanished(
+    sut: UserRegistrationService,
+    user_command_gateway: Any,
+) -> None:
+    user_command_gateway.complete_reservation.return_value = False
+
+    with pytest.raises(ConcurrentModificationError):
+        await sut.register(create_username(), create_raw_password())
+
+
+async def test_frees_username_if_cancelled_while_hashing(
+    sut: UserRegistrationService,
+    password_hasher: Any,
+    user_command_gateway: Any,
+) -> None:
+    hashing = asyncio.Event()
+
+    async def hash_forever(*_: object) -> None:
+        hashing.set()
+        await asyncio.Event().wait()
+
+    password_hasher.hash.side_effect = hash_forever
+    task = asyncio.create_task(sut.register(create_username(), create_raw_password()))
+    await hashing.wait()
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    user_command_gateway.cancel_reservation.assert_awaited_once()
+
+
+async def test_frees_username_if_completion_fails(
+    sut: UserRegistrationService,
+    user_command_gateway: Any,
+) -> None:
+    user_command_gateway.complete_reservation.side_effect = DataMapperError
+
+    with pytest.raises(DataMapperError):
+        await sut.register(create_username(), create_raw_password())
+
+    user_command_gateway.cancel_reservation.assert_awaited_once()
+
+
+async def test_raises_original_error_if_freeing_username_fails(
+    sut: UserRegistrationService,
+    password_hasher: Any,
+    user_command_gateway: Any,
+) -> None:
+    password_hasher.hash.side_effect = PasswordHasherBusyError
+    user_command_gateway.cancel_reservation.side_effect = DataMapperError
+
+    with pytest.raises(PasswordHasherBusyError):
+        await sut.register(create_username(), create_raw_password())
@@ -85,6 +85,49 @@ async def test_fails_to_create_user_with_unassignable_role(
         )
 
 
+def test_creates_inactive_placeholder_user_without_hashing(
+    user_id_generator: UserIdGeneratorMock,
+    password_hasher: PasswordHasherMock,
+) -> None:
+    expected_id = create_user_id()
+    user_id_generator.generate.return_value = expected_id
+    sut = UserService(user_id_generator, password_hasher)  # type: ignore[arg-type]
+
+    user = sut.create_placeholder_user(create_username(), UserRole.ADMIN)
+
+    assert user.id_ == expected_id
+    assert user.role == UserRole.ADMIN
+    assert not user.is_active
+    assert user.password_hash == create_password_hash(b"")
+    password_hasher.hash.assert_not_called()
+
+
+def test_fails_to_create_placeholder_user_with_unassignable_role(
+    user_id_generator: UserIdGeneratorMock,
+    password_hasher: PasswordHasherMock,
+) -> None:
+    sut = UserService(user_id_generator, password_hasher)  # type: ignore[arg-type]
+
+    with pytest.raises(RoleAssignmentNotPermittedError):
+        sut.create_placeholder_user(create_username(), UserRole.SUPER_ADMIN)
+
+
+@pytest.mark.asyncio
+async def test_completes_placeholder_user(
+    user_id_generator: UserIdGeneratorMock,
+    password_hasher: PasswordHasherMock,
+) -> None:
+    user = create_user(password_hash=create_password_hash(b""), is_active=False)
+    expected_hash = create_password_hash(b"new")
+    password_hasher.hash.return_value = expected_hash
+    sut = UserService(user_id_generator, password_hasher)  # type: ignore[arg-type]
+
+    await sut.complete_user(user, create_raw_password())
+
+    assert user.password_hash == expected_hash
+    assert user.is_active
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "is_valid",
@@ -110,24 +153,39 @@ async def test_checks_password_authenticity(
 
 
 @pytest.mark.asyncio
-async def test_changes_password(
+async def test_hashes_password_without_touching_user(
     user_id_generator: UserIdGeneratorMock,
     password_hasher: PasswordHasherMock,
 ) -> None:
     # Arrange
-    initial_hash = create_password_hash(b"old")
-    user = create_user(password_hash=initial_hash)
     raw_password = create_raw_password()
-
     expected_hash = create_password_hash(b"new")
     password_hasher.hash.return_value = expected_hash
     sut = UserService(user_id_generator, password_hasher)  # type: ignore[arg-type]
 
     # Act
-    await sut.change_password(user, raw_password)
+    result = await sut.hash_password(raw_password)
+
+    # Assert
+    assert result == expected_hash
+    password_hasher.hash.assert_awaited_once_with(raw_password)
+
+
+def test_sets_password_hash_without_hashing(
+    user_id_generator: UserIdGeneratorMock,
+    password_hasher: PasswordHasherMock,
+) -> None:
+    # Arrange
+    user = create_user(password_hash=create_password_hash(b"old"))
+    expected_hash = create_password_hash(b"new")
+    sut = UserService(user_id_generator, password_hasher)  # type: ignore[arg-type]
+
+    # Act
+    sut.set_password_hash(user, expected_hash)
 
     # Assert
     assert user.password_hash == expected_hash
+    password_hasher.hash.assert_not_called()
 
 
 @pytest.mark.parametrize(
@@ -6,6 +6,7 @@ from functools import partial
 import pytest
 
 from app.infrastructure.adapters.password_hasher_bcrypt import BcryptPasswordHasher
+from app.infrastructure.adapters.password_hasher_scrypt import ScryptPasswordHasher
 from app.infrastructure.adapters.types import HasherSemaphore, HasherThreadPoolExecutor
 
 
@@ -43,3 +44,20 @@ def bcrypt_password_hasher(
         semaphore=hasher_semaphore,
         semaphore_wait_timeout_s=3,
     )
+
+
+@pytest.fixture
+def scrypt_password_hasher(
+    hasher_threadpool_executor: HasherThreadPoolExecutor,
+    hasher_semaphore: HasherSemaphore,
+) -> partial[ScryptPasswordHasher]:
+    return partial(
+        ScryptPasswordHasher,
+        pepper=b"Habanero",
+        cost_log2=10,
+        block_size=8,
+        parallelism=1,
+        executor=hasher_threadpool_executor,
+        semaphore=hasher_semaphore,
+        semaphore_wait_timeout_s=3,
+    )
@@ -0,0 +1,102 @@
+import pytest
+
+from app.infrastructure.auth.throttling.log_in_throttle import LogInThrottle
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def sut(clock: FakeClock) -> LogInThrottle:
+    return LogInThrottle(
+        window_s=60,
+        max_failures_per_username=3,
+        max_failures_per_address=5,
+        backoff_base_s=1,
+        backoff_max_s=10,
+        max_tracked_keys=100,
+        clock=clock,
+    )
+
+
+def test_allows_attempts_below_limit(sut: LogInThrottle) -> None:
+    for _ in range(2):
+        sut.record_failure("alice", "10.0.0.1")
+
+    assert sut.get_retry_after("alice", "10.0.0.1") is None
+
+
+def test_blocks_username_at_limit(sut: LogInThrottle) -> None:
+    for _ in range(3):
+        sut.record_failure("alice", "10.0.0.1")
+
+    assert sut.get_retry_after("alice", "10.0.0.2") == 1
+    assert sut.metrics["rejected_by_username"] == 1
+
+
+def test_blocks_address_across_usernames(sut: LogInThrottle) -> None:
+    for username in ("u1", "u2", "u3", "u4", "u5"):
+        sut.record_failure(username, "10.0.0.1")
+
+    assert sut.get_retry_after("u6", "10.0.0.1") is not None
+    assert sut.get_retry_after("u6", "10.0.0.2") is None
+    assert sut.metrics["rejected_by_address"] == 1
+
+
+def test_backoff_doubles_and_is_capped(sut: LogInThrottle, clock: FakeClock) -> None:
+    retry_afters = []
+    for _ in range(8):
+        sut.record_failure("alice", None)
+        retry_afters.append(sut.get_retry_after("alice", None))
+        clock.now += 0.5
+
+    assert retry_afters == [None, None, 1, 2, 4, 8, 10, 10]
+
+
+def test_failures_age_out_of_window(sut: LogInThrottle, clock: FakeClock) -> None:
+    for _ in range(3):
+        sut.record_failure("alice", None)
+    clock.now += 61
+
+    sut.record_failure("alice", None)
+
+    assert sut.get_retry_after("alice", None) is None
+
+
+def test_success_clears_username_only(sut: LogInThrottle) -> None:
+    for _ in range(5):
+        sut.record_failure("alice", "10.0.0.1")
+
+    sut.record_success("alice")
+
+    assert sut.get_retry_after("alice", None) is None
+    assert sut.get_retry_after("alice", "10.0.0.1") is not None
+
+
+def test_forgets_least_recent_keys_over_capacity(clock: FakeClock) -> None:
+    sut = LogInThrottle(
+        window_s=60,
+        max_failures_per_username=1,
+        max_failures_per_address=1,
+        backoff_base_s=1,
+        backoff_max_s=10,
+        max_tracked_keys=1,
+        clock=clock,
+    )
+
+    sut.record_failure("alice", None)
+    sut.record_failure("bob", None)
+
+    assert sut.get_retry_after("alice", None) is None
+    assert sut.get_retry_after("bob", None) is not None
+    assert sut.metrics["tracked_keys"] == 1
@@ -0,0 +1,80 @@
+from functools import partial
+from typing import cast
+from unittest.mock import AsyncMock, Mock, create_autospec
+
+import pytest
+
+from app.domain.value_objects.user_password_hash import UserPasswordHash
+from app.infrastructure.adapters.password_hasher_bcrypt import BcryptPasswordHasher
+from app.infrastructure.adapters.password_hasher_multi import (
+    AlgorithmPasswordHasher,
+    MultiAlgorithmPasswordHasher,
+)
+from app.infrastructure.adapters.password_hasher_scrypt import ScryptPasswordHasher
+from tests.app.unit.factories.value_objects import (
+    create_password_hash,
+    create_raw_password,
+)
+
+
+def create_algorithm_hasher(*, recognizes: bool) -> Mock:
+    hasher = cast(Mock, create_autospec(AlgorithmPasswordHasher, instance=True))
+    hasher.recognizes.return_value = recognizes
+    return hasher
+
+
+@pytest.mark.asyncio
+async def test_hashes_with_primary() -> None:
+    primary = create_algorithm_hasher(recognizes=True)
+    legacy = create_algorithm_hasher(recognizes=False)
+    expected_hash = create_password_hash()
+    cast(AsyncMock, primary.hash).return_value = expected_hash
+    sut = MultiAlgorithmPasswordHasher(primary=primary, legacy=(legacy,))
+
+    result = await sut.hash(create_raw_password())
+
+    assert result == expected_hash
+    cast(AsyncMock, legacy.hash).assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_verifies_with_hasher_recognizing_hash() -> None:
+    primary = create_algorithm_hasher(recognizes=False)
+    legacy = create_algorithm_hasher(recognizes=True)
+    cast(AsyncMock, legacy.verify).return_value = True
+    sut = MultiAlgorithmPasswordHasher(primary=primary, legacy=(legacy,))
+
+    assert await sut.verify(create_raw_password(), create_password_hash())
+    cast(AsyncMock, primary.verify).assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_does_not_verify_unrecognized_hash() -> None:
+    primary = create_algorithm_hasher(recognizes=False)
+    sut = MultiAlgorithmPasswordHasher(primary=primary, legacy=())
+
+    assert not await sut.verify(
+        create_raw_password(),
+        UserPasswordHash(b"$unknown$"),
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_verifies_legacy_bcrypt_hash_after_switching_to_scrypt(
+    bcrypt_password_hasher: partial[BcryptPasswordHasher],
+    scrypt_password_hasher: partial[ScryptPasswordHasher],
+) -> None:
+    bcrypt_hasher = bcrypt_password_hasher()
+    pwd = create_raw_password()
+    legacy_hash = await bcrypt_hasher.hash(pwd)
+    sut = MultiAlgorithmPasswordHasher(
+        primary=scrypt_password_hasher(),
+        legacy=(bcrypt_hasher,),
+    )
+
+    new_hash = await sut.hash(pwd)
+
+    assert await sut.verify(pwd, legacy_hash)
+    assert await sut.verify(pwd, new_hash)
+    assert new_hash.value.startswith(b"$scrypt$")
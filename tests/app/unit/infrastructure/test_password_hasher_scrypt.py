@@ -0,0 +1,110 @@
+from functools import partial
+
+import pytest
+
+from app.domain.value_objects.user_password_hash import UserPasswordHash
+from app.infrastructure.adapters.password_hasher_scrypt import (
+    ScryptPasswordHasher,
+)
+from tests.app.unit.factories.value_objects import create_raw_password
+
+
+@pytest.mark.asyncio
+async def test_verifies_correct_password(
+    scrypt_password_hasher: partial[ScryptPasswordHasher],
+) -> None:
+    sut = scrypt_password_hasher()
+    pwd = create_raw_password()
+
+    hashed = await sut.hash(pwd)
+
+    assert await sut.verify(raw_password=pwd, hashed_password=hashed)
+
+
+@pytest.mark.asyncio
+async def test_does_not_verify_incorrect_password(
+    scrypt_password_hasher: partial[ScryptPasswordHasher],
+) -> None:
+    sut = scrypt_password_hasher()
+    correct_pwd = create_raw_password("secure")
+    incorrect_pwd = create_raw_password("bruteforce")
+
+    hashed = await sut.hash(correct_pwd)
+
+    assert not await sut.verify(raw_password=incorrect_pwd, hashed_password=hashed)
+
+
+@pytest.mark.asyncio
+async def test_hash_carries_algorithm_prefix_and_parameters(
+    scrypt_password_hasher: partial[ScryptPasswordHasher],
+) -> None:
+    sut = scrypt_password_hasher()
+
+    hashed = await sut.hash(create_raw_password())
+
+    assert hashed.value.startswith(b"$scrypt$ln=10,r=8,p=1$")
+    assert sut.recognizes(hashed)
+
+
+@pytest.mark.asyncio
+async def test_verifies_hash_created_with_other_cost_parameters(
+    scrypt_password_hasher: partial[ScryptPasswordHasher],
+) -> None:
+    pwd = create_raw_password()
+    old_hasher = scrypt_password_hasher(cost_log2=11, parallelism=2)
+    sut = scrypt_password_hasher()
+
+    hashed = await old_hasher.hash(pwd)
+
+    assert await sut.verify(raw_password=pwd, hashed_password=hashed)
+
+
+@pytest.mark.asyncio
+async def test_different_peppers_fail_verification(
+    scrypt_password_hasher: partial[ScryptPasswordHasher],
+) -> None:
+    pwd = create_raw_password()
+    hasher1 = scrypt_password_hasher(pepper=b"PepperA")
+    hasher2 = scrypt_password_hasher(pepper=b"PepperB")
+
+    hashed = await hasher1.hash(pwd)
+
+    assert await hasher1.verify(raw_password=pwd, hashed_password=hashed)
+    assert not await hasher2.verify(raw_password=pwd, hashed_password=hashed)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param(b"$scrypt$", id="empty"),
+        pytest.param(b"$scrypt$ln=10,r=8$c2FsdA$a2V5", id="missing_param"),
+        pytest.param(b"$scrypt$ln=10,r=8,p=1$!!!$a2V5", id="bad_base64"),
+        pytest.param(
+            b"$scrypt$ln=40,r=8,p=1$c2FsdA$" + b"A" * 43,
+            id="cost_out_of_bounds",
+        ),
+        pytest.param(
+            b"$scrypt$ln=10,r=0,p=1$c2FsdA$" + b"A" * 43,
+            id="block_size_zero",
+        ),
+        pytest.param(
+            b"$scrypt$ln=20,r=32,p=16$c2FsdA$" + b"A" * 43,
+            id="memory_out_of_bounds",
+        ),
+        pytest.param(b"$scrypt$ln=10,r=8,p=1$c2FsdA$a2V5", id="key_too_short"),
+    ],
+)
+def test_malformed_hash_does_not_verify(
+    scrypt_password_hasher: partial[ScryptPasswordHasher],
+    value: bytes,
+) -> None:
+    sut = scrypt_password_hasher()
+
+    assert not sut.verify_sync(create_raw_password(), UserPasswordHash(value))
+
+
+def test_rejects_own_parameters_beyond_verification_bounds(
+    scrypt_password_hasher: partial[ScryptPasswordHasher],
+) -> None:
+    with pytest.raises(ValueError):
+        scrypt_password_hasher(cost_log2=21)
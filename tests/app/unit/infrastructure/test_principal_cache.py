@@ -0,0 +1,74 @@
+import pytest
+
+from app.application.common.ports.principal_cache import Principal
+from app.domain.enums.user_role import UserRole
+from app.infrastructure.adapters.principal_cache import InMemoryPrincipalCache
+from tests.app.unit.factories.user_entity import create_user
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def sut(clock: FakeClock) -> InMemoryPrincipalCache:
+    return InMemoryPrincipalCache(max_age_s=5, max_entries=2, clock=clock)
+
+
+def create_principal() -> Principal:
+    return Principal.from_user(create_user(role=UserRole.ADMIN))
+
+
+def test_distrusts_entries_after_max_age(
+    sut: InMemoryPrincipalCache,
+    clock: FakeClock,
+) -> None:
+    principal = create_principal()
+    sut.store(principal, version=sut.version)
+
+    clock.now = 4.9
+    assert sut.get(principal.id_) == principal
+    clock.now = 5
+    assert sut.get(principal.id_) is None
+
+
+def test_invalidates_entries(sut: InMemoryPrincipalCache) -> None:
+    principal = create_principal()
+    sut.store(principal, version=sut.version)
+
+    sut.invalidate([principal.id_])
+
+    assert sut.get(principal.id_) is None
+
+
+def test_ignores_principals_read_before_invalidation(
+    sut: InMemoryPrincipalCache,
+) -> None:
+    principal = create_principal()
+    version = sut.version
+
+    sut.invalidate([principal.id_])
+    sut.store(principal, version=version)
+
+    assert sut.get(principal.id_) is None
+
+
+def test_evicts_least_recently_used(sut: InMemoryPrincipalCache) -> None:
+    first, second, third = (create_principal() for _ in range(3))
+    sut.store(first, version=sut.version)
+    sut.store(second, version=sut.version)
+    sut.get(first.id_)
+
+    sut.store(third, version=sut.version)
+
+    assert sut.get(first.id_) == first
+    assert sut.get(second.id_) is None
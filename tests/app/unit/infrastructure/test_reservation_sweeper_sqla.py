@@ -0,0 +1,45 @@
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+from sqlalchemy import Delete, Select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.adapters.reservation_sweeper_sqla import ReservationSweeper
+from app.infrastructure.adapters.username_bloom_filter import UsernameBloomFilter
+
+
+def create_sut(session: AsyncSession) -> ReservationSweeper:
+    session_factory = MagicMock(spec=async_sessionmaker)
+    session_factory.return_value.__aenter__.return_value = session
+    return ReservationSweeper(
+        session_factory,
+        UsernameBloomFilter(
+            enabled=False,
+            capacity=1,
+            false_positive_rate=0.5,
+            refresh_interval_s=3600,
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    ("deleted", "bumped"),
+    [
+        pytest.param(1, True, id="deleted"),
+        pytest.param(0, False, id="none_expired"),
+    ],
+)
+async def test_bumps_users_version_after_commit(deleted: int, bumped: bool) -> None:
+    session = create_autospec(AsyncSession, instance=True)
+    session.execute.return_value.rowcount = deleted
+    sut = create_sut(session)
+
+    assert await sut.sweep() == deleted
+
+    expected: list[tuple[str, type | None]] = [("execute", Delete), ("commit", None)]
+    if bumped:
+        expected.append(("execute", Select))
+    assert [
+        (name, type(args[0]) if args else None)
+        for name, args, _ in session.method_calls
+    ] == expected
@@ -0,0 +1,61 @@
+import asyncio
+from functools import partial
+
+import pytest
+
+from app.infrastructure.adapters.single_flight import Flight, SingleFlightCache
+
+
+async def return_value(value: str) -> str:  # noqa: RUF029
+    return value
+
+
+@pytest.mark.parametrize(
+    ("refresh_on_hit", "evicted"),
+    [
+        pytest.param(False, "a", id="oldest"),
+        pytest.param(True, "b", id="least_recently_used"),
+    ],
+)
+async def test_evicts_over_capacity(refresh_on_hit: bool, evicted: str) -> None:
+    sut: SingleFlightCache[str, Flight] = SingleFlightCache(
+        name="Test",
+        ttl_s=60,
+        max_entries=2,
+        refresh_on_hit=refresh_on_hit,
+    )
+    for key in ("a", "b", "a", "c"):
+        await sut.get_or_run(key, partial(return_value, key), create=Flight)
+
+    kept = {"a", "b", "c"} - {evicted}
+    results = [
+        await sut.get_or_run(key, partial(return_value, "new"), create=Flight)
+        for key in (*sorted(kept), evicted)
+    ]
+
+    assert results == [(key, True) for key in sorted(kept)] + [("new", False)]
+
+
+async def test_keeps_runs_in_flight_over_capacity() -> None:
+    sut: SingleFlightCache[str, Flight] = SingleFlightCache(
+        name="Test",
+        ttl_s=60,
+        max_entries=1,
+    )
+    release = asyncio.Event()
+    calls = 0
+
+    async def operation() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    first = asyncio.create_task(sut.get_or_run("a", operation, create=Flight))
+    await asyncio.sleep(0)
+    await sut.get_or_run("b", partial(return_value, "b"), create=Flight)
+    duplicate = asyncio.create_task(sut.get_or_run("a", operation, create=Flight))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert [await first, await duplicate] == [(1, False), (1, True)]
@@ -0,0 +1,58 @@
+import pytest
+
+from app.domain.enums.user_role import UserRole
+from app.infrastructure.adapters.user_count_cache import InMemoryUserCountCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def sut(clock: FakeClock) -> InMemoryUserCountCache:
+    return InMemoryUserCountCache(ttl_s=30, clock=clock)
+
+
+def test_has_no_total_until_counted(sut: InMemoryUserCountCache) -> None:
+    sut.record_user_created(role=UserRole.USER, is_active=True)
+
+    assert sut.get_total() is None
+
+
+def test_expires_total_after_ttl(
+    sut: InMemoryUserCountCache,
+    clock: FakeClock,
+) -> None:
+    sut.store({(UserRole.USER, True): 3, (UserRole.USER, False): 1})
+
+    clock.now = 29.9
+    assert sut.get_total() == 4
+    clock.now = 30
+    assert sut.get_total() is None
+
+
+def test_adjusts_totals_between_counts(sut: InMemoryUserCountCache) -> None:
+    sut.store({(UserRole.USER, True): 3, (UserRole.USER, False): 1})
+
+    sut.record_user_created(role=UserRole.USER, is_active=True)
+    sut.record_activation_changed(role=UserRole.USER, is_active=False)
+    sut.record_role_changed(
+        old_role=UserRole.USER,
+        new_role=UserRole.ADMIN,
+        is_active=False,
+    )
+
+    assert sut.get_total() == 5
+    assert sut.get_total(role=UserRole.USER) == 4
+    assert sut.get_total(is_active=False) == 2
+    assert sut.get_total(role=UserRole.ADMIN, is_active=False) == 1
+    assert sut.get_total(role=UserRole.ADMIN, is_active=True) == 0
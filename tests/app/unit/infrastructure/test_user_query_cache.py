@@ -0,0 +1,137 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from app.infrastructure.adapters.user_reader_cache import UserQueryCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRead:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.error: Exception | None = None
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> dict[str, Any]:
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return {"users": [{"id": self.calls}]}
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def sut(clock: FakeClock) -> UserQueryCache:
+    return UserQueryCache(ttl_s=5, max_entries=2, clock=clock)
+
+
+async def test_serves_repeated_query_from_cache(sut: UserQueryCache) -> None:
+    read = FakeRead()
+
+    first = await sut.get_or_read("q", 1, read)
+    second = await sut.get_or_read("q", 1, read)
+
+    assert first is second
+    assert read.calls == 1
+    assert sut.metrics["hits"] == 1
+    assert sut.metrics["misses"] == 1
+    assert sut.metrics["hit_ratio"] == 0.5
+    assert sut.metrics["approx_bytes"] > 0
+
+
+async def test_coalesces_concurrent_misses(sut: UserQueryCache) -> None:
+    read = FakeRead()
+    read.release.clear()
+
+    tasks = [asyncio.create_task(sut.get_or_read("q", 1, read)) for _ in range(3)]
+    await asyncio.sleep(0)
+    read.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert read.calls == 1
+    assert all(result is results[0] for result in results)
+    assert sut.metrics["coalesced"] == 2
+
+
+async def test_retries_read_of_cancelled_first_caller(sut: UserQueryCache) -> None:
+    read = FakeRead()
+    read.release.clear()
+    first = asyncio.create_task(sut.get_or_read("q", 1, read))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(sut.get_or_read("q", 1, read))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    read.release.set()
+
+    assert await follower == {"users": [{"id": 2}]}
+
+
+async def test_shares_error_without_keeping_it(sut: UserQueryCache) -> None:
+    read = FakeRead()
+    error = read.error = RuntimeError()
+    read.release.clear()
+    tasks = [asyncio.create_task(sut.get_or_read("q", 1, read)) for _ in range(2)]
+    await asyncio.sleep(0)
+    read.release.set()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    read.error = None
+
+    assert results == [error, error]
+    assert read.calls == 1
+    assert await sut.get_or_read("q", 1, read) == {"users": [{"id": 2}]}
+
+
+async def test_reads_again_after_ttl(
+    sut: UserQueryCache,
+    clock: FakeClock,
+) -> None:
+    read = FakeRead()
+    await sut.get_or_read("q", 1, read)
+
+    clock.now = 4.9
+    await sut.get_or_read("q", 1, read)
+    clock.now = 5
+    await sut.get_or_read("q", 1, read)
+
+    assert read.calls == 2
+
+
+async def test_drops_older_versions(sut: UserQueryCache) -> None:
+    read = FakeRead()
+    await sut.get_or_read("q", 1, read)
+
+    await sut.get_or_read("q", 2, read)
+
+    assert read.calls == 2
+    assert sut.metrics["entries"] == 1
+
+
+async def test_evicts_least_recently_used(sut: UserQueryCache) -> None:
+    read = FakeRead()
+    await sut.get_or_read("a", 1, read)
+    await sut.get_or_read("b", 1, read)
+    await sut.get_or_read("a", 1, read)
+
+    await sut.get_or_read("c", 1, read)
+    await sut.get_or_read("a", 1, read)
+    await sut.get_or_read("b", 1, read)
+
+    assert read.calls == 4
+    assert sut.metrics["entries"] == 2
@@ -0,0 +1,60 @@
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from app.application.common.exceptions.query import PaginationError
+from app.application.common.query_params.sorting import SortingOrder, SortingParams
+from app.domain.enums.user_role import UserRole
+from app.infrastructure.adapters.user_reader_cursor import UserListCursor
+from app.infrastructure.adapters.user_reader_sorting import resolve_sorting_columns
+
+USER_ID = UUID("01a151f7-ebc8-7f73-9202-e130da2640d2")
+
+
+@pytest.mark.parametrize(
+    ("fields", "values"),
+    [
+        pytest.param(("username",), ("alice",), id="str"),
+        pytest.param(("role",), (UserRole.ADMIN, "alice"), id="enum"),
+        pytest.param(("is_active",), (False, "alice"), id="bool"),
+        pytest.param(("id",), (USER_ID,), id="uuid"),
+    ],
+)
+def test_round_trips(fields: tuple[str, ...], values: tuple[Any, ...]) -> None:
+    sorting = SortingParams(fields=fields, order=SortingOrder.DESC)
+    sut = UserListCursor(sorting=sorting, values=values)
+
+    decoded = UserListCursor.decode(
+        sut.encode(), sorting, resolve_sorting_columns(sorting)
+    )
+
+    assert decoded == sut
+
+
+def test_rejects_cursor_of_other_sorting() -> None:
+    sorting = SortingParams(fields=("username",), order=SortingOrder.ASC)
+    cursor = UserListCursor(sorting=sorting, values=("alice",)).encode()
+    other_sorting = SortingParams(fields=("username",), order=SortingOrder.DESC)
+
+    with pytest.raises(PaginationError):
+        UserListCursor.decode(
+            cursor, other_sorting, resolve_sorting_columns(other_sorting)
+        )
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        pytest.param("garbage!", id="not_base64"),
+        pytest.param("e30", id="not_a_list"),
+        pytest.param("WyJ1c2VybmFtZSIsIkFTQyIsMSwiaWQiXQ", id="wrong_types"),
+        pytest.param("W1sidXNlcm5hbWUiXSwiQVNDIixbMV1d", id="wrong_value_type"),
+        pytest.param("W1sidXNlcm5hbWUiXSwiQVNDIixbXV0", id="missing_value"),
+    ],
+)
+def test_rejects_malformed_cursor(cursor: str) -> None:
+    sorting = SortingParams(fields=("username",), order=SortingOrder.ASC)
+
+    with pytest.raises(PaginationError):
+        UserListCursor.decode(cursor, sorting, resolve_sorting_columns(sorting))
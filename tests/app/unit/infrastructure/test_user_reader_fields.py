@@ -0,0 +1,66 @@
+from uuid import uuid4
+
+import pytest
+
+from app.application.common.exceptions.query import FieldSelectionError
+from app.application.common.query_params.field_selection import (
+    FieldSelectionParams,
+)
+from app.infrastructure.adapters.user_reader_fields import (
+    build_query_models,
+    resolve_selected_columns,
+)
+
+
+def test_selects_all_fields_without_selection() -> None:
+    assert [col.name for col in resolve_selected_columns(None)] == [
+        "id",
+        "username",
+        "role",
+        "is_active",
+    ]
+
+
+def test_selects_fields_in_requested_order() -> None:
+    selection = FieldSelectionParams(fields=("username", "id"))
+
+    assert [col.name for col in resolve_selected_columns(selection)] == [
+        "username",
+        "id",
+    ]
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        pytest.param(("password_hash",), id="unlisted"),
+        pytest.param(("id", "missing"), id="unknown"),
+    ],
+)
+def test_rejects_unlisted_fields(fields: tuple[str, ...]) -> None:
+    with pytest.raises(FieldSelectionError):
+        resolve_selected_columns(FieldSelectionParams(fields=fields))
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        pytest.param((), id="empty"),
+        pytest.param(("id", "id"), id="duplicate"),
+    ],
+)
+def test_rejects_invalid_selection_params(fields: tuple[str, ...]) -> None:
+    with pytest.raises(FieldSelectionError):
+        FieldSelectionParams(fields=fields)
+
+
+def test_builds_models_of_selected_fields_only() -> None:
+    user_id = uuid4()
+    selected_cols = resolve_selected_columns(
+        FieldSelectionParams(fields=("id", "username"))
+    )
+    rows = [(user_id, "alice", "cursor value")]
+
+    assert build_query_models(rows, selected_cols) == [
+        {"id_": user_id, "username": "alice"}
+    ]
@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy import select
+
+from app.application.common.exceptions.query import FilteringError
+from app.application.common.query_params.filtering import (
+    UserFilteringParams,
+    UsernameMatch,
+)
+from app.domain.enums.user_role import UserRole
+from app.infrastructure.adapters.user_reader_filtering import build_filter_conditions
+from app.infrastructure.persistence_sqla.mappings.user import users_table
+
+
+def compile_filters(filtering: UserFilteringParams) -> tuple[str, dict[str, object]]:
+    stmt = select(users_table.c.id).where(*build_filter_conditions(filtering))
+    compiled = stmt.compile()
+    return str(compiled).split("WHERE ", 1)[1], compiled.params
+
+
+@pytest.mark.parametrize(
+    ("filtering", "expected"),
+    [
+        pytest.param(
+            UserFilteringParams(username="user_1"),
+            r"user\_1%",
+            id="prefix",
+        ),
+        pytest.param(
+            UserFilteringParams(
+                username="50%",
+                username_match=UsernameMatch.SUBSTRING,
+            ),
+            r"%50\%%",
+            id="substring",
+        ),
+    ],
+)
+def test_inlines_escaped_username_pattern(
+    filtering: UserFilteringParams,
+    expected: str,
+) -> None:
+    where, params = compile_filters(filtering)
+
+    assert where == "users.username LIKE __[POSTCOMPILE_username_pattern]"
+    assert params == {"username_pattern": expected}
+
+
+def test_inlines_role_and_activation() -> None:
+    where, params = compile_filters(
+        UserFilteringParams(role=UserRole.ADMIN, is_active=False)
+    )
+
+    assert where == (
+        "users.role = __[POSTCOMPILE_role]"
+        " AND users.is_active = __[POSTCOMPILE_is_active]"
+    )
+    assert params == {"role": UserRole.ADMIN, "is_active": False}
+
+
+def test_adds_no_condition_without_filters() -> None:
+    assert build_filter_conditions(UserFilteringParams()) == []
+
+
+def test_rejects_substring_without_trigram() -> None:
+    with pytest.raises(FilteringError):
+        UserFilteringParams(username="ab", username_match=UsernameMatch.SUBSTRING)
@@ -0,0 +1,49 @@
+import pytest
+
+from app.application.common.exceptions.query import SortingError
+from app.application.common.query_params.sorting import SortingOrder, SortingParams
+from app.infrastructure.adapters.user_reader_sorting import resolve_sorting_columns
+
+
+@pytest.mark.parametrize(
+    ("fields", "expected"),
+    [
+        pytest.param(("username",), ["username"], id="unique"),
+        pytest.param(("role",), ["role", "username"], id="prefix"),
+        pytest.param(("is_active", "username"), ["is_active", "username"], id="full"),
+    ],
+)
+def test_extends_sorting_to_declared_one(
+    fields: tuple[str, ...],
+    expected: list[str],
+) -> None:
+    sorting = SortingParams(fields=fields, order=SortingOrder.ASC)
+
+    assert [col.name for col in resolve_sorting_columns(sorting)] == expected
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        pytest.param(("password_hash",), id="unindexed"),
+        pytest.param(("username", "role"), id="undeclared_combination"),
+        pytest.param(("missing",), id="unknown"),
+    ],
+)
+def test_rejects_undeclared_sorting(fields: tuple[str, ...]) -> None:
+    sorting = SortingParams(fields=fields, order=SortingOrder.ASC)
+
+    with pytest.raises(SortingError):
+        resolve_sorting_columns(sorting)
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        pytest.param((), id="empty"),
+        pytest.param(("role", "role"), id="duplicate"),
+    ],
+)
+def test_rejects_invalid_sorting_params(fields: tuple[str, ...]) -> None:
+    with pytest.raises(SortingError):
+        SortingParams(fields=fields, order=SortingOrder.ASC)
@@ -0,0 +1,196 @@
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+from app.infrastructure.adapters.username_bloom_filter import UsernameBloomFilter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class UsernameTable:
+    def __init__(self, *usernames: str) -> None:
+        self.usernames = list(usernames)
+        self.floors: list[UUID] = []
+
+    async def stream(self, user_id_floor: UUID) -> AsyncIterator[str]:
+        self.floors.append(user_id_floor)
+        await asyncio.sleep(0)
+        for username in list(self.usernames):
+            yield username
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def sut(clock: FakeClock) -> UsernameBloomFilter:
+    return UsernameBloomFilter(
+        enabled=True,
+        capacity=1000,
+        false_positive_rate=0.01,
+        refresh_interval_s=1.0,
+        clock=clock,
+        wall_clock=lambda: 1_000.0,
+    )
+
+
+async def test_answers_maybe_until_built(sut: UsernameBloomFilter) -> None:
+    table = UsernameTable()
+
+    assert await sut.might_contain("alice", table.stream)
+    assert not table.floors
+    assert not sut.metrics["ready"]
+
+
+async def test_answers_maybe_and_holds_nothing_if_disabled() -> None:
+    sut = UsernameBloomFilter(
+        enabled=False,
+        capacity=1000,
+        false_positive_rate=0.01,
+        refresh_interval_s=1.0,
+    )
+    table = UsernameTable()
+
+    sut.add("alice")
+
+    assert await sut.might_contain("mallory", table.stream)
+    assert table.floors == []
+    assert (sut.metrics["enabled"], sut.metrics["usernames_added"]) == (False, 0)
+
+
+async def test_finds_scanned_and_added_usernames(sut: UsernameBloomFilter) -> None:
+    table = UsernameTable("alice")
+    await sut.refresh(table.stream)
+    sut.add("bob")
+
+    assert await sut.might_contain("alice", table.stream)
+    assert await sut.might_contain("bob", table.stream)
+    assert len(table.floors) == 1
+
+
+async def test_reports_definite_miss_without_scan_when_fresh(
+    sut: UsernameBloomFilter,
+) -> None:
+    table = UsernameTable("alice")
+    await sut.refresh(table.stream)
+
+    assert not await sut.might_contain("mallory", table.stream)
+    assert len(table.floors) == 1
+    assert sut.metrics["skipped_usernames"] == 1
+
+
+async def test_catches_up_with_other_processes_when_stale(
+    sut: UsernameBloomFilter,
+    clock: FakeClock,
+) -> None:
+    table = UsernameTable("alice")
+    await sut.refresh(table.stream)
+    table.usernames.append("carol")
+    clock.now = 1.0
+
+    assert await sut.might_contain("carol", table.stream)
+    assert table.floors == [
+        UUID(int=0),
+        UUID(int=(1_000_000 - UsernameBloomFilter.CATCH_UP_LAG_MS) << 80),
+    ]
+
+
+async def test_shares_one_catch_up_between_concurrent_misses(
+    sut: UsernameBloomFilter,
+    clock: FakeClock,
+) -> None:
+    table = UsernameTable("alice")
+    await sut.refresh(table.stream)
+    clock.now = 5.0
+
+    results = await asyncio.gather(
+        *(sut.might_contain(f"mallory{i}", table.stream) for i in range(10))
+    )
+
+    assert not any(results)
+    assert len(table.floors) == 2
+
+
+async def test_reports_observed_false_positive_rate(sut: UsernameBloomFilter) -> None:
+    await sut.refresh(UsernameTable().stream)
+    await sut.might_contain("mallory", UsernameTable().stream)
+
+    sut.record_false_positive()
+
+    assert sut.metrics["false_positive_rate"] == 0.5
+
+
+async def test_restores_snapshot(sut: UsernameBloomFilter, tmp_path: Path) -> None:
+    path = str(tmp_path / "usernames.bin")
+    await sut.refresh(UsernameTable("alice").stream)
+    sut.save_snapshot(path)
+
+    restored = UsernameBloomFilter.from_snapshot(
+        path,
+        capacity=1000,
+        false_positive_rate=0.01,
+        refresh_interval_s=1.0,
+    )
+    table = UsernameTable()
+
+    assert await restored.might_contain("alice", table.stream)
+    assert not await restored.might_contain("mallory", table.stream)
+    assert table.floors == [
+        UUID(int=(1_000_000 - UsernameBloomFilter.CATCH_UP_LAG_MS) << 80)
+    ]
+
+
+async def test_keeps_snapshot_file_free_once_loaded(
+    sut: UsernameBloomFilter,
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "usernames.bin"
+    await sut.refresh(UsernameTable("alice").stream)
+    sut.save_snapshot(str(path))
+    restored = UsernameBloomFilter.from_snapshot(
+        str(path),
+        capacity=1000,
+        false_positive_rate=0.01,
+        refresh_interval_s=1.0,
+    )
+
+    with path.open("r+b") as file:
+        file.write(bytes(path.stat().st_size))
+    restored.save_snapshot(str(path))
+
+    assert await restored.might_contain("alice", UsernameTable().stream)
+    assert UsernameBloomFilter.from_snapshot(
+        str(path),
+        capacity=1000,
+        false_positive_rate=0.01,
+        refresh_interval_s=1.0,
+    ).metrics["ready"]
+
+
+async def test_ignores_incompatible_snapshot(
+    sut: UsernameBloomFilter,
+    tmp_path: Path,
+) -> None:
+    path = str(tmp_path / "usernames.bin")
+    await sut.refresh(UsernameTable("alice").stream)
+    sut.save_snapshot(path)
+
+    restored = UsernameBloomFilter.from_snapshot(
+        path,
+        capacity=10_000,
+        false_positive_rate=0.01,
+        refresh_interval_s=1.0,
+    )
+
+    assert not restored.metrics["ready"]
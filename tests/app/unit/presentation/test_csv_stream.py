@@ -0,0 +1,80 @@
+import csv
+import uuid
+from collections.abc import AsyncIterator
+
+import pytest
+
+from app.application.common.ports.user_query_gateway import UserQueryModel
+from app.domain.enums.user_role import UserRole
+from app.infrastructure.exceptions.gateway import ReaderError
+from app.presentation.http.controllers.users.export_users import (
+    CSV_FIELDS,
+    ExportFormat,
+    encode_csv,
+    negotiate_format,
+)
+
+
+async def produce_users(  # noqa: RUF029
+    count: int,
+    fail_at: int | None = None,
+) -> AsyncIterator[UserQueryModel]:
+    for i in range(count):
+        if i == fail_at:
+            raise ReaderError("Database query failed.")
+        yield UserQueryModel(
+            id_=uuid.UUID(int=i),
+            username=f"user_{i:04}",
+            role=UserRole.USER,
+            is_active=i % 2 == 0,
+        )
+
+
+async def test_encodes_header_then_one_row_per_user_in_chunks() -> None:
+    chunks = [
+        chunk
+        async for chunk in encode_csv(produce_users(100), CSV_FIELDS, chunk_size=256)
+    ]
+
+    assert len(chunks) > 1
+    rows = list(csv.reader(b"".join(chunks).decode().splitlines()))
+    assert rows[0] == ["id_", "username", "role", "is_active"]
+    assert rows[1] == [str(uuid.UUID(int=0)), "user_0000", "user", "true"]
+    assert len(rows) == 101
+
+
+async def test_fails_stream_instead_of_ending_it_early() -> None:
+    with pytest.raises(ReaderError):
+        _ = [
+            chunk
+            async for chunk in encode_csv(
+                produce_users(100, fail_at=50),
+                CSV_FIELDS,
+                chunk_size=256,
+            )
+        ]
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        pytest.param(None, ExportFormat.NDJSON, id="none"),
+        pytest.param("*/*", ExportFormat.NDJSON, id="any"),
+        pytest.param("text/csv", ExportFormat.CSV, id="csv"),
+        pytest.param("Text/CSV; charset=utf-8", ExportFormat.CSV, id="csv-params"),
+        pytest.param(
+            "application/x-ndjson, text/csv",
+            ExportFormat.NDJSON,
+            id="first-on-tie",
+        ),
+        pytest.param(
+            "application/x-ndjson;q=0.5, text/csv;q=0.9",
+            ExportFormat.CSV,
+            id="by-quality",
+        ),
+        pytest.param("text/csv;q=0", ExportFormat.NDJSON, id="csv-refused"),
+        pytest.param("application/json", ExportFormat.NDJSON, id="unsupported"),
+    ],
+)
+def test_negotiates_format(accept: str | None, expected: ExportFormat) -> None:
+    assert negotiate_format(accept) == expected
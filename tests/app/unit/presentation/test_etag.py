@@ -0,0 +1,33 @@
+import pytest
+
+from app.presentation.http.conditional.etag import make_weak_etag, read_etag_version
+
+
+def test_reads_version_of_own_tag() -> None:
+    etag = make_weak_etag(42, "query")
+
+    assert etag.startswith('W/"42-')
+    assert read_etag_version(etag, "query") == 42
+
+
+def test_reads_first_tag_of_query_in_list() -> None:
+    if_none_match = ", ".join([
+        make_weak_etag(1, "other query"),
+        make_weak_etag(2, "query"),
+        make_weak_etag(3, "query"),
+    ])
+
+    assert read_etag_version(if_none_match, "query") == 2
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [
+        pytest.param(None, id="missing"),
+        pytest.param("*", id="any"),
+        pytest.param(make_weak_etag(1, "other query"), id="other_query"),
+        pytest.param('W/"x-0011223344556677"', id="malformed"),
+    ],
+)
+def test_finds_no_version_without_own_tag(if_none_match: str | None) -> None:
+    assert read_etag_version(if_none_match, "query") is None
@@ -0,0 +1,178 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import Message
+
+from app.presentation.http.idempotency.exceptions import IdempotencyKeyReusedError
+from app.presentation.http.idempotency.store import IdempotencyStore
+
+
+def create_request(
+    body: bytes = b"{}",
+    path: str = "/signup",
+    client: tuple[str, int] | None = ("10.0.0.1", 50000),
+    cookie: bytes | None = None,
+) -> Request:
+    async def receive() -> Message:  # noqa: RUF029
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": path,
+        "headers": [] if cookie is None else [(b"cookie", cookie)],
+        "query_string": b"",
+        "client": client,
+    }
+    return Request(scope, receive)
+
+
+@pytest.mark.asyncio
+async def test_runs_operation_without_key() -> None:
+    sut = IdempotencyStore(ttl_s=60, max_keys=10)
+    operation = AsyncMock(return_value="result")
+
+    await sut.execute(create_request(), Response(), None, operation)
+    await sut.execute(create_request(), Response(), None, operation)
+
+    assert operation.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_replays_first_result() -> None:
+    sut = IdempotencyStore(ttl_s=60, max_keys=10)
+    operation = AsyncMock(side_effect=["first", "second"])
+    response = Response()
+
+    await sut.execute(create_request(), Response(), "key", operation)
+    result = await sut.execute(create_request(), response, "key", operation)
+
+    assert result == "first"
+    assert operation.await_count == 1
+    assert response.headers["Idempotent-Replayed"] == "true"
+
+
+@pytest.mark.asyncio
+async def test_scopes_key_to_path() -> None:
+    sut = IdempotencyStore(ttl_s=60, max_keys=10)
+    operation = AsyncMock(side_effect=["first", "second"])
+
+    await sut.execute(create_request(path="/a"), Response(), "key", operation)
+    result = await sut.execute(create_request(path="/b"), Response(), "key", operation)
+
+    assert result == "second"
+
+
+@pytest.mark.asyncio
+async def test_scopes_anonymous_key_to_client_address() -> None:
+    sut = IdempotencyStore(ttl_s=60, max_keys=10)
+    operation = AsyncMock(side_effect=["first", "second"])
+
+    await sut.execute(create_request(), Response(), "key", operation)
+    result = await sut.execute(
+        create_request(client=("10.0.0.2", 50000)),
+        Response(),
+        "key",
+        operation,
+    )
+
+    assert result == "second"
+
+
+@pytest.mark.asyncio
+async def test_scopes_authenticated_key_to_access_token() -> None:
+    sut = IdempotencyStore(ttl_s=60, max_keys=10)
+    operation = AsyncMock(side_effect=["first", "second"])
+    alice = b"access_token=alice"
+
+    await sut.execute(create_request(cookie=alice), Response(), "key", operation)
+    moved = await sut.execute(
+        create_request(client=("10.0.0.2", 50000), cookie=alice),
+        Response(),
+        "key",
+        operation,
+    )
+    other = await sut.execute(
+        create_request(cookie=b"access_token=bob"),
+        Response(),
+        "key",
+        operation,
+    )
+
+    assert [moved, other] == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_does_not_replay_anonymous_request_without_address() -> None:
+    sut = IdempotencyStore(ttl_s=60, max_keys=10)
+    operation = AsyncMock(side_effect=["first", "second"])
+
+    await sut.execute(create_request(client=None), Response(), "key", operation)
+    result = await sut.execute(
+        create_request(client=None), Response(), "key", operation
+    )
+
+    assert result == "second"
+
+
+@pytest.mark.asyncio
+async def test_rejects_key_reused_with_different_body() -> None:
+    sut = IdempotencyStore(ttl_s=60, max_keys=10)
+    operation = AsyncMock(return_value="result")
+
+    await sut.execute(create_request(b'{"a": 1}'), Response(), "key", operation)
+
+    with pytest.raises(IdempotencyKeyReusedError):
+        await sut.execute(create_request(b'{"a": 2}'), Response(), "key", operation)
+
+
+@pytest.mark.asyncio
+async def test_in_flight_duplicate_waits_for_original() -> None:
+    sut = IdempotencyStore(ttl_s=60, max_keys=10)
+    release = asyncio.Event()
+    calls = 0
+
+    async def operation() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    original = asyncio.create_task(
+        sut.execute(create_request(), Response(), "key", operation)
+    )
+    duplicate = asyncio.create_task(
+        sut.execute(create_request(), Response(), "key", operation)
+    )
+    await asyncio.sleep(0)
+    release.set()
+
+    assert [await original, await duplicate] == [1, 1]
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_forgets_failed_request() -> None:
+    sut = IdempotencyStore(ttl_s=60, max_keys=10)
+    operation = AsyncMock(side_effect=[ValueError, "second"])
+
+    with pytest.raises(ValueError):
+        await sut.execute(create_request(), Response(), "key", operation)
+    result = await sut.execute(create_request(), Response(), "key", operation)
+
+    assert result == "second"
+
+
+@pytest.mark.asyncio
+async def test_evicts_oldest_key_over_capacity() -> None:
+    sut = IdempotencyStore(ttl_s=60, max_keys=1)
+    operation = AsyncMock(side_effect=["first", "second", "third"])
+
+    await sut.execute(create_request(), Response(), "key1", operation)
+    await sut.execute(create_request(), Response(), "key2", operation)
+    result = await sut.execute(create_request(), Response(), "key1", operation)
+
+    assert result == "third"
@@ -0,0 +1,49 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+import orjson
+import pytest
+
+from app.infrastructure.exceptions.gateway import ReaderError
+from app.presentation.http.controllers.users.export_users import encode_ndjson
+
+
+class ItemSource:
+    def __init__(self, count: int, fail_at: int | None = None) -> None:
+        self._count = count
+        self._fail_at = fail_at
+        self.produced = 0
+
+    async def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        for i in range(self._count):
+            if i == self._fail_at:
+                raise ReaderError("Database query failed.")
+            self.produced += 1
+            yield {"id": i, "name": f"user_{i:04}"}
+
+
+async def test_encodes_one_object_per_line_in_chunks() -> None:
+    source = ItemSource(100)
+
+    chunks = [chunk async for chunk in encode_ndjson(source, chunk_size=256)]
+
+    assert len(chunks) > 1
+    assert all(len(chunk) < 256 + 64 for chunk in chunks)
+    lines = b"".join(chunks).splitlines()
+    assert [orjson.loads(line)["id"] for line in lines] == list(range(100))
+
+
+async def test_reads_no_further_than_the_chunk_being_sent() -> None:
+    source = ItemSource(1000)
+    sut = encode_ndjson(source, chunk_size=256)
+
+    await anext(sut)
+
+    assert source.produced < 20
+
+
+async def test_fails_stream_instead_of_ending_it_early() -> None:
+    source = ItemSource(100, fail_at=50)
+
+    with pytest.raises(ReaderError):
+        _ = [chunk async for chunk in encode_ndjson(source, chunk_size=256)]